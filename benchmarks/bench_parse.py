@@ -0,0 +1,62 @@
+"""Per-page table parse time for each parser backend.
+
+    python benchmarks/bench_parse.py [--fixtures DIR | --cache-dir DIR] [--repeat N]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fixtures import load_fixtures  # noqa: E402
+from wnba_parsers import get_parser  # noqa: E402
+
+
+def time_parser(parser, pages, repeat):
+    per_page = []
+    for _ in range(repeat):
+        for html in pages:
+            start = time.perf_counter()
+            parser.parse_tables(html)
+            per_page.append(time.perf_counter() - start)
+    return per_page
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=None, help="directory of recorded *.html / *.html.gz pages")
+    parser.add_argument("--cache-dir", default=None, help="read recorded pages from a page cache")
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    pages = list(load_fixtures(args.fixtures, args.cache_dir, args.count).values())
+    size_kb = sum(len(html) for html in pages) / len(pages) / 1024
+    print(f"{len(pages)} pages, {size_kb:.0f} KB average")
+
+    reference = get_parser("bs4")
+    expected = [reference.parse_tables(html) for html in pages]
+    baseline = None
+    for name in ["bs4", "lxml", "selectolax"]:
+        try:
+            backend = get_parser(name)
+        except ImportError:
+            print(f"{name:>11}: not installed")
+            continue
+        for html, frames in zip(pages, expected):
+            got = backend.parse_tables(html)
+            if len(got) != len(frames) or not all(a.equals(b) for a, b in zip(got, frames)):
+                print(f"{name:>11}: output differs from bs4")
+                return 1
+        timings = time_parser(backend, pages, args.repeat)
+        mean = statistics.mean(timings) * 1000
+        baseline = baseline or mean
+        print(f"{name:>11}: {mean:8.2f} ms/page  (median {statistics.median(timings) * 1000:.2f}, "
+              f"{baseline / mean:.1f}x vs bs4)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+import glob
+import gzip
+import os
+import random
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+HEADERS = ["PLAYER", "MIN", "FGM-A", "FG%", "3PM-A", "3P%", "FTM-A", "FT%", "OREB", "DREB", "REB",
+           "AST", "STL", "BLK", "TO", "PF", "+/-", "PTS"]
+TEAMS = ["ATL", "CHI", "CON", "DAL", "GSV", "IND", "LVA", "LAS", "MIN", "NYL", "PHO", "SEA", "WAS"]
+
+
+def _player_row(rng, name):
+    if rng.random() < 0.15:
+        return [name, "DNP - Coach's Decision"] + [""] * (len(HEADERS) - 2)
+    fga, tpa, fta = rng.randint(0, 22), rng.randint(0, 9), rng.randint(0, 10)
+    fgm, tpm, ftm = rng.randint(0, fga), rng.randint(0, tpa), rng.randint(0, fta)
+    tpm = min(tpm, fgm)
+    oreb, dreb = rng.randint(0, 5), rng.randint(0, 10)
+    pct = lambda made, att: f"{100 * made / att:.1f}" if att else "0.0"
+    return [
+        name, f"{rng.randint(1, 40)}:{rng.randint(0, 59):02d}",
+        f"{fgm}-{fga}", pct(fgm, fga), f"{tpm}-{tpa}", pct(tpm, tpa), f"{ftm}-{fta}", pct(ftm, fta),
+        str(oreb), str(dreb), str(oreb + dreb), str(rng.randint(0, 10)), str(rng.randint(0, 4)),
+        str(rng.randint(0, 4)), str(rng.randint(0, 6)), str(rng.randint(0, 5)), f"{rng.randint(-25, 25):+d}",
+        str(2 * (fgm - tpm) + 3 * tpm + ftm),
+    ]
+
+
+def _table(rng, team):
+    head = "".join(f'<th class="text-center"><span>{h}</span></th>' for h in HEADERS)
+    rows = []
+    for i in range(rng.randint(10, 13)):
+        name = f"{team} Player {i + 1}"
+        cells = _player_row(rng, name)
+        first = f'<td class="sticky"><a href="/player/{team.lower()}-{i}"><span>{cells[0]}</span></a></td>'
+        rest = "".join(f"<td>{value}</td>" for value in cells[1:])
+        rows.append(f"<tr>{first}{rest}</tr>")
+    return f'<table class="boxscore"><thead><tr>{head}</tr></thead><tbody>{"".join(rows)}</tbody></table>'
+
+
+def synthetic_page(seed=0, noise_kb=400):
+    # Shaped like a rendered wnba.com boxscore page: a large head full of
+    # scripts and markup around two boxscore tables.
+    rng = random.Random(seed)
+    home, away = rng.sample(TEAMS, 2)
+    script = "<script>window.__chunk_%d=function(a){return a*%d};" + "var x=1;" * 120 + "</script>"
+    noise = "".join(script % (i, i) for i in range(noise_kb * 1024 // 1100 + 1))
+    nav = "".join(f'<li><a href="/team/{t.lower()}"><img src="/logos/{t}.svg" alt="{t}"></a></li>' for t in TEAMS)
+    status = '<script id="__NEXT_DATA__" type="application/json">{"props":{"gameStatus":3}}</script>'
+    return (
+        f"<!DOCTYPE html><html><head><title>{home} vs {away}</title>{noise}</head><body>"
+        f"<nav><ul>{nav}</ul></nav><main><div class=\"status\">Final</div>"
+        f"{_table(rng, home)}<div class=\"ad\"></div>{_table(rng, away)}</main>{status}</body></html>"
+    )
+
+
+def load_fixtures(path=None, cache_dir=None, count=20):
+    """Recorded pages from a fixture directory or a PageCache, else synthetic ones."""
+    pages = {}
+    for name in sorted(glob.glob(os.path.join(path or FIXTURE_DIR, "*.html*"))):
+        opener = gzip.open if name.endswith(".gz") else open
+        with opener(name, "rt", encoding="utf-8") as f:
+            pages[os.path.basename(name)] = f.read()
+    if cache_dir:
+        from wnba_cache import PageCache
+
+        cache = PageCache(cache_dir)
+        for entry in cache.entries()[:count]:
+            pages[entry["url"]] = cache.read_blob(entry["digest"])
+    if not pages:
+        pages = {f"synthetic-{seed}": synthetic_page(seed) for seed in range(count)}
+    return pages
+
+
+def record_fixtures(cache_dir, path=None, count=20):
+    """Copy pages from a PageCache into the fixture directory as .html.gz."""
+    from wnba_cache import PageCache
+
+    path = path or FIXTURE_DIR
+    os.makedirs(path, exist_ok=True)
+    cache = PageCache(cache_dir)
+    written = []
+    for entry in cache.entries()[:count]:
+        name = os.path.join(path, f"{entry['game_id'] or entry['digest'][:12]}.html.gz")
+        with gzip.open(name, "wt", encoding="utf-8") as f:
+            f.write(cache.read_blob(entry["digest"]))
+        written.append(name)
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Record cached boxscore pages as benchmark fixtures.")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--out", default=FIXTURE_DIR)
+    parser.add_argument("--count", type=int, default=20)
+    args = parser.parse_args()
+    for name in record_fixtures(args.cache_dir, args.out, args.count):
+        print(name)
@@ -0,0 +1,68 @@
+"""A local stand-in for wnba.com that serves recorded boxscore pages.
+
+Any /game/<id>/<slug>/boxscore URL gets a fixture page, chosen by game ID,
+so batch scrapes run offline against a real HTTP server.
+"""
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BOXSCORE_PATH_RE = re.compile(r"^/game/(\d+)/[^/]+/boxscore/?$")
+
+
+class FixtureServer:
+    def __init__(self, pages, delay=0.0):
+        self.pages = [page.encode("utf-8") for page in pages]
+        self.delay = delay
+        self.requests = 0
+        self.bytes_sent = 0
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                match = BOXSCORE_PATH_RE.match(self.path)
+                if not match:
+                    self.send_error(404)
+                    return
+                if server.delay:
+                    threading.Event().wait(server.delay)
+                body = server.pages[int(match.group(1)) % len(server.pages)]
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                server.requests += 1
+                server.bytes_sent += len(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,434 @@
+"""Offline benchmark suite with a stored baseline and regression gates.
+
+    python benchmarks/suite.py [--only PATTERN] [--out results.json]
+    python benchmarks/suite.py --save-baseline
+    python benchmarks/suite.py --max-regression 0.25 --threshold e2e.batch_100=0.5
+
+Runs against recorded fixture pages (benchmarks/fixtures, filled from a page
+cache with ``python -m benchmarks.fixtures --cache-dir DIR``; synthetic pages
+otherwise) served by a local stand-in HTTP server. The baseline is only
+meaningful on the machine and fixtures it was recorded with. Benchmarks are
+compared on their fastest run, which scheduler and cache noise can only make
+slower, relative to a fixed calibration workload timed alongside each one, so
+a machine that is busier or slower overall than when the baseline was taken
+doesn't read as a regression. One that looks slower than its threshold allows
+is run again (see ``--confirm``) and only reported if it stays slow. Exits 1
+on any regression.
+"""
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+import wnba_boxscore as core  # noqa: E402
+from benchmarks.fixtures import load_fixtures  # noqa: E402
+from benchmarks.server import FixtureServer  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+BENCHMARKS = {}
+
+
+def benchmark(name, repeat=20):
+    """Register a setup function; it returns the callable to time."""
+    def register(setup):
+        BENCHMARKS[name] = (setup, repeat)
+        return setup
+    return register
+
+
+class Context:
+    def __init__(self, pages):
+        self.pages = pages
+        self.server = None
+        self.games = [
+            (str(1022500000 + i), "HOM", "AWY", "2025-06-01", "7:00 PM") for i in range(1, len(pages) + 1)
+        ]
+        self._raw = self._cleaned = None
+        self.cleanups = []
+
+    def raw_frames(self):
+        if self._raw is None:
+            self._raw = [core.parse_boxscore_html(page) for page in self.pages]
+        return self._raw
+
+    def cleaned(self):
+        if self._cleaned is None:
+            self._cleaned = [
+                core.clean_boxscores(home.copy(), away.copy(), *game)
+                for (home, away), game in zip(self.raw_frames(), self.games)
+            ]
+        return self._cleaned
+
+    def game_frame(self):
+        return core.concat_boxscores(list(self.cleaned()[0]))
+
+    def season_frame(self, games=200):
+        # Fixture games repeated under new IDs and dates, like a season's worth.
+        frames = []
+        for i in range(games):
+            home, away = self.cleaned()[i % len(self.pages)]
+            for df in (home, away):
+                df = df.copy()
+                df["Game ID"] = str(1022500000 + i)
+                df["Game Date"] = str((pd.Timestamp("2025-05-16") + pd.Timedelta(days=i // 6)).date())
+                frames.append(df)
+        return core.concat_boxscores(frames)
+
+
+@benchmark("parse.parse_table_bs4")
+def bench_parse_table(ctx):
+    from bs4 import BeautifulSoup
+    from wnba_parsers import parse_table
+
+    tables = BeautifulSoup(ctx.pages[0], "html.parser").find_all("table")[:2]
+    return lambda: [parse_table(table) for table in tables]
+
+
+def _page_parser(name):
+    def setup(ctx):
+        from wnba_parsers import get_parser
+
+        parser = get_parser(name)
+        pages = ctx.pages
+        return lambda: [parser.parse_tables(page) for page in pages]
+    return setup
+
+
+for _name in ["bs4", "lxml", "selectolax"]:
+    benchmark(f"parse.page_{_name}", repeat=5)(_page_parser(_name))
+
+
+@benchmark("clean.split_reorder", repeat=50)
+def bench_split_reorder(ctx):
+    home, away = ctx.raw_frames()[0]
+
+    def run():
+        for df in (home, away):
+            core.reorder_shooting_columns(core.split_shooting_columns(df.copy()))
+    return run
+
+
+@benchmark("clean.clean_boxscores", repeat=50)
+def bench_clean(ctx):
+    (home, away), game = ctx.raw_frames()[0], ctx.games[0]
+    return lambda: core.clean_boxscores(home.copy(), away.copy(), *game)
+
+
+@benchmark("leaders.game", repeat=50)
+def bench_game_leaders(ctx):
+    from wnba_leaders import game_leaders
+
+    df = ctx.game_frame()
+    return lambda: game_leaders(df, keys=["Team", "Location"])
+
+
+@benchmark("leaders.season_build", repeat=5)
+def bench_season_board(ctx):
+    from wnba_leaders import Leaderboard
+
+    df = ctx.season_frame()
+    return lambda: Leaderboard(df)
+
+
+@benchmark("leaders.season_top10", repeat=200)
+def bench_season_top(ctx):
+    from wnba_leaders import Leaderboard
+
+    board = Leaderboard(ctx.season_frame())
+    return lambda: board.top("PTS", 10, start="2025-06-01", end="2025-07-15")
+
+
+@benchmark("gui.treeview_rows", repeat=50)
+def bench_treeview_rows(ctx):
+    from wnba_gui import frame_rows
+
+    df = ctx.game_frame()
+    return lambda: list(frame_rows(df))
+
+
+@benchmark("gui.treeview_populate", repeat=20)
+def bench_treeview_populate(ctx):
+    # Needs a display; skipped (returns None) on a headless box.
+    import tkinter as tk
+    from wnba_gui import TablePanel
+
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    ctx.cleanups.append(root.destroy)
+    panel = TablePanel(root)
+    home, away = ctx.cleaned()[0]
+
+    def run():
+        for df in (home, away):
+            panel.set_frame(df)
+        root.update_idletasks()
+    return run
+
+
+@benchmark("gui.graphs_render", repeat=20)
+def bench_graphs(ctx):
+    from wnba_charts import PointsChart, TeamStatChart
+
+    charts = [PointsChart(), TeamStatChart()]
+    games = ctx.cleaned()
+
+    def run():
+        for home, away in games[:2]:
+            for chart in charts:
+                chart.update(home, away)
+                chart.canvas.draw()
+    return run
+
+
+@benchmark("e2e.single_game", repeat=20)
+def bench_single_game(ctx):
+    from wnba_http import HttpFetcher
+
+    fetcher = HttpFetcher()
+    ctx.cleanups.append(fetcher.close)
+    game = ctx.games[0]
+    return lambda: core.get_cleaned_boxscores(*game, backend="http", fetcher=fetcher, base_url=ctx.server.base_url)
+
+
+@benchmark("e2e.batch_100", repeat=3)
+def bench_batch(ctx):
+    from wnba_batch import scrape_games
+
+    games = [(str(1022500100 + i), "HOM", "AWY", "2025-06-01", "7:00 PM") for i in range(100)]
+
+    def run():
+        result = scrape_games(games, workers=4, min_interval=0, retries=0, backend="http",
+                              base_url=ctx.server.base_url, progress=None)
+        if result.failures:
+            raise RuntimeError(f"{len(result.failures)} games failed: {next(iter(result.failures.values()))}")
+    return run
+
+
+def time_calls(fn, repeat, warmup=1):
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def calibration(repeat=5):
+    """Fastest of ``repeat`` runs of a fixed JSON, sorting and pandas workload, in ms."""
+    records = [{"PLAYER": f"Player {i}", "PTS": i % 40, "MIN": f"{i % 40}:{i % 60:02d}"} for i in range(2000)]
+    df = pd.DataFrame(records)
+
+    def run():
+        json.loads(json.dumps(records))
+        sorted(str(i) for i in range(20000))
+        df.groupby("PTS")["PLAYER"].count()
+    return round(min(time_calls(run, repeat)) * 1000, 4)
+
+
+def summarize(timings):
+    ms = [t * 1000 for t in timings]
+    return {
+        "median_ms": round(statistics.median(ms), 4),
+        "mean_ms": round(statistics.mean(ms), 4),
+        "min_ms": round(min(ms), 4),
+        "stdev_ms": round(statistics.stdev(ms), 4) if len(ms) > 1 else 0.0,
+        "runs": len(ms),
+    }
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(BASELINE_PATH)).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_suite(pages, only=None, repeat_scale=1.0, log=print):
+    ctx = Context(pages)
+    results = {}
+    with FixtureServer(pages) as server:
+        ctx.server = server
+        try:
+            for name, (setup, repeat) in BENCHMARKS.items():
+                if only and not any(fnmatch.fnmatch(name, pattern) for pattern in only):
+                    continue
+                try:
+                    fn = setup(ctx)
+                except ImportError as e:
+                    log(f"{name:28} skipped ({e.name} not installed)")
+                    continue
+                if fn is None:
+                    log(f"{name:28} skipped (not available here)")
+                    continue
+                results[name] = summarize(time_calls(fn, max(1, round(repeat * repeat_scale))))
+                results[name]["calibration_ms"] = calibration()
+                log(f"{name:28} {results[name]['median_ms']:10.3f} ms  (min {results[name]['min_ms']:.3f}, "
+                    f"{results[name]['runs']} runs)")
+        finally:
+            for cleanup in ctx.cleanups:
+                cleanup()
+    return {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pandas": pd.__version__,
+            "pages": len(pages),
+            "page_kb": round(sum(len(page) for page in pages) / len(pages) / 1024, 1),
+        },
+        "results": results,
+    }
+
+
+def _limit_for(name, limits, default):
+    if name in limits:
+        return limits[name]
+    for pattern, limit in limits.items():
+        if fnmatch.fnmatch(name, pattern):
+            return limit
+    return default
+
+
+def _relative(entry, statistic="min_ms"):
+    # A result in units of the calibration workload timed next to it.
+    return entry[statistic] / entry["calibration_ms"] if entry.get("calibration_ms") else entry[statistic]
+
+
+def compare(results, baseline, max_regression=0.25, thresholds=None, statistic="min_ms"):
+    """Per-benchmark ratio of current to baseline ``statistic``, and the regressions.
+
+    The ratio is taken relative to each side's calibration time when both
+    have one. Thresholds (exact names or globs like "e2e.*") come from the baseline
+    file's "thresholds", overridden by ``thresholds``; anything unlisted
+    uses ``max_regression``.
+    """
+    limits = dict(baseline.get("thresholds", {}), **(thresholds or {}))
+    rows, regressions = [], []
+    for name, current in results["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            rows.append((name, None, current[statistic], None, None))
+            continue
+        limit = _limit_for(name, limits, max_regression)
+        if not (before.get("calibration_ms") and current.get("calibration_ms")):
+            before, current = dict(before, calibration_ms=None), dict(current, calibration_ms=None)
+        ratio = _relative(current, statistic) / _relative(before, statistic) if before[statistic] else 1.0
+        rows.append((name, before[statistic], current[statistic], ratio, limit))
+        if ratio > 1 + limit:
+            regressions.append(name)
+    return rows, regressions
+
+
+def keep_fastest(results, rerun):
+    # A confirming run replaces a benchmark's numbers only if it was faster.
+    for name, current in rerun["results"].items():
+        before = results["results"].get(name)
+        if before is None or _relative(current) < _relative(before):
+            results["results"][name] = current
+    return results
+
+
+def format_comparison(rows, regressions):
+    lines = [f"{'fastest run (ms)':28} {'baseline':>10} {'current':>10} {'change':>8}"]
+    for name, before, current, ratio, limit in rows:
+        if before is None:
+            lines.append(f"{name:28} {'-':>10} {current:10.3f} {'new':>8}")
+            continue
+        flag = "  REGRESSION" if name in regressions else ""
+        lines.append(f"{name:28} {before:10.3f} {current:10.3f} {(ratio - 1) * 100:+7.1f}%"
+                     f"  (limit +{limit * 100:.0f}%){flag}")
+    lines.append("change is relative to the calibration workload timed with each benchmark")
+    return "\n".join(lines)
+
+
+def _threshold(text):
+    name, _, value = text.partition("=")
+    if not value:
+        raise argparse.ArgumentTypeError("expected NAME=FRACTION, e.g. e2e.batch_100=0.5")
+    return name, float(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixtures", default=None, help="directory of recorded *.html / *.html.gz pages")
+    parser.add_argument("--cache-dir", default=None, help="read recorded pages from a page cache")
+    parser.add_argument("--count", type=int, default=20)
+    parser.add_argument("--only", action="append", help="glob of benchmark names to run (repeatable)")
+    parser.add_argument("--repeat-scale", type=float, default=1.0, help="multiply every benchmark's repeat count")
+    parser.add_argument("--out", default="bench_results.json", help="where to write this run's results")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--max-regression", type=float, default=0.25,
+                        help="allowed slowdown of the fastest run, as a fraction (default 0.25)")
+    parser.add_argument("--confirm", type=int, default=2,
+                        help="times to re-run a benchmark that looks regressed before reporting it (default 2)")
+    parser.add_argument("--threshold", type=_threshold, action="append", default=[],
+                        help="per-benchmark limit, NAME=FRACTION (repeatable)")
+    args = parser.parse_args(argv)
+
+    pages = list(load_fixtures(args.fixtures, args.cache_dir, args.count).values())
+    print(f"{len(pages)} pages, {sum(len(page) for page in pages) / len(pages) / 1024:.0f} KB average")
+    results = run_suite(pages, args.only, args.repeat_scale)
+
+    if args.save_baseline:
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"wrote {args.out}")
+        thresholds = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                thresholds = json.load(f).get("thresholds", {})
+        with open(args.baseline, "w") as f:
+            json.dump(dict(results, thresholds=thresholds), f, indent=2)
+        print(f"saved baseline {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        with open(args.out, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"wrote {args.out}")
+        print(f"no baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    before, now = baseline.get("meta", {}), results["meta"]
+    if (before.get("pages"), before.get("page_kb")) != (now["pages"], now["page_kb"]):
+        print(f"warning: baseline was run on {before.get('pages')} pages of {before.get('page_kb')} KB, "
+              f"this run on {now['pages']} pages of {now['page_kb']} KB")
+    rows, regressions = compare(results, baseline, args.max_regression, dict(args.threshold))
+    for _ in range(args.confirm):
+        if not regressions:
+            break
+        print(f"re-running {', '.join(regressions)} to confirm")
+        keep_fastest(results, run_suite(pages, regressions, args.repeat_scale))
+        rows, regressions = compare(results, baseline, args.max_regression, dict(args.threshold))
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"wrote {args.out}")
+    print(format_comparison(rows, regressions))
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,42 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+from benchmarks.fixtures import synthetic_page  # noqa: E402
+from benchmarks.server import FixtureServer  # noqa: E402
+from wnba_boxscore import clean_boxscores, parse_boxscore_html  # noqa: E402
+
+PAGES = [synthetic_page(seed, noise_kb=20) for seed in range(6)]
+
+
+def game_row(i):
+    return (f"10225{i:05d}", "LVA", "CHI", f"2025-06-{1 + i % 28:02d}", "7:00 PM")
+
+
+def game_frame(i, page=None):
+    """The cleaned rows of game ``i``, from the page the fixture server would serve for it."""
+    game_id, home, away, date, time = game_row(i)
+    home_df, away_df = parse_boxscore_html(PAGES[int(game_id) % len(PAGES)] if page is None else page)
+    return pd.concat(clean_boxscores(home_df, away_df, game_id, home, away, date, time), ignore_index=True)
+
+
+@pytest.fixture
+def fixture_server():
+    with FixtureServer(PAGES, delay=0.02) as server:
+        yield server
+
+
+@pytest.fixture
+def games_csv(tmp_path):
+    path = tmp_path / "games.csv"
+    with open(path, "w") as f:
+        f.write("game_id,home_abbr,away_abbr,game_date,game_time\n")
+        for i in range(1, 41):
+            f.write(",".join(game_row(i)) + "\n")
+    return str(path)
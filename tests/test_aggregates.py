@@ -0,0 +1,98 @@
+import os
+
+import pandas as pd
+import pytest
+
+from benchmarks.fixtures import synthetic_page
+from conftest import game_frame
+from wnba_aggregates import SeasonAggregates, compare, recompute, update_from_store
+from wnba_store import SeasonStore, season_of
+
+
+def frames(*games):
+    return pd.concat(games, ignore_index=True)
+
+
+def assert_matches(aggregates, df):
+    assert compare(aggregates.table(), recompute(df)) == 0.0
+
+
+@pytest.fixture
+def games():
+    return {i: game_frame(i) for i in range(1, 7)}
+
+
+def test_update_matches_recompute(games):
+    aggregates = SeasonAggregates()
+    for game in games.values():
+        aggregates.update(game)
+    assert len(aggregates) == len(games)
+    assert_matches(aggregates, frames(*games.values()))
+
+
+def test_replaced_game_is_subtracted_first(games):
+    aggregates = SeasonAggregates()
+    for game in games.values():
+        aggregates.update(game)
+    # Same game, re-scraped with different numbers.
+    games[3] = game_frame(3, synthetic_page(99, noise_kb=20))
+    aggregates.update(games[3])
+    assert len(aggregates) == len(games)
+    assert_matches(aggregates, frames(*games.values()))
+
+
+def test_removed_game_is_taken_out(games):
+    aggregates = SeasonAggregates()
+    for game in games.values():
+        aggregates.update(game)
+    aggregates.remove_game(games.pop(2)["Game ID"].iloc[0])
+    assert_matches(aggregates, frames(*games.values()))
+    # Players whose only game that was are gone entirely.
+    assert set(aggregates.table().index) == set(recompute(frames(*games.values())).index)
+
+
+def test_missing_stat_column_counts_as_zero(games):
+    games[4] = games[4].drop(columns="PF")
+    aggregates = SeasonAggregates()
+    for game in games.values():
+        aggregates.update(game)
+    assert_matches(aggregates, frames(*games.values()))
+    # And replacing it with a page that has the column again.
+    games[4] = game_frame(4)
+    aggregates.update(games[4])
+    assert_matches(aggregates, frames(*games.values()))
+
+
+def test_save_and_load_round_trip(tmp_path, games):
+    aggregates = SeasonAggregates()
+    aggregates.update(frames(*games.values()), {"1022500001": "v1"})
+    path = str(tmp_path / "season.parquet")
+    aggregates.save(path)
+    loaded = SeasonAggregates.load(path)
+    assert loaded.versions["1022500001"] == "v1"
+    assert compare(loaded.table(), aggregates.table()) == 0.0
+
+
+def test_update_from_store_follows_rewrites_and_deletes(tmp_path, games):
+    store = SeasonStore(str(tmp_path / "store"))
+    for game in games.values():
+        store.write_game(game)
+    season = season_of(games[1]["Game ID"].iloc[0], games[1]["Game Date"].iloc[0])
+
+    aggregates, read = update_from_store(store, season)
+    assert read == len(games)
+    assert_matches(aggregates, store.read(season=season))
+    aggregates.save(os.path.join(store.root, "_aggregates", f"season-{season}.parquet"))
+
+    # Nothing changed: nothing is read again, even from the saved log.
+    aggregates, read = update_from_store(store, season)
+    assert read == 0
+
+    # Rewritten behind the aggregates' back, and one deleted.
+    games[5] = game_frame(5, synthetic_page(42, noise_kb=20))
+    store.write_game(games[5])
+    store.delete_game(games.pop(6)["Game ID"].iloc[0])
+    aggregates, read = update_from_store(store, season, aggregates)
+    assert read == 1
+    assert_matches(aggregates, store.read(season=season))
+    assert_matches(aggregates, frames(*games.values()))
@@ -0,0 +1,37 @@
+from benchmarks.suite import compare, keep_fastest
+
+
+def entry(min_ms, calibration_ms=None, median_ms=None):
+    return {"min_ms": min_ms, "median_ms": median_ms or min_ms * 2, "calibration_ms": calibration_ms}
+
+
+def test_compares_fastest_runs_not_medians():
+    baseline = {"results": {"a": entry(10.0, median_ms=10.0)}}
+    results = {"results": {"a": entry(11.0, median_ms=30.0)}}
+    rows, regressions = compare(results, baseline, 0.25)
+    assert regressions == [] and abs(rows[0][3] - 1.1) < 1e-9
+
+
+def test_machine_wide_slowdown_is_calibrated_out():
+    baseline = {"results": {"a": entry(10.0, 5.0)}}
+    slower_machine = {"results": {"a": entry(20.0, 10.0)}}
+    assert compare(slower_machine, baseline, 0.25)[1] == []
+    slower_code = {"results": {"a": entry(20.0, 5.0)}}
+    assert compare(slower_code, baseline, 0.25)[1] == ["a"]
+
+
+def test_uncalibrated_baseline_compares_raw_times():
+    baseline = {"results": {"a": entry(10.0)}}
+    assert compare({"results": {"a": entry(20.0, 10.0)}}, baseline, 0.25)[1] == ["a"]
+
+
+def test_thresholds_by_glob():
+    baseline = {"results": {"e2e.x": entry(10.0, 5.0)}, "thresholds": {"e2e.*": 0.5}}
+    assert compare({"results": {"e2e.x": entry(14.0, 5.0)}}, baseline, 0.25)[1] == []
+
+
+def test_confirming_run_keeps_the_faster_result():
+    results = {"results": {"a": entry(20.0, 5.0), "b": entry(3.0, 5.0)}}
+    keep_fastest(results, {"results": {"a": entry(11.0, 5.0), "b": entry(4.0, 5.0)}})
+    assert results["results"]["a"]["min_ms"] == 11.0
+    assert results["results"]["b"]["min_ms"] == 3.0
@@ -0,0 +1,34 @@
+import pandas as pd
+
+import wnba_leaders
+from conftest import game_frame
+from wnba_leaders import Leaderboard, Leaderboards
+from wnba_store import SeasonStore
+
+
+def test_query_season():
+    assert Leaderboards.query_season(2024) == 2024
+    assert Leaderboards.query_season(None, "2025-06-01", "2025-06-30") == 2025
+    assert Leaderboards.query_season(None, "2024-09-01", "2025-06-30") is None
+    assert Leaderboards.query_season(None, "2025-06-01") is None
+
+
+def test_main_builds_only_the_board_the_query_needs(tmp_path, monkeypatch, capsys):
+    store = SeasonStore(str(tmp_path / "store"))
+    for i in range(1, 5):
+        store.write_game(game_frame(i))
+    built = []
+
+    class Counted(Leaderboard):
+        def __init__(self, df, *args):
+            built.append(len(df))
+            super().__init__(df, *args)
+
+    monkeypatch.setattr(wnba_leaders, "Leaderboard", Counted)
+    assert wnba_leaders.main(["PTS", "--store", store.root, "--start", "2025-06-01", "--end", "2025-06-30"]) == 0
+    assert len(built) == 1
+    top = capsys.readouterr().out
+
+    expected = Leaderboard(pd.concat([game_frame(i) for i in range(1, 5)], ignore_index=True).assign(
+        Date=lambda df: pd.to_datetime(df["Game Date"])))
+    assert expected.top("PTS", 10, "2025-06-01", "2025-06-30")["PLAYER"].iloc[0] in top
@@ -0,0 +1,64 @@
+import json
+
+from benchmarks.fixtures import synthetic_page
+from wnba_live import HttpSource, game_phase
+
+BOXSCORE = synthetic_page(1, noise_kb=1)
+# Another game's result, as a scores strip above the boxscore shows it.
+TICKER = ('<ul class="scores-ticker"><li><span>NYL 88 - 80 SEA</span><span class="status">Final</span></li></ul>'
+          '<script type="application/json">{"games": [{"gameId": "1022500099", "gameStatus": 3, '
+          '"gameStatusText": "Final", "homeTeam": {"teamTricode": "NYL"}, "awayTeam": {"teamTricode": "SEA"}}]}'
+          '</script>')
+
+
+def game_payload(status, text):
+    team = {"teamTricode": "LVA", "players": []}
+    return (f'<script id="__NEXT_DATA__" type="application/json">'
+            f'{json.dumps({"props": {"game": {"gameStatus": status, "gameStatusText": text, "homeTeam": team, "awayTeam": team}}})}'
+            f'</script>')
+
+
+class Pages:
+    def __init__(self, page):
+        self.page = page
+
+    def fetch(self, url):
+        return self.page
+
+
+def phase(page):
+    frames, phase, size = HttpSource("http://test/game/1/boxscore", Pages(page)).read()
+    assert len(frames[0]) and len(frames[1])
+    return phase
+
+
+def test_ticker_final_does_not_end_a_live_game():
+    page = BOXSCORE.replace("<main>", "<main>" + TICKER).replace(
+        '<script id="__NEXT_DATA__" type="application/json">{"props":{"gameStatus":3}}</script>',
+        game_payload(2, "Q3 5:42"))
+    assert phase(page) == "live"
+
+
+def test_game_header_clock_wins_over_the_payload():
+    page = BOXSCORE.replace("<main>", '<main><div class="GameHeader_clock"><span>Halftime</span></div>' + TICKER)
+    page = page.replace('{"props":{"gameStatus":3}}', '{"x": 1}') + game_payload(2, "Q2 0:00")
+    assert phase(page) == "break"
+
+
+def test_game_payload_final():
+    page = BOXSCORE.replace('{"props":{"gameStatus":3}}', '{"x": 1}') + TICKER + game_payload(3, "Final")
+    assert phase(page) == "final"
+
+
+def test_status_code_without_a_game_payload():
+    # The fixture pages carry a bare status code and no player payload.
+    assert phase(BOXSCORE) == "final"
+    assert phase(BOXSCORE.replace('"gameStatus":3', '"gameStatus":1')) == "scheduled"
+
+
+def test_game_phase_texts():
+    assert game_phase(2, "Half") == "break"
+    assert game_phase(2, "End of 3rd Qtr") == "break"
+    assert game_phase(2, "OT1 2:11") == "live"
+    assert game_phase(1, "7:00 pm ET") == "scheduled"
+    assert game_phase(None, None) == "unknown"
@@ -0,0 +1,101 @@
+from datetime import date
+
+import pytest
+
+import wnba_batch
+import wnba_manifest
+from wnba_manifest import GameManifest, select_games
+
+TODAY = date(2025, 7, 1)
+
+
+def schedule(season=2025):
+    # Two played games and one still to come.
+    return [
+        {"game_id": f"10225{i:05d}", "season": season, "home_abbr": "LVA", "away_abbr": "CHI",
+         "slug": f"chi-vs-lva-{i}", "game_date": game_date, "game_time": "7:00 PM",
+         "status": "final" if game_date < TODAY.isoformat() else "scheduled"}
+        for i, game_date in enumerate(["2025-06-01", "2025-06-15", "2025-07-20"], 1)
+    ]
+
+
+@pytest.fixture
+def crawls(monkeypatch):
+    calls = []
+
+    def crawl(season, fetcher=None, url=None, base_url=None):
+        calls.append(season)
+        if crawl.error:
+            raise crawl.error
+        return "http://schedule", schedule(season)
+
+    crawl.error = None
+    crawl.calls = calls
+    monkeypatch.setattr(wnba_manifest, "crawl_schedule", crawl)
+    return crawl
+
+
+class Args:
+    def __init__(self, manifest, **picks):
+        self.manifest = manifest
+        self.games_csv = None
+        self.season = self.team = self.start = self.end = None
+        self.offline = False
+        self.base_url = None
+        self.__dict__.update(picks)
+
+
+def test_empty_manifest_is_refreshed_before_picking(tmp_path, crawls):
+    args = Args(str(tmp_path / "m.sqlite"), season=2025)
+    games, slugs, _, _ = select_games(args, today=TODAY)
+    assert crawls.calls == [2025]
+    # The game after today is left out.
+    assert [game[0] for game in games] == ["1022500001", "1022500002"]
+    assert slugs["1022500001"] == "chi-vs-lva-1"
+
+    # Crawled just now: not fetched again.
+    select_games(args, today=TODAY)
+    assert crawls.calls == [2025]
+
+
+def test_date_range_refreshes_the_seasons_it_spans(tmp_path, crawls):
+    args = Args(str(tmp_path / "m.sqlite"), start="2024-09-01", end="2025-06-30")
+    select_games(args, today=TODAY)
+    assert crawls.calls == [2024, 2025]
+
+
+def test_given_games_refresh_their_season(tmp_path, crawls):
+    args = Args(str(tmp_path / "m.sqlite"))
+    games, _, _, unknown = select_games(args, [("1022500002", "LVA", "CHI", "2025-06-15", "")], today=TODAY)
+    assert crawls.calls == [2025] and not unknown
+    assert games[0][4] == "7:00 PM"
+
+
+def test_offline_runs_never_crawl(tmp_path, crawls):
+    args = Args(str(tmp_path / "m.sqlite"), season=2025, offline=True)
+    games, _, _, _ = select_games(args, today=TODAY)
+    assert crawls.calls == [] and games == []
+
+
+def test_empty_pick_is_a_usage_error(tmp_path, crawls, capsys):
+    crawls.error = ValueError("No 2025 games found in the schedule.")
+    path = str(tmp_path / "m.sqlite")
+    with pytest.raises(SystemExit) as exit:
+        wnba_batch.main(["--manifest", path, "--season", "2025", "-o", str(tmp_path / "out.csv")])
+    assert exit.value.code == 2
+    err = capsys.readouterr().err
+    assert "could not refresh 2025" in err and "no games in the manifest" in err
+    assert not (tmp_path / "out.csv").exists()
+
+
+def test_stale_season_is_refreshed_again(tmp_path, crawls):
+    path = str(tmp_path / "m.sqlite")
+    select_games(Args(path, season=2025), today=TODAY)
+    # Games still pending and the crawl is old.
+    manifest = GameManifest(path)
+    manifest._db.execute("UPDATE games SET status = 'live' WHERE game_id = '1022500002'")
+    manifest._db.execute("UPDATE crawls SET crawled_at = crawled_at - 7 * 3600")
+    manifest._db.commit()
+    manifest.close()
+    select_games(Args(path, season=2025), today=TODAY)
+    assert crawls.calls == [2025, 2025]
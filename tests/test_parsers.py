@@ -0,0 +1,93 @@
+import json
+
+import pandas as pd
+import pytest
+
+from benchmarks.fixtures import HEADERS, synthetic_page
+import wnba_boxscore as core
+from wnba_boxscore import clean_boxscores, parse_boxscore_html
+from wnba_parsers import PARSERS, get_parser
+
+
+def backend(name):
+    try:
+        return get_parser(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+
+
+def table(rows):
+    head = "".join(f"<th>{header}</th>" for header in HEADERS)
+    return f"<table><thead><tr>{head}</tr></thead><tbody>{''.join(rows)}</tbody></table>"
+
+
+PLAYED = "<tr><td>A Player</td><td>31:02</td><td>7-14</td><td>50.0</td><td>1-3</td><td>33.3</td><td>2-2</td>" \
+         "<td>100.0</td><td>1</td><td>5</td><td>6</td><td>4</td><td>1</td><td>0</td><td>2</td><td>3</td>" \
+         "<td>+150</td><td>17</td></tr>"
+DNP = "<tr><td>B Player</td><td colspan=\"17\">DNP - Coach's Decision</td></tr>"
+SPACER = "<tr></tr>"
+
+
+@pytest.mark.parametrize("name", list(PARSERS))
+def test_colspan_dnp_row_matches_bs4(name):
+    page = table([PLAYED, DNP, SPACER]) + table([DNP, PLAYED])
+    expected = backend("bs4").parse_tables(page)
+    frames = backend(name).parse_tables(page)
+    assert len(frames) == 2
+    for frame, reference in zip(frames, expected):
+        pd.testing.assert_frame_equal(frame, reference)
+
+    home, away = clean_boxscores(*frames, "1022500001", "LVA", "CHI", "2025-06-01", "7:00 PM")
+    assert home["PTS"].iloc[0] == 17 and home["+/-"].iloc[0] == 150
+    assert home.loc[1, ["MIN", "PTS", "+/-"]].isna().all()
+
+
+@pytest.mark.parametrize("name", list(PARSERS))
+def test_synthetic_pages_match_bs4(name):
+    for seed in range(3):
+        page = synthetic_page(seed, noise_kb=20)
+        for frame, reference in zip(backend(name).parse_tables(page), backend("bs4").parse_tables(page)):
+            pd.testing.assert_frame_equal(frame, reference)
+
+
+@pytest.mark.parametrize("name", list(PARSERS))
+def test_long_row_is_an_error(name):
+    long_row = PLAYED.replace("</tr>", "<td>extra</td></tr>")
+    with pytest.raises(ValueError):
+        backend(name).parse_tables(table([long_row]) + table([PLAYED]))
+
+
+SKELETON = table([]) + table(["<tr></tr>"])
+
+
+def test_skeleton_tables_are_not_a_boxscore():
+    with pytest.raises(ValueError, match="no rows"):
+        parse_boxscore_html(SKELETON)
+    home, away = parse_boxscore_html(SKELETON, allow_empty=True)
+    assert len(home) == len(away) == 0
+
+
+def test_skeleton_tables_fall_back_to_embedded_json():
+    payload = {"props": {"game": {
+        "homeTeam": {"players": [{"name": "A Player", "played": "1", "statistics": {"points": 17}}]},
+        "awayTeam": {"players": [{"name": "B Player", "played": "0", "notPlayingReason": "DNP"}]},
+    }}}
+    page = SKELETON + f'<script id="__NEXT_DATA__" type="application/json">{json.dumps(payload)}</script>'
+    home, away = parse_boxscore_html(page)
+    assert home["PLAYER"].tolist() == ["A Player"] and away["PLAYER"].tolist() == ["B Player"]
+
+
+def test_auto_fetch_goes_to_the_browser_for_a_skeleton(monkeypatch):
+    class Fetcher:
+        def fetch(self, url):
+            return SKELETON
+
+    full = synthetic_page(1, noise_kb=1)
+    monkeypatch.setattr(core, "fetch_with_browser", lambda url, *args: (full, {}))
+    home, away = core.get_cleaned_boxscores("1022500001", "LVA", "CHI", "2025-06-01", "7:00 PM",
+                                            fetcher=Fetcher())
+    assert len(home) and len(away)
+    assert core.fetch_log["1022500001"]["source"] == "selenium"
+    with pytest.raises(ValueError):
+        core.get_cleaned_boxscores("1022500001", "LVA", "CHI", "2025-06-01", "7:00 PM",
+                                   backend="http", fetcher=Fetcher())
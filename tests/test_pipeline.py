@@ -0,0 +1,116 @@
+import json
+import os
+import subprocess
+import sys
+import time
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+import wnba_pipeline
+from conftest import ROOT, game_frame, game_row
+
+GAME_IDS = [game_row(i)[0] for i in range(1, 41)]
+
+
+def checkpoint_lines(path):
+    if not os.path.exists(path):
+        return 0
+    with open(path) as f:
+        return sum(1 for line in f if line.endswith("\n"))
+
+
+def run_and_kill(args, checkpoint, lines=2, timeout=60):
+    """Run the pipeline in a child process and SIGKILL it once ``lines`` checkpoints are durable."""
+    proc = subprocess.Popen([sys.executable, "-m", "wnba_pipeline"] + args, cwd=ROOT,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + timeout
+    try:
+        while checkpoint_lines(checkpoint) < lines:
+            assert proc.poll() is None, "pipeline finished before it could be killed"
+            assert time.monotonic() < deadline, "pipeline never checkpointed"
+            time.sleep(0.02)
+    finally:
+        proc.kill()
+        proc.wait()
+
+
+def expected_rows():
+    return {game_id: len(game_frame(i)) for i, game_id in enumerate(GAME_IDS, 1)}
+
+
+def assert_every_game_once(df):
+    counts = df["Game ID"].astype(str).value_counts().to_dict()
+    assert counts == expected_rows()
+
+
+def test_csv_resume_after_kill_truncates_to_checkpoint(tmp_path, fixture_server, games_csv):
+    fixture_server.delay = 0.1
+    out = str(tmp_path / "games.csv.out")
+    checkpoint = out + ".checkpoint.jsonl"
+    args = [out, "-f", "csv", "--games", games_csv, "--base-url", fixture_server.base_url, "-w", "1"]
+    run_and_kill(args, checkpoint, lines=3)
+    # Whatever the dead process wrote after its last checkpoint, plus a torn row.
+    with open(out, "a") as f:
+        f.write("Torn Player,12:3")
+
+    fixture_server.delay = 0
+    assert wnba_pipeline.main(args + ["--resume"]) == 0
+    df = pd.read_csv(out, dtype={"Game ID": str})
+    assert_every_game_once(df)
+    assert not (df["PLAYER"] == "Torn Player").any()
+
+
+def test_jsonl_resume_after_kill_has_no_blank_lines(tmp_path, fixture_server, games_csv):
+    fixture_server.delay = 0.1
+    out = str(tmp_path / "games.jsonl")
+    checkpoint = out + ".checkpoint.jsonl"
+    args = [out, "--games", games_csv, "--base-url", fixture_server.base_url, "-w", "1"]
+    run_and_kill(args, checkpoint, lines=3)
+
+    fixture_server.delay = 0
+    assert wnba_pipeline.main(args + ["--resume"]) == 0
+    with open(out) as f:
+        lines = f.read().split("\n")
+    assert lines[-1] == "" and all(lines[:-1])
+    assert_every_game_once(pd.DataFrame([json.loads(line) for line in lines[:-1]]))
+
+
+def test_parquet_resume_after_kill_drops_unlisted_parts(tmp_path, fixture_server, games_csv):
+    fixture_server.delay = 0.1
+    out = str(tmp_path / "games")
+    checkpoint = out + ".checkpoint.jsonl"
+    args = [out, "--games", games_csv, "--base-url", fixture_server.base_url, "-w", "1",
+            "--games-per-part", "5", "--row-group-rows", "40"]
+    run_and_kill(args, checkpoint, lines=2)
+    with open(checkpoint) as f:
+        listed = json.loads(f.readlines()[-1])["position"]["parts"]
+    # A part the dead process had open, never checkpointed.
+    stray = os.path.join(out, "part-09999.parquet")
+    with open(stray, "wb") as f:
+        f.write(b"PAR1 half a part file")
+
+    fixture_server.delay = 0
+    assert wnba_pipeline.main(args + ["--resume"]) == 0
+    parts = sorted(name for name in os.listdir(out) if name.endswith(".parquet"))
+    assert not os.path.exists(stray)
+    assert parts[:len(listed)] == listed
+    df = pd.concat([pq.read_table(os.path.join(out, name)).to_pandas() for name in parts], ignore_index=True)
+    assert_every_game_once(df)
+
+
+def test_resume_with_nothing_left_drops_the_unrecorded_tail(tmp_path, fixture_server, games_csv):
+    fixture_server.delay = 0
+    out = str(tmp_path / "games.csv.out")
+    args = [out, "-f", "csv", "--games", games_csv, "--base-url", fixture_server.base_url]
+    assert wnba_pipeline.main(args) == 0
+    requests = fixture_server.requests
+    with open(out) as f:
+        before = f.read()
+    with open(out, "a") as f:
+        f.write("Torn Player,12:3")
+
+    assert wnba_pipeline.main(args + ["--resume"]) == 0
+    assert fixture_server.requests == requests
+    with open(out) as f:
+        assert f.read() == before
@@ -0,0 +1,74 @@
+from datetime import date
+
+import pytest
+
+import wnba_boxscore as core
+from benchmarks.server import FixtureServer
+from conftest import PAGES
+from wnba_store import SeasonStore
+from wnba_sync import SyncIndex, sync
+
+TODAY = date(2025, 7, 1)
+# Even game IDs get a final page, odd ones a page that still says scheduled.
+SCHEDULED = PAGES[0].replace('"gameStatus":3', '"gameStatus":1')
+
+
+def game(i, game_date="2025-06-01"):
+    return (f"10225{i:05d}", "LVA", "CHI", game_date, "7:00 PM")
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with FixtureServer([PAGES[0], SCHEDULED]) as server:
+        monkeypatch.setattr(core, "BASE_URL", server.base_url)
+        yield server
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SeasonStore(str(tmp_path / "store"))
+
+
+def run(games, store, **kwargs):
+    index = SyncIndex(store.root + "/sync_index.sqlite")
+    try:
+        return sync(games, store, index, backend="http", today=TODAY, **kwargs)
+    finally:
+        index.close()
+
+
+def test_only_this_runs_games_are_fetched(server, store):
+    run([game(2), game(4), game(3)], store)
+    requests = server.requests
+    # Game 3 is live-or-scheduled in the index, but isn't part of this run.
+    report = run([game(6)], store)
+    assert server.requests == requests + 1
+    assert report["total"] == 1 and report["fetched"] == 1
+
+
+def test_final_games_are_not_fetched_again(server, store):
+    run([game(2), game(4)], store)
+    requests = server.requests
+    report = run([game(2), game(4)], store)
+    assert server.requests == requests
+    assert report["already_final"] == 2
+
+
+def test_past_game_still_scheduled_gives_up(server, store):
+    for _ in range(2):
+        report = run([game(3)], store, max_attempts=2)
+        assert report["fetched"] == 1 and report["scheduled"] == 1
+    requests = server.requests
+    report = run([game(3)], store, max_attempts=2)
+    assert server.requests == requests
+    assert report["gave_up"] == 1
+
+    # Rescheduled: tried again.
+    report = run([game(3, "2025-06-20")], store, max_attempts=2)
+    assert report["fetched"] == 1
+
+
+def test_scheduled_on_game_day_is_not_an_attempt(server, store):
+    for _ in range(3):
+        report = run([game(3, TODAY.isoformat())], store, max_attempts=2)
+        assert report["fetched"] == 1 and report["gave_up"] == 0
@@ -0,0 +1,263 @@
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+COUNTING_STATS = ["MIN", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "OREB", "DREB", "REB", "AST", "STL", "BLK",
+                  "TO", "PF", "+/-", "PTS"]
+PER36_STATS = ["PTS", "REB", "AST", "STL", "BLK", "TO"]
+ROLLING_STATS = ["MIN", "PTS", "REB", "AST"]
+ROLLING_WINDOWS = (5, 10)
+# Every totals table has exactly these columns, in this order; a stat the
+# page didn't have counts as zero.
+TOTALS_COLUMNS = COUNTING_STATS + ["GP", "Listed"]
+TOTALS_ROW_RE = r"(?i)^\s*(team\s+)?totals?\s*$"
+
+
+def game_contributions(df):
+    """One row per player per game: summed counting stats, GP, Team and Date.
+
+    DNP rows count towards nothing. A team totals row, if the page had one,
+    is dropped so it doesn't turn up as a player. Every counting stat is
+    present; one missing from the page is zero.
+    """
+    df = df[~df["PLAYER"].astype(str).str.match(TOTALS_ROW_RE)]
+    present = [stat for stat in COUNTING_STATS if stat in df.columns]
+    played = ~df["DNP"].astype(bool) if "DNP" in df.columns else df[present].notna().any(axis=1)
+    stats = COUNTING_STATS
+    frame = df[present].astype("float64").reindex(columns=stats).fillna(0)
+    frame["GP"] = played.astype("float64").to_numpy()
+    frame["Game ID"] = df["Game ID"].astype(str).to_numpy()
+    frame["PLAYER"] = df["PLAYER"].astype(str).to_numpy()
+    frame["Team"] = df["Team"].astype(str).to_numpy()
+    day = df["Date"] if "Date" in df.columns else pd.to_datetime(df["Game Date"], errors="coerce")
+    frame["Date"] = pd.to_datetime(day).astype("datetime64[ms]").to_numpy()
+    keys = ["Game ID", "PLAYER"]
+    # A player listed twice in a game (it happens on bad pages) is summed.
+    summed = frame.groupby(keys, sort=False)[stats + ["GP"]].sum()
+    summed["Listed"] = 1.0
+    first = frame.groupby(keys, sort=False)[["Team", "Date"]].first()
+    return summed.join(first).reset_index()
+
+
+def shooting(totals):
+    fga = totals["FGA"].where(totals["FGA"] > 0)
+    attempts = 2 * (totals["FGA"] + 0.44 * totals["FTA"])
+    return pd.DataFrame({
+        "FG%": totals["FGM"] / fga * 100,
+        "eFG%": (totals["FGM"] + 0.5 * totals["3PM"]) / fga * 100,
+        "TS%": totals["PTS"] / attempts.where(attempts > 0) * 100,
+    }, index=totals.index)
+
+
+def per36(totals, stats=PER36_STATS):
+    minutes = totals["MIN"].where(totals["MIN"] > 0)
+    return pd.DataFrame({f"{stat}/36": totals[stat] / minutes * 36 for stat in stats}, index=totals.index)
+
+
+def rolling(log, windows=ROLLING_WINDOWS, stats=ROLLING_STATS):
+    """Average of each player's last n games played, for every n in windows.
+
+    Computed for all players at once from groupby cumulative sums: the sum of
+    the last n games is cumsum minus cumsum shifted n rows within the player.
+    """
+    played = log[log["GP"] > 0].sort_values(["PLAYER", "Date", "Game ID"], kind="stable")
+    if played.empty:
+        return pd.DataFrame(columns=[f"{stat} L{n}" for n in windows for stat in stats])
+    groups = played.groupby("PLAYER", sort=False)
+    cumulative = groups[stats].cumsum()
+    position = groups.cumcount() + 1
+    last = ~played["PLAYER"].duplicated(keep="last")
+    out = {}
+    for n in windows:
+        window = cumulative - cumulative.groupby(played["PLAYER"], sort=False).shift(n).fillna(0)
+        games = np.minimum(position, n)
+        for stat in stats:
+            out[f"{stat} L{n}"] = (window[stat] / games)[last].to_numpy()
+    return pd.DataFrame(out, index=pd.Index(played.loc[last, "PLAYER"].to_numpy(), name="PLAYER"))
+
+
+def season_table(totals, log, windows=ROLLING_WINDOWS):
+    # Team is the player's team in their latest game.
+    table = totals.reindex(columns=TOTALS_COLUMNS, fill_value=0).drop(columns="Listed")
+    table.insert(0, "Team", log.sort_values("Date", kind="stable").groupby("PLAYER")["Team"].last())
+    for stat in ["PTS", "REB", "AST"]:
+        table[f"{stat}/G"] = table[stat] / table["GP"].where(table["GP"] > 0)
+    table = table.join(shooting(totals)).join(per36(totals)).join(rolling(log, windows))
+    return table.sort_index()
+
+
+def recompute(df, windows=ROLLING_WINDOWS):
+    """The season table from scratch over every row, for checking update()."""
+    log = game_contributions(df)
+    totals = log.groupby("PLAYER")[TOTALS_COLUMNS].sum()
+    return season_table(totals, log, windows)
+
+
+def compare(a, b, tolerance=1e-6):
+    # Largest absolute difference between two season tables; raises if they
+    # don't cover the same players and columns.
+    if not a.index.equals(b.index) or list(a.columns) != list(b.columns):
+        raise ValueError("Tables cover different players or columns.")
+    numeric = a.select_dtypes("number").columns
+    diff = (a[numeric].astype("float64") - b[numeric].astype("float64")).abs()
+    both_na = a[numeric].isna() & b[numeric].isna()
+    worst = float(diff.where(~both_na, 0).fillna(np.inf).max().max()) if len(numeric) else 0.0
+    if (a["Team"] != b["Team"]).any() or worst > tolerance:
+        raise ValueError(f"Tables differ (largest difference {worst}).")
+    return worst
+
+
+def _empty_log():
+    return game_contributions(pd.DataFrame(columns=["PLAYER", "Team", "Game ID", "Game Date"]))
+
+
+class SeasonAggregates:
+    """Running per-player season totals, updated one game at a time.
+
+    Each game's contribution is kept, so a game fetched again (a live game, a
+    re-scrape) is subtracted before its new numbers are added. Listed counts
+    the games a player appeared on the sheet, DNPs included, and drops them
+    when it reaches zero. Per-36, shooting and rolling figures are derived
+    from the totals and game log on demand. ``versions`` remembers which
+    version of each stored game was folded in (see SeasonStore.game_versions).
+    """
+
+    def __init__(self, windows=ROLLING_WINDOWS):
+        self.windows = windows
+        self._games = {}
+        self._log = None
+        self.versions = {}
+        self.totals = pd.DataFrame(columns=TOTALS_COLUMNS, dtype="float64")
+
+    def __len__(self):
+        return len(self._games)
+
+    def __contains__(self, game_id):
+        return str(game_id) in self._games
+
+    def game_ids(self):
+        return list(self._games)
+
+    def _add(self, contribution, sign):
+        stats = contribution.set_index("PLAYER").reindex(columns=self.totals.columns, fill_value=0)
+        self.totals = self.totals.add(sign * stats, fill_value=0)[self.totals.columns]
+        # Players whose only game was taken back out.
+        self.totals = self.totals[self.totals["Listed"] > 0]
+        self._log = None
+
+    def update(self, df, versions=None):
+        """Fold in the frames of one or more games; returns the game IDs."""
+        updated = []
+        for game_id, contribution in game_contributions(df).groupby("Game ID", sort=False):
+            self.remove_game(game_id)
+            self._add(contribution, 1)
+            self._games[game_id] = contribution.reset_index(drop=True)
+            self.versions[game_id] = (versions or {}).get(game_id)
+            updated.append(game_id)
+        return updated
+
+    def remove_game(self, game_id):
+        previous = self._games.pop(str(game_id), None)
+        self.versions.pop(str(game_id), None)
+        if previous is not None:
+            self._add(previous, -1)
+
+    def log(self):
+        if self._log is None:
+            frames = list(self._games.values())
+            self._log = pd.concat(frames, ignore_index=True) if frames else _empty_log()
+        return self._log
+
+    def table(self):
+        totals = self.totals.copy()
+        totals.index.name = "PLAYER"
+        return season_table(totals, self.log(), self.windows)
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        log = self.log().copy()
+        log["Version"] = log["Game ID"].map(self.versions)
+        log.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, windows=ROLLING_WINDOWS):
+        aggregates = cls(windows)
+        if os.path.exists(path):
+            log = pd.read_parquet(path)
+            if "Version" in log.columns:
+                aggregates.versions = log.groupby("Game ID", sort=False)["Version"].first().to_dict()
+                log = log.drop(columns="Version")
+            # Logs saved before every stat was kept may lack some columns.
+            log = log.reindex(columns=_empty_log().columns, fill_value=0)
+            aggregates._games = {game_id: game.reset_index(drop=True)
+                                 for game_id, game in log.groupby("Game ID", sort=False)}
+            aggregates.totals = log.groupby("PLAYER")[TOTALS_COLUMNS].sum()
+            aggregates._log = log
+        return aggregates
+
+
+def aggregates_path(store, season):
+    # The leading underscore keeps the file out of the store's dataset scan.
+    return os.path.join(store.root, "_aggregates", f"season-{season}.parquet")
+
+
+def update_from_store(store, season, aggregates=None, refresh=()):
+    """Bring a season's aggregates up to date with the store.
+
+    Only games that are new, were rewritten since they were folded in (their
+    files changed, whoever wrote them), or are listed in ``refresh`` are
+    read; games deleted from the store are taken out. Returns the aggregates
+    and the number of games read.
+    """
+    aggregates = aggregates or SeasonAggregates.load(aggregates_path(store, season))
+    refresh = {str(game_id) for game_id in refresh}
+    versions = store.game_versions(season)
+    for game_id in set(aggregates.game_ids()) - set(versions):
+        aggregates.remove_game(game_id)
+    stale = [game_id for game_id, version in versions.items()
+             if aggregates.versions.get(game_id) != version or game_id in refresh]
+    if stale:
+        aggregates.update(store.read(season=season, game_ids=stale), versions)
+    return aggregates, len(stale)
+
+
+def main(argv=None):
+    from wnba_store import SeasonStore
+
+    parser = argparse.ArgumentParser(description="Per-player season totals, per-36, eFG%, TS% and rolling averages.")
+    parser.add_argument("season", type=int)
+    parser.add_argument("--store", default=None)
+    parser.add_argument("--out", help="write the season table to this CSV instead of printing it")
+    parser.add_argument("--check", action="store_true", help="compare against a full recompute from the store")
+    args = parser.parse_args(argv)
+
+    store = SeasonStore(args.store)
+    start = time.perf_counter()
+    aggregates, added = update_from_store(store, args.season)
+    aggregates.save(aggregates_path(store, args.season))
+    table = aggregates.table()
+    elapsed = time.perf_counter() - start
+    print(f"{len(aggregates)} games ({added} new), {len(table)} players in {elapsed * 1000:.0f} ms", file=sys.stderr)
+
+    if args.check:
+        start = time.perf_counter()
+        full = recompute(store.read(season=args.season))
+        worst = compare(table, full)
+        print(f"full recompute in {(time.perf_counter() - start) * 1000:.0f} ms; "
+              f"largest difference {worst:.2g}", file=sys.stderr)
+
+    if args.out:
+        table.to_csv(args.out)
+    else:
+        print(table.round(1).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+import argparse
+import csv
+import multiprocessing as mp
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing.util import Finalize
+from urllib.parse import urlparse
+
+import pandas as pd
+
+import wnba_boxscore as core
+import wnba_metrics as metrics
+from wnba_cache import DEFAULT_CACHE_DIR, PageCache
+from wnba_manifest import GAME_FIELDS, add_selection_args, check_selection, select_games
+from wnba_store import SeasonStore
+
+
+class RateLimiter:
+    """Spaces out requests to each domain, shared by every worker process."""
+
+    def __init__(self, manager, min_interval):
+        self.min_interval = min_interval
+        self._next_slot = manager.dict()
+        self._lock = manager.Lock()
+
+    def wait(self, url):
+        domain = urlparse(url).netloc
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.get(domain, 0.0))
+            self._next_slot[domain] = slot + self.min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class BatchResult:
+    def __init__(self):
+        self.frames = {}
+        self.failures = {}
+        self.records = {}
+        self.elapsed = 0.0
+
+    def combined(self):
+        frames = [df for pair in self.frames.values() for df in pair]
+        return core.concat_boxscores(frames) if frames else pd.DataFrame()
+
+    def summary(self):
+        done = len(self.frames) + len(self.failures)
+        rate = done / self.elapsed if self.elapsed else 0.0
+        return (f"{len(self.frames)} ok, {len(self.failures)} failed in {self.elapsed:.1f}s "
+                f"({rate:.2f} games/s)")
+
+
+def read_games_csv(path):
+    games = []
+    with open(path, newline="") as f:
+        for row in csv.reader(f):
+            if not row or row[0].strip().startswith("#") or row[0].strip() == "game_id":
+                continue
+            if len(row) != len(GAME_FIELDS):
+                raise ValueError(f"{path}: expected {', '.join(GAME_FIELDS)}, got {row}")
+            games.append(tuple(cell.strip() for cell in row))
+    return games
+
+
+# Worker process state
+_limiter = None
+_options = None
+_pool = None
+_cache = None
+
+
+def _init_worker(limiter, options):
+    global _limiter, _options, _pool, _cache
+    _limiter = limiter
+    _options = options
+    # Creating the pool doesn't start Chrome; the first browser fetch does.
+    from wnba_driver_pool import DriverPool
+    _pool = DriverPool(size=1, max_pages=options["max_pages"], lean=options["lean_browser"])
+    Finalize(_pool, _pool.close, exitpriority=10)
+    if options["cache_dir"]:
+        _cache = PageCache(options["cache_dir"])
+
+
+def _scrape_game(game):
+    game_id, home_abbr, away_abbr = game[:3]
+    slug = _options["slugs"].get(game_id)
+    url = core.boxscore_url(game_id, home_abbr, away_abbr, _options["base_url"], slug)
+    start = time.perf_counter()
+    error = None
+    # Counters from failed attempts (parse failures, pages fetched) carry
+    # over into the final record.
+    counters = {}
+
+    for attempt in range(_options["retries"] + 1):
+        if attempt:
+            delay = _options["backoff"] * 2 ** (attempt - 1)
+            time.sleep(delay + random.uniform(0, delay / 2))
+        if not _options["offline"]:
+            _limiter.wait(url)
+        try:
+            frames = core.get_cleaned_boxscores(
+                *game, pool=_pool, wait_timeout=_options["wait_timeout"],
+                backend=_options["backend"], base_url=_options["base_url"],
+                cache=_cache, offline=_options["offline"], slug=slug,
+            )
+        except LookupError as e:
+            error = f"{type(e).__name__}: {e}"
+            break
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if attempt < _options["retries"]:
+                metrics.merge_counters(counters, core.fetch_log.get(game_id, {}).get("counters"))
+            continue
+        return game_id, frames, None, _attempt_record(game_id, attempt, start, counters, None)
+
+    return game_id, None, error, _attempt_record(game_id, attempt, start, counters, error)
+
+
+def _attempt_record(game_id, attempt, start, counters, error):
+    record = dict(core.fetch_log.get(game_id, {}), attempts=attempt + 1,
+                  seconds=round(time.perf_counter() - start, 3), outcome="error" if error else "ok")
+    record["counters"] = metrics.merge_counters(dict(counters), record.get("counters"))
+    if attempt:
+        record["counters"]["retries"] = attempt
+    if error:
+        record["error"] = error
+    return record
+
+
+def print_progress(done, total, game_id, error, elapsed):
+    rate = done / elapsed if elapsed else 0.0
+    eta = (total - done) / rate if rate else 0.0
+    status = "ok" if error is None else f"FAILED ({error})"
+    print(f"[{done}/{total}] {game_id} {status}  {rate:.2f} games/s  eta {eta:.0f}s", file=sys.stderr)
+
+
+def scrape_games(games, workers=4, min_interval=1.0, retries=2, backoff=2.0, backend="auto",
+                 wait_timeout=15, max_pages=50, base_url=None, cache_dir=None, offline=False,
+                 lean_browser=True, slugs=None, progress=print_progress):
+    games = [tuple(game) for game in games]
+    result = BatchResult()
+    if not games:
+        return result
+
+    options = {
+        "retries": retries, "backoff": backoff, "backend": backend, "wait_timeout": wait_timeout,
+        "max_pages": max_pages, "base_url": base_url, "cache_dir": cache_dir, "offline": offline,
+        "lean_browser": lean_browser, "slugs": dict(slugs or {}),
+    }
+    start = time.perf_counter()
+
+    with mp.Manager() as manager:
+        limiter = RateLimiter(manager, min_interval)
+        with ProcessPoolExecutor(max_workers=min(workers, len(games)), initializer=_init_worker,
+                                 initargs=(limiter, options)) as executor:
+            futures = {executor.submit(_scrape_game, game): game for game in games}
+            for done, future in enumerate(as_completed(futures), 1):
+                game_id = futures[future][0]
+                try:
+                    game_id, frames, error, record = future.result()
+                except Exception as e:
+                    # A worker died (e.g. the browser took the process down); keep going.
+                    frames, error = None, f"{type(e).__name__}: {e}"
+                    record = {"outcome": "error", "error": error}
+                result.records[game_id] = record
+                metrics.emit(dict(record, game_id=game_id))
+                if error is None:
+                    result.frames[game_id] = frames
+                else:
+                    result.failures[game_id] = error
+                result.elapsed = time.perf_counter() - start
+                if progress:
+                    progress(done, len(games), game_id, error, result.elapsed)
+
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape many WNBA boxscores in parallel.")
+    parser.add_argument("games_csv", nargs="?", help="CSV of game_id,home_abbr,away_abbr,game_date,game_time "
+                        "(default: games picked from the manifest)")
+    parser.add_argument("-o", "--out", default="boxscores.csv", help="combined CSV to write")
+    parser.add_argument("-w", "--workers", type=int, default=4)
+    parser.add_argument("--interval", type=float, default=1.0, help="minimum seconds between requests per domain")
+    parser.add_argument("--retries", type=int, default=2)
+    parser.add_argument("--backoff", type=float, default=2.0)
+    parser.add_argument("--backend", choices=["auto", "http", "selenium"], default="auto")
+    parser.add_argument("--wait-timeout", type=float, default=15)
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--cache-dir", default=None, help="keep raw pages in this page cache")
+    parser.add_argument("--offline", action="store_true", help="serve pages only from the cache")
+    parser.add_argument("--store", default=None, help="also write each game into this Parquet season store")
+    parser.add_argument("--full-browser", action="store_true",
+                        help="load images, fonts and trackers too (the default browser profile blocks them)")
+    add_selection_args(parser)
+    parser.add_argument("--metrics-log", default=None, help="append one JSON line of stage timings per game")
+    parser.add_argument("--metrics-prom", default=None, help="keep a Prometheus text metrics file here")
+    args = parser.parse_args(argv)
+    check_selection(parser, args)
+    metrics.configure(args.metrics_log, args.metrics_prom)
+
+    games = read_games_csv(args.games_csv) if args.games_csv else None
+    slugs, unknown = {}, []
+    if games is None or args.manifest:
+        games, slugs, _, unknown = select_games(args, games, parser=parser)
+
+    result = scrape_games(
+        games, workers=args.workers, min_interval=args.interval,
+        retries=args.retries, backoff=args.backoff, backend=args.backend,
+        wait_timeout=args.wait_timeout, base_url=args.base_url,
+        cache_dir=args.cache_dir or (DEFAULT_CACHE_DIR if args.offline else None), offline=args.offline,
+        lean_browser=not args.full_browser, slugs=slugs,
+    )
+    result.combined().to_csv(args.out, index=False)
+    if args.store:
+        store = SeasonStore(args.store)
+        for home_df, away_df in result.frames.values():
+            store.write_game(core.concat_boxscores([home_df, away_df]))
+    print(result.summary(), file=sys.stderr)
+    for game_id, error in result.failures.items():
+        print(f"  {game_id}: {error}", file=sys.stderr)
+    return 1 if result.failures or unknown else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
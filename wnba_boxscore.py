@@ -1,296 +1,81 @@
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
+import json
+import os
+import re
 import time
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
-# Data cleaning functions
-def split_shooting_columns(df):
-    for col in ['FGM-A', '3PM-A', 'FTM-A']:
-        if col in df.columns:
-            new_cols = df[col].str.split("-", expand=True)
-            new_names = {'FGM-A': ['FGM', 'FGA'], '3PM-A': ['3PM', '3PA'], 'FTM-A': ['FTM', 'FTA']}
-            df[new_names[col][0]] = new_cols[0]
-            df[new_names[col][1]] = new_cols[1]
-            df.drop(columns=[col], inplace=True)
-    return df
-
-def reorder_shooting_columns(df):
-    shooting_cols = ["FGM", "FGA", "3PM", "3PA", "FTM", "FTA"]
-    existing = [col for col in shooting_cols if col in df.columns]
-    first_two = df.columns.tolist()[:2]
-    rest = [col for col in df.columns if col not in first_two + existing]
-    return df[first_two + existing + rest]
-
-def get_cleaned_boxscores(game_id, home_abbr, away_abbr, game_date, game_time):
-    url = f"https://www.wnba.com/game/{game_id}/{home_abbr}-vs-{away_abbr}/boxscore"
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    driver.get(url)
-    time.sleep(5)
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    tables = soup.find_all("table")
-
-    if len(tables) < 2:
-        driver.quit()
-        raise ValueError("Not enough tables found.")
-
-    def parse_table(table):
-        headers = [th.get_text(strip=True) for th in table.find_all("th")]
-        rows = []
-        for row in table.find("tbody").find_all("tr"):
-            cells = [td.get_text(strip=True) for td in row.find_all("td")]
-            if cells:
-                rows.append(cells)
-        return pd.DataFrame(rows, columns=headers)
-
-    home_df = parse_table(tables[0])
-    away_df = parse_table(tables[1])
-
-    for df, team, opp, loc in [(home_df, home_abbr, away_abbr, "Home"), (away_df, away_abbr, home_abbr, "Away")]:
-        df["Team"] = team
-        df["Opponent"] = opp
-        df["Location"] = loc
-        df["Game Date"] = game_date
-        df["Game Time"] = game_time
-        df["Game ID"] = game_id
-
-    home_df = reorder_shooting_columns(split_shooting_columns(home_df))
-    away_df = reorder_shooting_columns(split_shooting_columns(away_df))
-
-    driver.quit()
-    return home_df, away_df
-
-def show_data():
-    global latest_df
-
-    game_id = entry_game_id.get()
-    home_abbr = entry_home.get()
-    away_abbr = entry_away.get()
-    game_date = entry_date.get()
-    game_time = entry_time.get()
-
-    try:
-        home_df, away_df = get_cleaned_boxscores(game_id, home_abbr, away_abbr, game_date, game_time)
-        latest_df = pd.concat([home_df, away_df], ignore_index=True)
-
-        for widget in scrollable_table_frame.winfo_children():
-            widget.destroy()
-
-        create_team_tree(home_df, f"    {home_abbr} Boxscore")
-        create_team_tree(away_df, f"    {away_abbr} Boxscore")
-
-        btn_save.config(state="normal")
-        display_stat_leaders_per_team()
-
-        home_pts = pd.to_numeric(home_df["PTS"], errors="coerce").sum()
-        away_pts = pd.to_numeric(away_df["PTS"], errors="coerce").sum()
-        label_score.config(text=f"{home_abbr} {int(home_pts)} - {int(away_pts)} {away_abbr}", font=("Arial", 24, "bold"))
-
-        display_graphs(home_df, away_df)
-
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
-
-def display_stat_leaders_per_team():
-    if latest_df is None:
-        return
-
-    stat_columns = ["PTS", "REB", "AST", "STL", "BLK", "TO", "+/-"]
-
-    for label_dict in [summary_labels_home, summary_labels_away]:
-        for label in label_dict.values():
-            label.config(text="")
-
-    for team in latest_df["Team"].unique():
-        team_df = latest_df[latest_df["Team"] == team].copy()
-
-        for stat in stat_columns:
-            if stat in team_df.columns:
-                team_df[stat] = pd.to_numeric(team_df[stat], errors="coerce")
-
-        leaders = {}
-        for stat in stat_columns:
-            if stat in team_df.columns and team_df[stat].notna().any():
-                max_index = team_df[stat].idxmax()
-                leader_row = team_df.loc[max_index]
-                player = leader_row.get("PLAYER", "Unknown")
-                value = leader_row[stat]
-                leaders[stat] = f"{stat}: {player} ({value})"
-
-        is_home = team_df["Location"].iloc[0] == "Home"
-        label_dict = summary_labels_home if is_home else summary_labels_away
-
-        for i, stat in enumerate(stat_columns):
-            if stat in leaders and stat in label_dict:
-                label_dict[stat].config(text=leaders[stat])
-
-def display_graphs(home_df, away_df):
-    for widget in graph_frame.winfo_children():
-        widget.destroy()
-
-    fig1, ax1 = plt.subplots(figsize=(5, 3))
-    home_pts = pd.to_numeric(home_df["PTS"], errors="coerce")
-    away_pts = pd.to_numeric(away_df["PTS"], errors="coerce")
-    ax1.bar(home_df["PLAYER"], home_pts, label=home_df["Team"].iloc[0])
-    ax1.bar(away_df["PLAYER"], away_pts, label=away_df["Team"].iloc[0])
-    ax1.set_title("Points by Player")
-    ax1.set_ylabel("Points")
-    ax1.set_xticklabels(list(home_df["PLAYER"])+list(away_df["PLAYER"]), rotation=45, ha="right")
-    ax1.legend()
-    fig1.tight_layout()
-    canvas1 = FigureCanvasTkAgg(fig1, master=graph_frame)
-    canvas1.get_tk_widget().pack(pady=5)
-
-    stats = ["PTS", "REB", "AST", "STL", "BLK", "TO"]
-    home_totals = [pd.to_numeric(home_df[stat], errors="coerce").sum() for stat in stats]
-    away_totals = [pd.to_numeric(away_df[stat], errors="coerce").sum() for stat in stats]
-
-    fig2, ax2 = plt.subplots(figsize=(5, 3))
-    bar_width = 0.35
-    index = range(len(stats))
-    ax2.bar(index, home_totals, bar_width, label=home_df["Team"].iloc[0])
-    ax2.bar([i + bar_width for i in index], away_totals, bar_width, label=away_df["Team"].iloc[0])
-    ax2.set_title("Team Stat Comparison")
-    ax2.set_xticks([i + bar_width / 2 for i in index])
-    ax2.set_xticklabels(stats)
-    ax2.legend()
-    fig2.tight_layout()
-    canvas2 = FigureCanvasTkAgg(fig2, master=graph_frame)
-    canvas2.get_tk_widget().pack(pady=5)
-
-def create_team_tree(df, label_text):
-    lbl = tk.Label(scrollable_table_frame, text=label_text, font=("Arial", 10, "bold"), anchor="w")
-    lbl.pack(fill="x", padx=10, pady=(5, 0))
-
-    frame = tk.Frame(scrollable_table_frame)
-    frame.pack(fill="both", expand=True, pady=2)
-
-    tree = ttk.Treeview(frame, show='headings', height=8)
-    tree["columns"] = list(df.columns)
-    for col in df.columns:
-        tree.heading(col, text=col)
-        tree.column(col, width=80, anchor="center")
-
-    for i in df.index:
-        tree.insert("", "end", values=list(df.loc[i]))
-
-    vsb = tk.Scrollbar(frame, orient="vertical", command=tree.yview)
-    hsb = tk.Scrollbar(frame, orient="horizontal", command=tree.xview)
-    tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-
-    tree.grid(row=0, column=0, sticky="nsew")
-    vsb.grid(row=0, column=1, sticky="ns")
-    hsb.grid(row=1, column=0, sticky="ew")
-    frame.grid_columnconfigure(0, weight=1)
-    frame.grid_rowconfigure(0, weight=1)
-
-# --- GUI Setup ---
-root = tk.Tk()
-root.title("WNBA Boxscore Viewer")
-
-frame_inputs = tk.Frame(root)
-frame_inputs.pack(pady=10)
-
-input_labels = ["Game ID", "Home Abbr", "Away Abbr", "Game Date", "Game Time"]
-entry_vars = []
-
-for i, label in enumerate(input_labels):
-    tk.Label(frame_inputs, text=label).grid(row=i, column=0, sticky="e", padx=5)
-    entry = tk.Entry(frame_inputs)
-    entry.grid(row=i, column=1, padx=5)
-    entry_vars.append(entry)
-
-entry_game_id, entry_home, entry_away, entry_date, entry_time = entry_vars
-
-btn_fetch = tk.Button(frame_inputs, text="Fetch Boxscore", command=show_data)
-btn_fetch.grid(row=len(input_labels), column=0, columnspan=2, pady=5)
-
-btn_save = tk.Button(frame_inputs, text="Save to CSV", command=lambda: None, state="disabled")
-btn_save.grid(row=len(input_labels)+1, column=0, columnspan=2, pady=5)
-
-label_score = tk.Label(root, text="", font=("Arial", 16, "bold"), fg="blue")
-label_score.pack(pady=5)
-
-# Scrollable table section
-container = tk.Frame(root)
-container.pack(fill="both", expand=True)
-
-canvas = tk.Canvas(container)
-x_scrollbar = tk.Scrollbar(container, orient="horizontal", command=canvas.xview)
-y_scrollbar = tk.Scrollbar(container, orient="vertical", command=canvas.yview)
-canvas.configure(xscrollcommand=x_scrollbar.set, yscrollcommand=y_scrollbar.set)
-
-x_scrollbar.pack(side="bottom", fill="x")
-y_scrollbar.pack(side="right", fill="y")
-canvas.pack(side="left", fill="both", expand=True)
-
-scrollable_table_frame = tk.Frame(canvas)
-canvas.create_window((0, 0), window=scrollable_table_frame, anchor="nw")
-scrollable_table_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-
-# Stat Leaders Summary
-summary_title = tk.Label(root, text="Stat Leaders Summary", font=("Arial", 12, "bold"))
-summary_title.pack(pady=3)
-
-frame_summary = tk.Frame(root)
-frame_summary.pack(pady=5, fill="x")
-
-frame_summary_home = tk.LabelFrame(frame_summary, text="Home Leaders", padx=5, pady=3)
-frame_summary_home.pack(side="left", expand=True, fill="x", padx=5)
-
-frame_summary_away = tk.LabelFrame(frame_summary, text="Away Leaders", padx=5, pady=3)
-frame_summary_away.pack(side="left", expand=True, fill="x", padx=5)
-
-summary_stats = ["PTS", "REB", "AST", "STL", "BLK", "TO", "+/-"]
-summary_labels_home = {stat: tk.Label(frame_summary_home, text="", font=("Arial", 8), anchor="center") for stat in summary_stats}
-summary_labels_away = {stat: tk.Label(frame_summary_away, text="", font=("Arial", 8), anchor="center") for stat in summary_stats}
-
-for i, stat in enumerate(summary_stats):
-    summary_labels_home[stat].grid(row=i, column=0, sticky="nsew", pady=1)
-    summary_labels_away[stat].grid(row=i, column=0, sticky="nsew", pady=1)
-
-frame_summary_home.grid_columnconfigure(0, weight=1)
-frame_summary_away.grid_columnconfigure(0, weight=1)
-
-# Graph Frame
-graph_frame = tk.Frame(root)
-graph_frame.pack(pady=10, fill="x")
-
-latest_df = None
-root.mainloop()
-import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import time
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+import wnba_metrics as metrics
+from wnba_parsers import get_parser
 
 # Data cleaning functions
+SHOOTING_COLUMNS = {"FGM-A": ("FGM", "FGA"), "3PM-A": ("3PM", "3PA"), "FTM-A": ("FTM", "FTA")}
+MADE_ATTEMPTED_RE = r"^\s*(\d+)\s*-\s*(\d+)\s*$"
+MINUTES_RE = r"^\s*(\d+)(?::(\d{1,2}))?\s*$"
+
+# Column -> dtype for every stat we know about. Per-player counts fit in
+# int8; the few that can pass 127 on a team totals row get int16.
+STAT_SCHEMA = {
+    "FGM": "Int16", "FGA": "Int16", "3PM": "Int8", "3PA": "Int8", "FTM": "Int8", "FTA": "Int8",
+    "OREB": "Int8", "DREB": "Int8", "REB": "Int16", "AST": "Int8", "STL": "Int8", "BLK": "Int8",
+    "TO": "Int8", "PF": "Int8", "+/-": "Int16", "PTS": "Int16",
+    "FG%": "float32", "3P%": "float32", "FT%": "float32",
+}
+INT_RANGES = {"Int8": (-128, 127), "Int16": (-32768, 32767)}
+CATEGORY_COLUMNS = ["Team", "Opponent", "Location", "Game ID"]
+
+def _narrow(numeric, col):
+    # Casting down wraps silently ('+150' would become -106 as Int8), so
+    # check the range first: widen Int8 to Int16, and refuse anything else.
+    dtype = STAT_SCHEMA[col]
+    if dtype not in INT_RANGES:
+        return numeric.astype(dtype)
+    low, high = numeric.min(), numeric.max()
+    for candidate in [dtype, "Int16"]:
+        if pd.isna(low) or INT_RANGES[candidate][0] <= low and high <= INT_RANGES[candidate][1]:
+            return numeric.astype(candidate)
+    raise ValueError(f"{col} has values outside {INT_RANGES['Int16']}: {low}..{high}")
+
 def split_shooting_columns(df):
-    for col in ['FGM-A', '3PM-A', 'FTM-A']:
+    # One regex pass over all made-attempted columns stacked together.
+    present = [col for col in SHOOTING_COLUMNS if col in df.columns]
+    if not present:
+        return df
+    parts = pd.concat([df[col].astype("string") for col in present], keys=present).str.extract(MADE_ATTEMPTED_RE)
+    for col in present:
+        made, attempted = SHOOTING_COLUMNS[col]
+        values = parts.xs(col)
+        df[made] = _narrow(pd.to_numeric(values[0]), made)
+        df[attempted] = _narrow(pd.to_numeric(values[1]), attempted)
+    return df.drop(columns=present)
+
+def parse_minutes(values):
+    parts = values.astype("string").str.extract(MINUTES_RE)
+    return (pd.to_numeric(parts[0]) + pd.to_numeric(parts[1]).fillna(0) / 60).astype("float32")
+
+def apply_stat_schema(df):
+    # Anything in MIN that isn't a clock value ("DNP - Coach's Decision",
+    # "INACTIVE_INJURY", blank) marks a player who didn't play; their stats
+    # become NA rather than zero.
+    if "MIN" in df.columns:
+        minutes = parse_minutes(df["MIN"])
+        df["DNP"] = minutes.isna()
+        df["MIN"] = minutes
+    for col, dtype in STAT_SCHEMA.items():
+        if col in df.columns and df[col].dtype != dtype:
+            numeric = pd.to_numeric(df[col].astype("string").str.strip().replace("", pd.NA), errors="coerce")
+            df[col] = _narrow(numeric, col)
+    for col in CATEGORY_COLUMNS:
         if col in df.columns:
-            new_cols = df[col].str.split("-", expand=True)
-            new_names = {'FGM-A': ['FGM', 'FGA'], '3PM-A': ['3PM', '3PA'], 'FTM-A': ['FTM', 'FTA']}
-            df[new_names[col][0]] = new_cols[0]
-            df[new_names[col][1]] = new_cols[1]
-            df.drop(columns=[col], inplace=True)
+            df[col] = df[col].astype(str).astype("category")
+    return df
+
+def concat_boxscores(frames):
+    # pd.concat drops categoricals whose categories differ; restore them.
+    df = pd.concat(frames, ignore_index=True)
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and df[col].dtype != "category":
+            df[col] = df[col].astype(str).astype("category")
     return df
 
 def reorder_shooting_columns(df):
@@ -300,36 +85,161 @@ def reorder_shooting_columns(df):
     rest = [col for col in df.columns if col not in first_two + existing]
     return df[first_two + existing + rest]
 
-def get_cleaned_boxscores(game_id, home_abbr, away_abbr, game_date, game_time):
-    url = f"https://www.wnba.com/game/{game_id}/{home_abbr}-vs-{away_abbr}/boxscore"
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    driver.get(url)
-    time.sleep(5)
-
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    tables = soup.find_all("table")
-
-    if len(tables) < 2:
-        driver.quit()
+# Page readiness
+BOXSCORE_READY_JS = """
+const tables = document.querySelectorAll("table");
+if (tables.length < 2) return false;
+for (const table of Array.from(tables).slice(0, 2)) {
+    const body = table.querySelector("tbody");
+    if (!body || !body.querySelector("tr td")) return false;
+}
+return true;
+"""
+
+# Per-game fetch records, keyed by game ID
+fetch_log = {}
+
+class FetchCancelled(Exception):
+    pass
+
+def _check_cancel(cancel):
+    if cancel is not None and cancel.is_set():
+        raise FetchCancelled("Fetch cancelled.")
+
+def wait_for_boxscore_tables(driver, timeout=15, poll=0.1, cancel=None):
+    # selenium, aiohttp and the GUI toolkits are imported where they are
+    # used, so parsing and cleaning load fast on a headless box.
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    def tables_ready(d):
+        _check_cancel(cancel)
+        return d.execute_script(BOXSCORE_READY_JS)
+
+    start = time.perf_counter()
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll).until(tables_ready)
+        ready = True
+    except TimeoutException:
+        ready = False
+    return ready, time.perf_counter() - start
+
+BASE_URL = os.environ.get("WNBA_BASE_URL", "https://www.wnba.com")
+
+def boxscore_url(game_id, home_abbr, away_abbr, base_url=None, slug=None):
+    # slug: the canonical one from the game manifest, when known.
+    return f"{base_url or BASE_URL}/game/{game_id}/{slug or f'{home_abbr}-vs-{away_abbr}'}/boxscore"
+
+# Parsing functions
+EMBEDDED_JSON_RE = re.compile(r'<script[^>]*type="application/json"[^>]*>(.*?)</script>', re.S)
+
+def _find_game_payload(node):
+    # The game object with both teams' players; schedule strips and tickers
+    # list other games, but without players.
+    if isinstance(node, dict):
+        home, away = node.get("homeTeam"), node.get("awayTeam")
+        if isinstance(home, dict) and isinstance(away, dict) and "players" in home and "players" in away:
+            return node
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return None
+    for child in children:
+        found = _find_game_payload(child)
+        if found:
+            return found
+    return None
+
+def _format_minutes(value):
+    # "PT34M12.00S" -> "34:12"
+    match = re.match(r"PT(\d+)M(\d+)", value or "")
+    return f"{int(match.group(1))}:{match.group(2)}" if match else (value or "")
+
+def _stat_text(value):
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+EMBEDDED_STAT_KEYS = {
+    "reboundsOffensive": "OREB",
+    "reboundsDefensive": "DREB",
+    "reboundsTotal": "REB",
+    "assists": "AST",
+    "steals": "STL",
+    "blocks": "BLK",
+    "turnovers": "TO",
+    "foulsPersonal": "PF",
+    "plusMinusPoints": "+/-",
+    "points": "PTS",
+}
+
+def _pct_text(stats, key):
+    value = stats.get(key)
+    return f"{value * 100:.1f}" if isinstance(value, (int, float)) else ""
+
+def embedded_team_table(team):
+    columns = ["PLAYER", "MIN", "FGM-A", "FG%", "3PM-A", "3P%", "FTM-A", "FT%"] + list(EMBEDDED_STAT_KEYS.values())
+    rows = []
+    for player in team.get("players", []):
+        stats = player.get("statistics") or {}
+        if player.get("played") == "0":
+            rows.append([player.get("name", ""), player.get("notPlayingReason") or "DNP"] + [""] * (len(columns) - 2))
+            continue
+        rows.append([
+            player.get("name", ""),
+            _format_minutes(stats.get("minutes")),
+            f"{stats.get('fieldGoalsMade', 0)}-{stats.get('fieldGoalsAttempted', 0)}",
+            _pct_text(stats, "fieldGoalsPercentage"),
+            f"{stats.get('threePointersMade', 0)}-{stats.get('threePointersAttempted', 0)}",
+            _pct_text(stats, "threePointersPercentage"),
+            f"{stats.get('freeThrowsMade', 0)}-{stats.get('freeThrowsAttempted', 0)}",
+            _pct_text(stats, "freeThrowsPercentage"),
+        ] + [_stat_text(stats.get(key, "")) for key in EMBEDDED_STAT_KEYS])
+    return pd.DataFrame(rows, columns=columns)
+
+def embedded_game(page_source):
+    """The page's own game from its embedded JSON (teams, players, status), or None."""
+    for blob in EMBEDDED_JSON_RE.findall(page_source):
+        try:
+            payload = json.loads(blob)
+        except ValueError:
+            continue
+        found = _find_game_payload(payload)
+        if found:
+            return found
+    return None
+
+def parse_embedded_boxscore(page_source):
+    game = embedded_game(page_source)
+    if game is None:
+        return None
+    return embedded_team_table(game["homeTeam"]), embedded_team_table(game["awayTeam"])
+
+def _has_rows(frames):
+    return frames is not None and len(frames) >= 2 and len(frames[0]) > 0 and len(frames[1]) > 0
+
+def parse_boxscore_html(page_source, parser=None, allow_empty=False):
+    # Same rule as BOXSCORE_READY_JS: both tables need a body row with cells.
+    # A client-rendered skeleton has the tables but not the rows, so it falls
+    # through to the embedded JSON and then fails, which sends "auto" fetches
+    # on to the browser instead of caching an empty game. ``allow_empty``
+    # takes the empty tables anyway (a live page before tip-off).
+    tables = get_parser(parser).parse_tables(page_source)
+    if _has_rows(tables):
+        return tables[0], tables[1]
+
+    embedded = parse_embedded_boxscore(page_source)
+    if _has_rows(embedded):
+        return embedded
+    found = [frames for frames in (tables, embedded) if frames is not None and len(frames) >= 2]
+    if not found:
         raise ValueError("Not enough tables found.")
+    if not allow_empty:
+        raise ValueError("Boxscore tables have no rows yet.")
+    return found[0][0], found[0][1]
 
-    def parse_table(table):
-        headers = [th.get_text(strip=True) for th in table.find_all("th")]
-        rows = []
-        for row in table.find("tbody").find_all("tr"):
-            cells = [td.get_text(strip=True) for td in row.find_all("td")]
-            if cells:
-                rows.append(cells)
-        return pd.DataFrame(rows, columns=headers)
-
-    home_df = parse_table(tables[0])
-    away_df = parse_table(tables[1])
-
+def clean_boxscores(home_df, away_df, game_id, home_abbr, away_abbr, game_date, game_time):
     for df, team, opp, loc in [(home_df, home_abbr, away_abbr, "Home"), (away_df, away_abbr, home_abbr, "Away")]:
         df["Team"] = team
         df["Opponent"] = opp
@@ -338,207 +248,123 @@ def get_cleaned_boxscores(game_id, home_abbr, away_abbr, game_date, game_time):
         df["Game Time"] = game_time
         df["Game ID"] = game_id
 
-    home_df = reorder_shooting_columns(split_shooting_columns(home_df))
-    away_df = reorder_shooting_columns(split_shooting_columns(away_df))
+    home_df = apply_stat_schema(reorder_shooting_columns(split_shooting_columns(home_df)))
+    away_df = apply_stat_schema(reorder_shooting_columns(split_shooting_columns(away_df)))
 
-    driver.quit()
     return home_df, away_df
 
-def show_data():
-    global latest_df
+# Fetching
+# Longest a fetch waits for a pooled browser to come free (e.g. while another
+# fetch holds it) before giving up.
+BROWSER_ACQUIRE_TIMEOUT = 60
 
-    game_id = entry_game_id.get()
-    home_abbr = entry_home.get()
-    away_abbr = entry_away.get()
-    game_date = entry_date.get()
-    game_time = entry_time.get()
+def fetch_with_browser(url, pool=None, wait_timeout=15, cancel=None, acquire_timeout=BROWSER_ACQUIRE_TIMEOUT):
+    from wnba_driver_pool import AcquireCancelled, get_default_pool
 
-    try:
-        home_df, away_df = get_cleaned_boxscores(game_id, home_abbr, away_abbr, game_date, game_time)
-        latest_df = pd.concat([home_df, away_df], ignore_index=True)
-
-        for widget in scrollable_table_frame.winfo_children():
-            widget.destroy()
-
-        create_team_tree(home_df, f"    {home_abbr} Boxscore")
-        create_team_tree(away_df, f"    {away_abbr} Boxscore")
-
-        btn_save.config(state="normal")
-        display_stat_leaders_per_team()
-
-        home_pts = pd.to_numeric(home_df["PTS"], errors="coerce").sum()
-        away_pts = pd.to_numeric(away_df["PTS"], errors="coerce").sum()
-        label_score.config(text=f"{home_abbr} {int(home_pts)} - {int(away_pts)} {away_abbr}", font=("Arial", 24, "bold"))
-
-        display_graphs(home_df, away_df)
-
-    except Exception as e:
-        messagebox.showerror("Error", str(e))
-
-def display_stat_leaders_per_team():
-    if latest_df is None:
-        return
-
-    stat_columns = ["PTS", "REB", "AST", "STL", "BLK", "TO", "+/-"]
-
-    for label_dict in [summary_labels_home, summary_labels_away]:
-        for label in label_dict.values():
-            label.config(text="")
-
-    for team in latest_df["Team"].unique():
-        team_df = latest_df[latest_df["Team"] == team].copy()
-
-        for stat in stat_columns:
-            if stat in team_df.columns:
-                team_df[stat] = pd.to_numeric(team_df[stat], errors="coerce")
-
-        leaders = {}
-        for stat in stat_columns:
-            if stat in team_df.columns and team_df[stat].notna().any():
-                max_index = team_df[stat].idxmax()
-                leader_row = team_df.loc[max_index]
-                player = leader_row.get("PLAYER", "Unknown")
-                value = leader_row[stat]
-                leaders[stat] = f"{stat}: {player} ({value})"
-
-        is_home = team_df["Location"].iloc[0] == "Home"
-        label_dict = summary_labels_home if is_home else summary_labels_away
-
-        for i, stat in enumerate(stat_columns):
-            if stat in leaders and stat in label_dict:
-                label_dict[stat].config(text=leaders[stat])
-
-def display_graphs(home_df, away_df):
-    for widget in graph_frame.winfo_children():
-        widget.destroy()
-
-    fig1, ax1 = plt.subplots(figsize=(5, 3))
-    home_pts = pd.to_numeric(home_df["PTS"], errors="coerce")
-    away_pts = pd.to_numeric(away_df["PTS"], errors="coerce")
-    ax1.bar(home_df["PLAYER"], home_pts, label=home_df["Team"].iloc[0])
-    ax1.bar(away_df["PLAYER"], away_pts, label=away_df["Team"].iloc[0])
-    ax1.set_title("Points by Player")
-    ax1.set_ylabel("Points")
-    ax1.set_xticklabels(list(home_df["PLAYER"])+list(away_df["PLAYER"]), rotation=45, ha="right")
-    ax1.legend()
-    fig1.tight_layout()
-    canvas1 = FigureCanvasTkAgg(fig1, master=graph_frame)
-    canvas1.get_tk_widget().pack(pady=5)
-
-    stats = ["PTS", "REB", "AST", "STL", "BLK", "TO"]
-    home_totals = [pd.to_numeric(home_df[stat], errors="coerce").sum() for stat in stats]
-    away_totals = [pd.to_numeric(away_df[stat], errors="coerce").sum() for stat in stats]
-
-    fig2, ax2 = plt.subplots(figsize=(5, 3))
-    bar_width = 0.35
-    index = range(len(stats))
-    ax2.bar(index, home_totals, bar_width, label=home_df["Team"].iloc[0])
-    ax2.bar([i + bar_width for i in index], away_totals, bar_width, label=away_df["Team"].iloc[0])
-    ax2.set_title("Team Stat Comparison")
-    ax2.set_xticks([i + bar_width / 2 for i in index])
-    ax2.set_xticklabels(stats)
-    ax2.legend()
-    fig2.tight_layout()
-    canvas2 = FigureCanvasTkAgg(fig2, master=graph_frame)
-    canvas2.get_tk_widget().pack(pady=5)
-
-def create_team_tree(df, label_text):
-    lbl = tk.Label(scrollable_table_frame, text=label_text, font=("Arial", 10, "bold"), anchor="w")
-    lbl.pack(fill="x", padx=10, pady=(5, 0))
-
-    frame = tk.Frame(scrollable_table_frame)
-    frame.pack(fill="both", expand=True, pady=2)
-
-    tree = ttk.Treeview(frame, show='headings', height=8)
-    tree["columns"] = list(df.columns)
-    for col in df.columns:
-        tree.heading(col, text=col)
-        tree.column(col, width=80, anchor="center")
-
-    for i in df.index:
-        tree.insert("", "end", values=list(df.loc[i]))
-
-    vsb = tk.Scrollbar(frame, orient="vertical", command=tree.yview)
-    hsb = tk.Scrollbar(frame, orient="horizontal", command=tree.xview)
-    tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
-
-    tree.grid(row=0, column=0, sticky="nsew")
-    vsb.grid(row=0, column=1, sticky="ns")
-    hsb.grid(row=1, column=0, sticky="ew")
-    frame.grid_columnconfigure(0, weight=1)
-    frame.grid_rowconfigure(0, weight=1)
-
-# --- GUI Setup ---
-root = tk.Tk()
-root.title("WNBA Boxscore Viewer")
-
-frame_inputs = tk.Frame(root)
-frame_inputs.pack(pady=10)
-
-input_labels = ["Game ID", "Home Abbr", "Away Abbr", "Game Date", "Game Time"]
-entry_vars = []
-
-for i, label in enumerate(input_labels):
-    tk.Label(frame_inputs, text=label).grid(row=i, column=0, sticky="e", padx=5)
-    entry = tk.Entry(frame_inputs)
-    entry.grid(row=i, column=1, padx=5)
-    entry_vars.append(entry)
-
-entry_game_id, entry_home, entry_away, entry_date, entry_time = entry_vars
-
-btn_fetch = tk.Button(frame_inputs, text="Fetch Boxscore", command=show_data)
-btn_fetch.grid(row=len(input_labels), column=0, columnspan=2, pady=5)
-
-btn_save = tk.Button(frame_inputs, text="Save to CSV", command=lambda: None, state="disabled")
-btn_save.grid(row=len(input_labels)+1, column=0, columnspan=2, pady=5)
-
-label_score = tk.Label(root, text="", font=("Arial", 16, "bold"), fg="blue")
-label_score.pack(pady=5)
-
-# Scrollable table section
-container = tk.Frame(root)
-container.pack(fill="both", expand=True)
-
-canvas = tk.Canvas(container)
-x_scrollbar = tk.Scrollbar(container, orient="horizontal", command=canvas.xview)
-y_scrollbar = tk.Scrollbar(container, orient="vertical", command=canvas.yview)
-canvas.configure(xscrollcommand=x_scrollbar.set, yscrollcommand=y_scrollbar.set)
-
-x_scrollbar.pack(side="bottom", fill="x")
-y_scrollbar.pack(side="right", fill="y")
-canvas.pack(side="left", fill="both", expand=True)
-
-scrollable_table_frame = tk.Frame(canvas)
-canvas.create_window((0, 0), window=scrollable_table_frame, anchor="nw")
-scrollable_table_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-
-# Stat Leaders Summary
-summary_title = tk.Label(root, text="Stat Leaders Summary", font=("Arial", 12, "bold"))
-summary_title.pack(pady=3)
-
-frame_summary = tk.Frame(root)
-frame_summary.pack(pady=5, fill="x")
-
-frame_summary_home = tk.LabelFrame(frame_summary, text="Home Leaders", padx=5, pady=3)
-frame_summary_home.pack(side="left", expand=True, fill="x", padx=5)
-
-frame_summary_away = tk.LabelFrame(frame_summary, text="Away Leaders", padx=5, pady=3)
-frame_summary_away.pack(side="left", expand=True, fill="x", padx=5)
-
-summary_stats = ["PTS", "REB", "AST", "STL", "BLK", "TO", "+/-"]
-summary_labels_home = {stat: tk.Label(frame_summary_home, text="", font=("Arial", 8), anchor="center") for stat in summary_stats}
-summary_labels_away = {stat: tk.Label(frame_summary_away, text="", font=("Arial", 8), anchor="center") for stat in summary_stats}
-
-for i, stat in enumerate(summary_stats):
-    summary_labels_home[stat].grid(row=i, column=0, sticky="nsew", pady=1)
-    summary_labels_away[stat].grid(row=i, column=0, sticky="nsew", pady=1)
+    if pool is None:
+        pool = get_default_pool()
 
-frame_summary_home.grid_columnconfigure(0, weight=1)
-frame_summary_away.grid_columnconfigure(0, weight=1)
-
-# Graph Frame
-graph_frame = tk.Frame(root)
-graph_frame.pack(pady=10, fill="x")
-
-latest_df = None
-root.mainloop()
+    try:
+        with pool.session(acquire_timeout, cancel) as driver:
+            with metrics.stage("page_get"):
+                driver.get(url)
+            ready, waited = wait_for_boxscore_tables(driver, wait_timeout, cancel=cancel)
+            metrics.add_stage("wait", waited)
+            page_source = driver.page_source
+            weight = pool.page_weight(driver)
+    except AcquireCancelled as e:
+        raise FetchCancelled("Fetch cancelled.") from e
+
+    browser_record = {"wait_seconds": round(waited, 3), "tables_ready": ready}
+    if weight is not None:
+        # What the browser pulled in besides the HTML we keep; with the lean
+        # profile this is what images, fonts and trackers no longer cost.
+        resources, size, dom_ready, _ = weight
+        metrics.count("resources_loaded", resources)
+        metrics.count("resource_bytes", size)
+        browser_record["dom_ready_ms"] = round(dom_ready) if dom_ready else None
+    return page_source, browser_record
+
+GAME_STATUS_CODES = {1: "scheduled", 2: "live", 3: "final"}
+GAME_STATUS_RE = re.compile(r'"gameStatus"\s*:\s*(\d)')
+FINAL_TEXT_RE = re.compile(r">\s*Final(?:/\d?OT)?\s*<", re.I)
+
+def game_status(page_source):
+    match = GAME_STATUS_RE.search(page_source)
+    if match:
+        return GAME_STATUS_CODES.get(int(match.group(1)))
+    if FINAL_TEXT_RE.search(page_source):
+        return "final"
+    return None
+
+def _parse_counted(page_source):
+    with metrics.stage("parse"):
+        try:
+            return parse_boxscore_html(page_source)
+        except ValueError:
+            metrics.count("parse_failures")
+            raise
+
+def _count_page(page_source):
+    metrics.count("pages_fetched")
+    metrics.count("bytes_fetched", len(page_source.encode("utf-8")))
+
+def get_cleaned_boxscores(game_id, home_abbr, away_abbr, game_date, game_time, pool=None, wait_timeout=15,
+                          backend="auto", fetcher=None, base_url=None, cache=None, offline=False, cancel=None,
+                          slug=None):
+    # backend: "auto" tries the plain HTTP fetch first and only falls back to
+    # the browser when the page has neither the tables nor their JSON data.
+    # Stage timings and counters go into the game's fetch_log record.
+    url = boxscore_url(game_id, home_abbr, away_abbr, base_url, slug)
+    record = fetch_log[game_id] = {"game_id": game_id, "url": url}
+    page_source = frames = None
+
+    with metrics.tracking(record):
+        if cache is not None:
+            with metrics.stage("cache_read"):
+                page_source = cache.get(url, allow_stale=offline)
+            if page_source is not None:
+                record["source"] = "cache"
+                metrics.count("cache_hits")
+                try:
+                    frames = _parse_counted(page_source)
+                except ValueError as e:
+                    # An empty skeleton cached before pages were checked for
+                    # rows; fetch it again.
+                    if offline:
+                        raise
+                    record["cache_error"] = str(e)
+            elif offline:
+                raise LookupError(f"{url} is not in the page cache.")
+
+        if frames is None and backend in ("auto", "http"):
+            from wnba_http import HttpFetchError, get_default_fetcher
+            _check_cancel(cancel)
+            try:
+                with metrics.stage("http_fetch"):
+                    page_source = (fetcher or get_default_fetcher()).fetch(url)
+                _count_page(page_source)
+                frames = _parse_counted(page_source)
+                record["source"] = "http"
+            except (HttpFetchError, ValueError) as e:
+                record["http_error"] = str(e)
+                if backend == "http":
+                    raise
+
+        if frames is None:
+            _check_cancel(cancel)
+            page_source, browser_record = fetch_with_browser(url, pool, wait_timeout, cancel)
+            record.update(browser_record, source="selenium")
+            _count_page(page_source)
+            frames = _parse_counted(page_source)
+
+        record["status"] = game_status(page_source)
+        if cache is not None and record["source"] != "cache":
+            cache.put(url, page_source, record["status"], (game_id, home_abbr, away_abbr, game_date, game_time))
+
+        with metrics.stage("clean"):
+            return clean_boxscores(frames[0], frames[1], game_id, home_abbr, away_abbr, game_date, game_time)
+
+if __name__ == "__main__":
+    from wnba_gui import main
+    main()
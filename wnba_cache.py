@@ -0,0 +1,225 @@
+import argparse
+import gzip
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+DEFAULT_CACHE_DIR = os.environ.get("WNBA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "wnba_boxscore"))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    status TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    game_id TEXT,
+    home_abbr TEXT,
+    away_abbr TEXT,
+    game_date TEXT,
+    game_time TEXT
+);
+CREATE INDEX IF NOT EXISTS pages_digest ON pages (digest);
+CREATE INDEX IF NOT EXISTS pages_accessed ON pages (accessed_at);
+CREATE INDEX IF NOT EXISTS pages_game ON pages (game_id);
+"""
+
+
+class PageCache:
+    """Compressed raw-HTML cache for boxscore pages.
+
+    Pages are stored gzip-compressed under the SHA-256 of their content and
+    indexed by URL in SQLite. Pages of final games never expire; anything
+    else (live, scheduled, unknown) is only served for ``live_ttl`` seconds.
+    Once the blobs exceed ``max_bytes`` the least recently used URLs are
+    evicted.
+    """
+
+    def __init__(self, root=None, max_bytes=512 * 1024 * 1024, live_ttl=60):
+        self.root = root or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.live_ttl = live_ttl
+        os.makedirs(os.path.join(self.root, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(os.path.join(self.root, "index.sqlite"), timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def _blob_path(self, digest):
+        return os.path.join(self.root, "objects", digest[:2], digest + ".html.gz")
+
+    def _is_fresh(self, status, fetched_at, now):
+        return status == "final" or now - fetched_at <= self.live_ttl
+
+    def get(self, url, allow_stale=False):
+        now = time.time()
+        with self._lock:
+            row = self._db.execute("SELECT digest, status, fetched_at FROM pages WHERE url = ?", (url,)).fetchone()
+            if row is None:
+                return None
+            digest, status, fetched_at = row
+            if not allow_stale and not self._is_fresh(status, fetched_at, now):
+                return None
+            self._db.execute("UPDATE pages SET accessed_at = ? WHERE url = ?", (now, url))
+            self._db.commit()
+        try:
+            return self.read_blob(digest)
+        except FileNotFoundError:
+            self.delete(url)
+            return None
+
+    def read_blob(self, digest):
+        with gzip.open(self._blob_path(digest), "rt", encoding="utf-8") as f:
+            return f.read()
+
+    def put(self, url, html, status=None, game=None):
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(tmp, "wb", compresslevel=6) as f:
+                f.write(data)
+            os.replace(tmp, path)
+
+        now = time.time()
+        game = tuple(game or ()) + (None,) * (5 - len(game or ()))
+        with self._lock:
+            old = self._db.execute("SELECT digest FROM pages WHERE url = ?", (url,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, digest, os.path.getsize(path), status, now, now) + game,
+            )
+            self._db.commit()
+            if old and old[0] != digest:
+                self._drop_orphan(old[0])
+        self.evict()
+        return digest
+
+    def delete(self, url):
+        with self._lock:
+            row = self._db.execute("SELECT digest FROM pages WHERE url = ?", (url,)).fetchone()
+            self._db.execute("DELETE FROM pages WHERE url = ?", (url,))
+            self._db.commit()
+            if row:
+                self._drop_orphan(row[0])
+
+    def _drop_orphan(self, digest):
+        if self._db.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone() is None:
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+
+    def total_bytes(self):
+        with self._lock:
+            return self._total_bytes()
+
+    def _total_bytes(self):
+        row = self._db.execute("SELECT SUM(size) FROM (SELECT DISTINCT digest, size FROM pages)").fetchone()
+        return row[0] or 0
+
+    def evict(self):
+        with self._lock:
+            total = self._total_bytes()
+            if total <= self.max_bytes:
+                return 0
+            evicted = 0
+            for url, digest in self._db.execute("SELECT url, digest FROM pages ORDER BY accessed_at").fetchall():
+                if total <= self.max_bytes:
+                    break
+                self._db.execute("DELETE FROM pages WHERE url = ?", (url,))
+                if self._db.execute("SELECT 1 FROM pages WHERE digest = ? LIMIT 1", (digest,)).fetchone() is None:
+                    path = self._blob_path(digest)
+                    try:
+                        total -= os.path.getsize(path)
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                evicted += 1
+            self._db.commit()
+            return evicted
+
+    def entries(self, game_ids=None):
+        query = "SELECT url, digest, status, game_id, home_abbr, away_abbr, game_date, game_time FROM pages"
+        params = ()
+        if game_ids is not None:
+            game_ids = [str(game_id) for game_id in game_ids]
+            query += f" WHERE game_id IN ({','.join('?' * len(game_ids))})"
+            params = tuple(game_ids)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY game_date, game_id", params).fetchall()
+        keys = ["url", "digest", "status", "game_id", "home_abbr", "away_abbr", "game_date", "game_time"]
+        return [dict(zip(keys, row)) for row in rows]
+
+    def stats(self):
+        with self._lock:
+            pages, final = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(status = 'final'), 0) FROM pages"
+            ).fetchone()
+            return {"pages": pages, "final": final, "bytes": self._total_bytes(), "max_bytes": self.max_bytes}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+def replay_cached(cache, game_ids=None, errors=None):
+    # Re-run parse and clean over cached pages without touching the network.
+    import wnba_boxscore as core
+
+    for entry in cache.entries(game_ids):
+        try:
+            page_source = cache.read_blob(entry["digest"])
+            home_df, away_df = core.parse_boxscore_html(page_source)
+            yield entry, core.clean_boxscores(
+                home_df, away_df, entry["game_id"], entry["home_abbr"], entry["away_abbr"],
+                entry["game_date"], entry["game_time"],
+            )
+        except Exception as e:
+            if errors is not None:
+                errors[entry["game_id"] or entry["url"]] = f"{type(e).__name__}: {e}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or replay the raw boxscore page cache.")
+    parser.add_argument("--cache-dir", default=None)
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("stats", help="show cache size and page counts")
+    replay = sub.add_parser("replay", help="re-parse and clean every cached game, offline")
+    replay.add_argument("-o", "--out", default="boxscores.csv")
+    replay.add_argument("game_ids", nargs="*", help="only these games (default: all)")
+    args = parser.parse_args(argv)
+
+    cache = PageCache(args.cache_dir)
+    if args.command == "stats":
+        for key, value in cache.stats().items():
+            print(f"{key}: {value}")
+        return 0
+
+    errors = {}
+    start = time.perf_counter()
+    columns = None
+    games = 0
+    with open(args.out, "w", newline="") as f:
+        for _, (home_df, away_df) in replay_cached(cache, args.game_ids or None, errors):
+            for df in (home_df, away_df):
+                if columns is None:
+                    columns = list(df.columns)
+                    df.to_csv(f, index=False)
+                else:
+                    df.reindex(columns=columns).to_csv(f, header=False, index=False)
+            games += 1
+    print(f"replayed {games} games in {time.perf_counter() - start:.1f}s, {len(errors)} failed", file=sys.stderr)
+    for key, error in errors.items():
+        print(f"  {key}: {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+from matplotlib.figure import Figure
+
+
+class BoxscoreChart:
+    """A figure created once and redrawn in place for every game.
+
+    Uses matplotlib.figure.Figure rather than pyplot so nothing is left in
+    pyplot's figure registry; without a Tk master it renders with Agg.
+    """
+
+    def __init__(self, title, ylabel=None, master=None):
+        self.figure = Figure(figsize=(5, 3), layout="constrained")
+        self.ax = self.figure.add_subplot()
+        self.ax.set_title(title)
+        if ylabel:
+            self.ax.set_ylabel(ylabel)
+        if master is None:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            self.canvas = FigureCanvasAgg(self.figure)
+        else:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+            self.canvas.get_tk_widget().pack(pady=5)
+        self.containers = [None, None]
+
+    def set_bars(self, slot, x, heights, width, label):
+        # Reuse the existing rectangles when the bar count matches; otherwise
+        # swap just this bar container, never the figure.
+        container = self.containers[slot]
+        if container is not None and len(container.patches) == len(heights):
+            for rect, left, height in zip(container.patches, x, heights):
+                rect.set_x(left - width / 2)
+                rect.set_height(height)
+            container.set_label(label)
+        else:
+            if container is not None:
+                container.remove()
+            self.containers[slot] = self.ax.bar(x, heights, width, label=label, color=f"C{slot}")
+
+    def redraw(self):
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.ax.legend(loc="upper right", fontsize=8)
+        self.canvas.draw_idle()
+
+
+class PointsChart(BoxscoreChart):
+    def __init__(self, master=None):
+        super().__init__("Points by Player", "Points", master)
+
+    def update(self, home_df, away_df):
+        home_pts = home_df["PTS"].fillna(0).tolist()
+        away_pts = away_df["PTS"].fillna(0).tolist()
+        positions = list(range(len(home_pts) + len(away_pts)))
+        self.set_bars(0, positions[:len(home_pts)], home_pts, 0.8, home_df["Team"].iloc[0])
+        self.set_bars(1, positions[len(home_pts):], away_pts, 0.8, away_df["Team"].iloc[0])
+        self.ax.set_xticks(positions)
+        self.ax.set_xticklabels(list(home_df["PLAYER"]) + list(away_df["PLAYER"]), rotation=45, ha="right")
+        self.redraw()
+
+
+class TeamStatChart(BoxscoreChart):
+    stats = ["PTS", "REB", "AST", "STL", "BLK", "TO"]
+    bar_width = 0.35
+
+    def __init__(self, master=None):
+        super().__init__("Team Stat Comparison", master=master)
+        index = range(len(self.stats))
+        self.ax.set_xticks([i + self.bar_width / 2 for i in index])
+        self.ax.set_xticklabels(self.stats)
+
+    def update(self, home_df, away_df):
+        index = range(len(self.stats))
+        self.set_bars(0, list(index), home_df[self.stats].sum().tolist(), self.bar_width, home_df["Team"].iloc[0])
+        self.set_bars(1, [i + self.bar_width for i in index], away_df[self.stats].sum().tolist(), self.bar_width,
+                      away_df["Team"].iloc[0])
+        self.redraw()
@@ -0,0 +1,152 @@
+import argparse
+import sys
+import time
+
+# Subcommand modules are imported inside their handlers so that, e.g.,
+# "parse" never loads selenium, aiohttp, matplotlib or Tk.
+TOOLS = {
+    "batch": ("wnba_batch", "scrape many games in parallel"),
+    "sync": ("wnba_sync", "fetch only new, live or failed games into the store"),
+    "cache": ("wnba_cache", "inspect or replay the page cache"),
+    "store": ("wnba_store", "query or export the season store"),
+    "leaders": ("wnba_leaders", "season or date-range leaderboards"),
+    "aggregates": ("wnba_aggregates", "per-player season totals and advanced metrics"),
+    "export": ("wnba_pipeline", "stream many games to CSV, JSON lines or Parquet; resumable"),
+    "manifest": ("wnba_manifest", "crawl the season schedule into a local game index"),
+    "browser": ("wnba_driver_pool", "compare page weight with the full and the lean browser profile"),
+}
+
+
+def parse_command(args):
+    from wnba_boxscore import concat_boxscores
+    from wnba_cache import PageCache, replay_cached
+    from wnba_store import SeasonStore
+
+    cache = PageCache(args.cache_dir)
+    store = SeasonStore(args.store)
+    errors = {}
+    games = 0
+    start = time.perf_counter()
+    for _, frames in replay_cached(cache, args.game_ids or None, errors):
+        store.write_game(concat_boxscores(list(frames)))
+        games += 1
+    print(f"parsed {games} cached games into {store.root} in {time.perf_counter() - start:.2f}s, "
+          f"{len(errors)} failed", file=sys.stderr)
+    for key, error in errors.items():
+        print(f"  {key}: {error}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def fetch_command(args):
+    import wnba_boxscore as core
+    import wnba_metrics as metrics
+    from wnba_cache import PageCache
+    from wnba_store import SeasonStore
+
+    metrics.configure(args.metrics_log, args.metrics_prom)
+    cache = PageCache(args.cache_dir) if args.cache_dir else None
+    try:
+        home_df, away_df = core.get_cleaned_boxscores(
+            args.game_id, args.home_abbr, args.away_abbr, args.game_date, args.game_time,
+            backend=args.backend, base_url=args.base_url, cache=cache,
+        )
+        metrics.emit(dict(core.fetch_log[args.game_id], outcome="ok"))
+    except Exception as e:
+        metrics.emit(dict(core.fetch_log.get(args.game_id, {"game_id": args.game_id}), outcome="error",
+                          error=f"{type(e).__name__}: {e}"))
+        raise
+    finally:
+        if "wnba_driver_pool" in sys.modules:
+            sys.modules["wnba_driver_pool"].close_default_pool()
+        metrics.get_default_sink().close()
+    df = core.concat_boxscores([home_df, away_df])
+    if args.out:
+        df.to_csv(args.out, index=False)
+    if not args.no_store:
+        SeasonStore(args.store).write_game(df)
+    if not args.out:
+        print(df.to_string(index=False))
+    return 0
+
+
+def live_command(args):
+    import wnba_boxscore as core
+    import wnba_live
+    from wnba_store import SeasonStore
+
+    game = (args.game_id, args.home_abbr, args.away_abbr, args.game_date, args.game_time)
+    intervals = {"live": args.interval} if args.interval else None
+
+    def on_update(update):
+        print(f"{wnba_live.score_line(update)}  {wnba_live.format_update(update)}", flush=True)
+
+    source = wnba_live.open_source(game, args.backend, base_url=args.base_url)
+    try:
+        final = wnba_live.LivePoller(game, source, intervals).run(on_update)
+    except KeyboardInterrupt:
+        final = None
+    finally:
+        if "wnba_driver_pool" in sys.modules:
+            sys.modules["wnba_driver_pool"].close_default_pool()
+    if final is not None and not args.no_store:
+        SeasonStore(args.store).write_game(core.concat_boxscores([final.home_df, final.away_df]))
+    return 0
+
+
+def gui_command(args):
+    from wnba_gui import main
+    main()
+    return 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    # Hand the existing tools their own arguments untouched.
+    if argv and argv[0] in TOOLS:
+        import importlib
+        return importlib.import_module(TOOLS[argv[0]][0]).main(argv[1:])
+
+    parser = argparse.ArgumentParser(prog="wnba", description="WNBA boxscore scraper.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    parse = sub.add_parser("parse", help="parse cached boxscore pages into the Parquet store, offline")
+    parse.add_argument("game_ids", nargs="*", help="only these games (default: every cached game)")
+    parse.add_argument("--cache-dir", default=None)
+    parse.add_argument("--store", default=None)
+    parse.set_defaults(handler=parse_command)
+
+    fetch = sub.add_parser("fetch", help="fetch and clean one game")
+    for name in ["game_id", "home_abbr", "away_abbr", "game_date", "game_time"]:
+        fetch.add_argument(name)
+    fetch.add_argument("--backend", choices=["auto", "http", "selenium"], default="auto")
+    fetch.add_argument("--base-url", default=None)
+    fetch.add_argument("--cache-dir", default=None)
+    fetch.add_argument("--store", default=None)
+    fetch.add_argument("--no-store", action="store_true", help="don't write the game to the season store")
+    fetch.add_argument("-o", "--out", help="also write the boxscore to this CSV")
+    fetch.add_argument("--metrics-log", default=None, help="append a JSON line of stage timings")
+    fetch.add_argument("--metrics-prom", default=None, help="write a Prometheus text metrics file")
+    fetch.set_defaults(handler=fetch_command)
+
+    live = sub.add_parser("live", help="follow one game until it is final, printing what changed")
+    for name in ["game_id", "home_abbr", "away_abbr", "game_date", "game_time"]:
+        live.add_argument(name)
+    live.add_argument("--backend", choices=["http", "selenium"], default="selenium")
+    live.add_argument("--base-url", default=None)
+    live.add_argument("--interval", type=float, default=None, help="seconds between polls during play")
+    live.add_argument("--store", default=None)
+    live.add_argument("--no-store", action="store_true", help="don't write the final boxscore to the store")
+    live.set_defaults(handler=live_command)
+
+    gui = sub.add_parser("gui", help="open the boxscore viewer")
+    gui.set_defaults(handler=gui_command)
+
+    for name, (_, help_text) in TOOLS.items():
+        sub.add_parser(name, help=help_text, add_help=False)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
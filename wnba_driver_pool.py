@@ -0,0 +1,316 @@
+import argparse
+import atexit
+import os
+import queue
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.chrome.options import Options
+from webdriver_manager.chrome import ChromeDriverManager
+
+import wnba_metrics as metrics
+
+
+class AcquireCancelled(Exception):
+    pass
+
+# Requests the lean profile never lets out of the browser. Only the DOM of the
+# two boxscore tables matters, so images, fonts, media, stylesheets, ads and
+# analytics are all dead weight. Wildcards as in Network.setBlockedURLs.
+BLOCKED_URL_PATTERNS = [
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.svg*", "*.ico*",
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    "*.mp4*", "*.webm*", "*.m3u8*", "*.mp3*",
+    "*.css*",
+    "*doubleclick.net*", "*googlesyndication.com*", "*googletagmanager.com*", "*googletagservices.com*",
+    "*google-analytics.com*", "*amazon-adsystem.com*", "*adsafeprotected.com*", "*moatads.com*",
+    "*facebook.net*", "*connect.facebook.com*", "*scorecardresearch.com*", "*omtrdc.net*", "*demdex.net*",
+    "*adobedtm.com*", "*everesttech.net*", "*optimizely.com*", "*segment.com*", "*segment.io*",
+    "*hotjar.com*", "*newrelic.com*", "*nr-data.net*", "*chartbeat.*", "*taboola.com*", "*outbrain.com*",
+    "*onetrust.com*", "*cookielaw.org*", "*brightcove*", "*platform.twitter.com*", "*tiktok.com*",
+]
+# Per-browser disk cache; Chrome evicts past this size.
+CACHE_SIZE = 64 * 1024 * 1024
+
+# Bytes and timing of what the current page pulled in, from the Resource
+# Timing API (transferSize is 0 for cache hits).
+PAGE_WEIGHT_JS = """
+const nav = performance.getEntriesByType("navigation")[0];
+const resources = performance.getEntriesByType("resource");
+let bytes = nav ? nav.transferSize || 0 : 0;
+for (const r of resources) bytes += r.transferSize || 0;
+return [resources.length, bytes, nav ? nav.domContentLoadedEventEnd : null, nav ? nav.loadEventEnd : null];
+"""
+
+
+class DriverPool:
+    """Keeps a few warm headless Chrome sessions around for reuse.
+
+    The chromedriver binary is resolved once per pool. A browser is recycled
+    after ``max_pages`` page loads, or immediately if it crashed while in use.
+
+    With ``lean`` (the default) browsers skip images, block the URL patterns
+    in ``blocked_urls``, return from get() once the DOM is ready, and keep
+    their disk cache under ``cache_dir`` (capped at ``cache_size`` bytes per
+    browser, removed when the pool closes).
+    """
+
+    def __init__(self, size=1, max_pages=50, headless=True, lean=True, blocked_urls=None, cache_dir=None,
+                 cache_size=CACHE_SIZE):
+        self.size = size
+        self.max_pages = max_pages
+        self.headless = headless
+        self.lean = lean
+        self.blocked_urls = BLOCKED_URL_PATTERNS if blocked_urls is None else list(blocked_urls)
+        self.cache_dir = cache_dir or os.environ.get("WNBA_CHROME_CACHE") or os.path.join(
+            tempfile.gettempdir(), "wnba-chrome-cache")
+        self.cache_size = cache_size
+        self._slots = {}
+        self._driver_path = None
+        self._idle = queue.LifoQueue()
+        self._pages = {}
+        self._live = 0
+        self._resolve_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._slot_free = threading.Condition(self._lock)
+        self._closed = False
+
+    def driver_path(self):
+        with self._resolve_lock:
+            if self._driver_path is None:
+                with metrics.stage("driver_install"):
+                    self._driver_path = ChromeDriverManager().install()
+            return self._driver_path
+
+    def chrome_options(self, cache_path=None):
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        if self.lean:
+            options.page_load_strategy = "eager"
+            options.add_experimental_option("prefs", {
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            options.add_argument("--blink-settings=imagesEnabled=false")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--mute-audio")
+            if cache_path:
+                options.add_argument(f"--disk-cache-dir={cache_path}")
+                options.add_argument(f"--disk-cache-size={self.cache_size}")
+        return options
+
+    def _cache_slot(self):
+        # Browsers running side by side each get their own cache directory;
+        # a replacement browser reuses the directory of the one it replaces.
+        with self._lock:
+            free = set(range(self.size)) - set(self._slots.values())
+            slot = min(free) if free else len(self._slots)
+            self._slots[("launching", slot)] = slot
+            return slot, os.path.join(self.cache_dir, f"{os.getpid()}-{id(self):x}-{slot}")
+
+    def _launch(self):
+        service = Service(self.driver_path())
+        slot, cache_path = self._cache_slot() if self.lean else (None, None)
+        try:
+            with metrics.stage("browser_launch"):
+                driver = webdriver.Chrome(service=service, options=self.chrome_options(cache_path))
+        except Exception:
+            self._slots.pop(("launching", slot), None)
+            raise
+        if self.lean and self.blocked_urls:
+            try:
+                driver.execute_cdp_cmd("Network.enable", {})
+                driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_urls})
+            except Exception:
+                # Images are still off through the prefs; the page just loads heavier.
+                pass
+        self._pages[id(driver)] = 0
+        if slot is not None:
+            with self._lock:
+                self._slots[id(driver)] = self._slots.pop(("launching", slot))
+        return driver
+
+    def page_weight(self, driver):
+        """(resources, bytes transferred, DOM-ready ms, load ms) for the page ``driver`` is on."""
+        try:
+            resources, size, dom_ready, loaded = driver.execute_script(PAGE_WEIGHT_JS)
+        except Exception:
+            return None
+        return int(resources), int(size), dom_ready, loaded
+
+    def warm(self, count=None):
+        # Start browsers up front so the first fetch doesn't pay for the launch.
+        count = self.size if count is None else min(count, self.size)
+        drivers = [self.acquire() for _ in range(count)]
+        for driver in drivers:
+            self.release(driver)
+
+    def acquire(self, timeout=None, cancel=None):
+        # cancel: an Event checked while waiting for a browser to come free.
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._slot_free:
+            if self._closed:
+                raise RuntimeError("Driver pool is closed.")
+            while self._idle.empty() and self._live >= self.size:
+                if cancel is not None and cancel.is_set():
+                    raise AcquireCancelled("Cancelled while waiting for a browser.")
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError("No browser became free in time.")
+                if cancel is not None:
+                    remaining = 0.25 if remaining is None else min(remaining, 0.25)
+                self._slot_free.wait(remaining)
+            if not self._idle.empty():
+                return self._idle.get_nowait()
+            self._live += 1
+        try:
+            return self._launch()
+        except Exception:
+            with self._slot_free:
+                self._live -= 1
+                self._slot_free.notify()
+            raise
+
+    def release(self, driver, broken=False):
+        pages = self._pages.get(id(driver), 0) + 1
+        if broken or self._closed or pages >= self.max_pages:
+            self._discard(driver)
+            return
+        self._pages[id(driver)] = pages
+        with self._slot_free:
+            self._idle.put(driver)
+            self._slot_free.notify()
+
+    def _discard(self, driver):
+        self._pages.pop(id(driver), None)
+        self._slots.pop(id(driver), None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._slot_free:
+            self._live -= 1
+            self._slot_free.notify()
+
+    @contextmanager
+    def session(self, timeout=None, cancel=None):
+        driver = self.acquire(timeout, cancel)
+        try:
+            yield driver
+        except WebDriverException:
+            self.release(driver, broken=not _is_alive(driver))
+            raise
+        except BaseException:
+            self.release(driver)
+            raise
+        else:
+            self.release(driver)
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+        if self.lean:
+            prefix = f"{os.getpid()}-{id(self):x}-"
+            for name in os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else []:
+                if name.startswith(prefix):
+                    shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+
+
+def _is_alive(driver):
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool():
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None or _default_pool._closed:
+            _default_pool = DriverPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
+
+
+def close_default_pool():
+    with _default_pool_lock:
+        if _default_pool is not None:
+            _default_pool.close()
+
+
+def measure_page(pool, url, wait_timeout=15):
+    """Load ``url`` in a fresh, cache-disabled browser from ``pool``.
+
+    Returns (seconds until the boxscore tables are in the DOM, page weight).
+    """
+    from wnba_boxscore import wait_for_boxscore_tables
+
+    driver = pool.acquire()
+    try:
+        try:
+            driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        except Exception:
+            pass
+        start = time.perf_counter()
+        driver.get(url)
+        wait_for_boxscore_tables(driver, wait_timeout)
+        seconds = time.perf_counter() - start
+        return seconds, pool.page_weight(driver)
+    finally:
+        pool.release(driver, broken=True)
+
+
+def compare_profiles(urls, wait_timeout=15):
+    """Yield (url, full, lean) measurements, each a (seconds, page weight) pair."""
+    full, lean = DriverPool(lean=False), DriverPool(lean=True)
+    try:
+        for url in urls:
+            yield url, measure_page(full, url, wait_timeout), measure_page(lean, url, wait_timeout)
+    finally:
+        full.close()
+        lean.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare page loads with the full and the lean browser profile.")
+    parser.add_argument("urls", nargs="+", help="boxscore page URLs")
+    parser.add_argument("--wait-timeout", type=float, default=15)
+    args = parser.parse_args(argv)
+
+    print(f"{'full KB':>9} {'lean KB':>9} {'saved KB':>9} {'full s':>7} {'lean s':>7} {'saved s':>8}  url")
+    totals = [0, 0, 0.0, 0.0]
+    for url, (full_s, full_w), (lean_s, lean_w) in compare_profiles(args.urls, args.wait_timeout):
+        full_b, lean_b = (full_w or (0, 0))[1], (lean_w or (0, 0))[1]
+        print(f"{full_b / 1024:9.0f} {lean_b / 1024:9.0f} {(full_b - lean_b) / 1024:9.0f} "
+              f"{full_s:7.2f} {lean_s:7.2f} {full_s - lean_s:8.2f}  {url}")
+        for i, value in enumerate([full_b, lean_b, full_s, lean_s]):
+            totals[i] += value
+    pages = len(args.urls)
+    print(f"per page: {(totals[0] - totals[1]) / 1024 / pages:.0f} KB and "
+          f"{(totals[2] - totals[3]) / pages:.2f}s saved")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,506 @@
+import queue
+import sys
+import threading
+import tkinter as tk
+from tkinter import ttk, messagebox, filedialog
+
+import wnba_boxscore as core
+import wnba_live
+import wnba_metrics as metrics
+from wnba_charts import PointsChart, TeamStatChart
+from wnba_leaders import game_leaders
+from wnba_store import SeasonStore
+
+# Background fetching
+class FetchWorker:
+    """Runs queued fetches one at a time off the Tk thread.
+
+    Results are posted to ``results`` for the GUI to pick up from a
+    root.after poll; Tk widgets are never touched from the worker.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.generation = 0
+        self.current = None
+        self._current_cancel = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, game):
+        self.jobs.put((self.generation, game))
+
+    def pending(self):
+        return self.jobs.qsize()
+
+    def cancel_all(self):
+        # Queued jobs from older generations are skipped; the running one is
+        # interrupted at its next cancellation check.
+        self.generation += 1
+        if self._current_cancel is not None:
+            self._current_cancel.set()
+
+    def stop(self):
+        self.cancel_all()
+        self.jobs.put(None)
+
+    def _run(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            generation, game = job
+            if generation != self.generation:
+                self.results.put(("cancelled", game, None))
+                continue
+            self.current, self._current_cancel = game, threading.Event()
+            self.results.put(("started", game, None))
+            try:
+                home_df, away_df = core.get_cleaned_boxscores(*game, cancel=self._current_cancel)
+                core._check_cancel(self._current_cancel)
+                self.store.write_game(core.concat_boxscores([home_df, away_df]))
+                # The record is emitted once the GUI has rendered the game.
+                result = ("done", game, (home_df, away_df, dict(core.fetch_log.get(game[0], {}))))
+            except core.FetchCancelled:
+                result = ("cancelled", game, None)
+            except Exception as e:
+                result = ("error", game, str(e))
+                metrics.emit(dict(core.fetch_log.get(game[0], {"game_id": game[0]}), outcome="error", error=str(e)))
+            self.current = self._current_cancel = None
+            self.results.put(result)
+
+class LiveWorker:
+    """Polls one game in a single browser tab until it is final.
+
+    Updates are posted to the shared results queue as ("live", game,
+    LiveUpdate); the final frames are written to the store.
+    """
+
+    def __init__(self, game, results, store, backend="selenium"):
+        self.game = game
+        self.results = results
+        self.store = store
+        self.backend = backend
+        self.phase = "starting"
+        self.next_poll = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def running(self):
+        return self._thread.is_alive()
+
+    def _post(self, update):
+        self.phase, self.next_poll = update.phase, update.interval
+        self.results.put(("live", self.game, update))
+
+    def _run(self):
+        try:
+            source = wnba_live.open_source(self.game, self.backend)
+            final = wnba_live.LivePoller(self.game, source).run(self._post, self._stop)
+            if final is not None:
+                self.store.write_game(core.concat_boxscores([final.home_df, final.away_df]))
+            self.results.put(("live_done", self.game, "final" if final is not None else "stopped"))
+        except Exception as e:
+            self.results.put(("live_done", self.game, f"stopped: {e}"))
+
+def show_data():
+    game = (entry_game_id.get(), entry_home.get(), entry_away.get(), entry_date.get(), entry_time.get())
+    if not game[0]:
+        return
+    worker.submit(game)
+    update_status()
+
+def toggle_live():
+    global live_worker
+    if live_worker is not None and live_worker.running():
+        live_worker.stop()
+        update_status("Stopping live updates...")
+        return
+    game = (entry_game_id.get(), entry_home.get(), entry_away.get(), entry_date.get(), entry_time.get())
+    if not game[0]:
+        return
+    live_worker = LiveWorker(game, worker.results, store)
+    btn_live.config(text="Stop Live")
+    update_status()
+
+def apply_live_update(game, update):
+    # The first poll, or a roster change, rebuilds the tables; after that
+    # only the changed cells, leader labels and bars are touched.
+    global latest_df
+
+    diff = update.diff
+    showing = latest_df is not None and str(latest_df["Game ID"].iloc[0]) == str(game[0])
+    if diff["added"] or diff["removed"] or not showing:
+        render_boxscores(game, update.home_df, update.away_df)
+        return
+    latest_df = core.concat_boxscores([update.home_df, update.away_df])
+    if not diff["changed"]:
+        return
+    for panel, df in [(home_panel, update.home_df), (away_panel, update.away_df)]:
+        team = df["Team"].iloc[0]
+        changes = {player: cells for (row_team, player), cells in diff["changed"].items() if row_team == team}
+        if changes:
+            panel.update_cells(df, changes)
+    display_stat_leaders_per_team()
+    home_pts, away_pts = update.home_df["PTS"].sum(), update.away_df["PTS"].sum()
+    label_score.config(text=f"{game[1]} {int(home_pts)} - {int(away_pts)} {game[2]}")
+    charted = set(TeamStatChart.stats) | {"PTS"}
+    if any(charted.intersection(cells) for cells in diff["changed"].values()):
+        display_graphs(update.home_df, update.away_df)
+
+def cancel_fetches():
+    worker.cancel_all()
+    update_status("Cancelling...")
+
+def update_status(text=None):
+    busy = worker.current is not None or worker.pending() > 0
+    if text is None:
+        if worker.current is not None:
+            queued = worker.pending()
+            text = f"Fetching {worker.current[0]}" + (f" ({queued} queued)" if queued else "")
+        elif live_worker is not None and live_worker.running():
+            text = f"Live {live_worker.game[0]}: {live_worker.phase}"
+            if live_worker.next_poll:
+                text += f", next poll in {live_worker.next_poll:.0f}s"
+        else:
+            text = "Ready"
+    label_status.config(text=text)
+    btn_cancel.config(state="normal" if busy else "disabled")
+    if busy:
+        progress.start(15)
+    else:
+        progress.stop()
+
+def poll_fetch_results():
+    try:
+        while True:
+            kind, game, payload = worker.results.get_nowait()
+            if kind == "done":
+                render_boxscores(game, *payload)
+            elif kind == "live":
+                apply_live_update(game, payload)
+            elif kind == "live_done":
+                btn_live.config(text="Live")
+                update_status(f"Live {game[0]} {payload}")
+                continue
+            elif kind == "error":
+                messagebox.showerror("Error", f"{game[0]}: {payload}")
+            update_status()
+    except queue.Empty:
+        pass
+    root.after(100, poll_fetch_results)
+
+def render_boxscores(game, home_df, away_df, record=None):
+    # Rebuild one section per idle callback so Tk keeps handling events
+    # between the tables, the leaders and the graphs.
+    global latest_df
+
+    _, home_abbr, away_abbr = game[:3]
+    latest_df = core.concat_boxscores([home_df, away_df])
+    record = dict(record or {"game_id": game[0]}, outcome="ok")
+
+    def tables():
+        with metrics.stage("gui_tables", record):
+            home_panel.set_title(f"    {home_abbr} Boxscore")
+            home_panel.set_frame(home_df)
+            away_panel.set_title(f"    {away_abbr} Boxscore")
+            away_panel.set_frame(away_df)
+            btn_save.config(state="normal")
+        root.after_idle(leaders)
+
+    def leaders():
+        with metrics.stage("gui_leaders", record):
+            display_stat_leaders_per_team()
+            home_pts = home_df["PTS"].sum()
+            away_pts = away_df["PTS"].sum()
+            label_score.config(text=f"{home_abbr} {int(home_pts)} - {int(away_pts)} {away_abbr}", font=("Arial", 24, "bold"))
+        root.after_idle(graphs)
+
+    def graphs():
+        with metrics.stage("gui_graphs", record):
+            display_graphs(home_df, away_df)
+        metrics.emit(record)
+
+    tables()
+
+def save_csv():
+    if latest_df is None:
+        return
+    game_id = latest_df["Game ID"].iloc[0]
+    path = filedialog.asksaveasfilename(defaultextension=".csv", initialfile=f"boxscore_{game_id}.csv",
+                                        filetypes=[("CSV files", "*.csv")])
+    if not path:
+        return
+    try:
+        store.export_csv(path, game_ids=[game_id])
+    except Exception as e:
+        messagebox.showerror("Error", str(e))
+
+def display_stat_leaders_per_team():
+    if latest_df is None:
+        return
+
+    texts = {}
+    for row in game_leaders(latest_df, keys=["Team", "Location"]).itertuples(index=False):
+        label_dict = summary_labels_home if row.Location == "Home" else summary_labels_away
+        if row.stat in label_dict:
+            texts[label_dict[row.stat]] = f"{row.stat}: {row.PLAYER} ({row.value})"
+
+    # Only labels whose text changed are reconfigured (live updates call
+    # this on every poll).
+    for label_dict in [summary_labels_home, summary_labels_away]:
+        for label in label_dict.values():
+            text = texts.get(label, "")
+            if label.cget("text") != text:
+                label.config(text=text)
+
+def display_graphs(home_df, away_df):
+    points_chart.update(home_df, away_df)
+    team_chart.update(home_df, away_df)
+
+def frame_rows(df, start=0, stop=None):
+    # Treeview values for a slice of the frame: one decimal, NA as blank.
+    part = df.iloc[start:stop]
+    floats = part.select_dtypes("float32").columns
+    part = part.astype(dict.fromkeys(floats, "float64")).round(1).astype(object)
+    return part.where(part.notna(), "").itertuples(index=False, name=None)
+
+class TablePanel:
+    """A labelled Treeview built once and refilled for every frame shown.
+
+    Frames longer than ``page_size`` rows are paged: only the visible page is
+    turned into Treeview items.
+    """
+
+    def __init__(self, parent, title="", height=8, page_size=250):
+        self.page_size = page_size
+        self.df = None
+        self.page = 0
+        self.items = {}
+
+        self.label = tk.Label(parent, text=title, font=("Arial", 10, "bold"), anchor="w")
+        self.label.pack(fill="x", padx=10, pady=(5, 0))
+
+        self.frame = tk.Frame(parent)
+        self.frame.pack(fill="both", expand=True, pady=2)
+
+        self.tree = ttk.Treeview(self.frame, show='headings', height=height)
+        vsb = tk.Scrollbar(self.frame, orient="vertical", command=self.tree.yview)
+        hsb = tk.Scrollbar(self.frame, orient="horizontal", command=self.tree.xview)
+        self.tree.configure(yscrollcommand=vsb.set, xscrollcommand=hsb.set)
+
+        self.tree.grid(row=0, column=0, sticky="nsew")
+        vsb.grid(row=0, column=1, sticky="ns")
+        hsb.grid(row=1, column=0, sticky="ew")
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.frame.grid_rowconfigure(0, weight=1)
+
+        self.pager = tk.Frame(self.frame)
+        tk.Button(self.pager, text="<", width=3, command=lambda: self.show_page(self.page - 1)).pack(side="left")
+        self.page_label = tk.Label(self.pager, text="", font=("Arial", 8))
+        self.page_label.pack(side="left", padx=5)
+        tk.Button(self.pager, text=">", width=3, command=lambda: self.show_page(self.page + 1)).pack(side="left")
+
+    def set_title(self, text):
+        self.label.config(text=text)
+
+    def set_frame(self, df):
+        columns = [str(col) for col in df.columns]
+        if columns != list(self.tree["columns"]):
+            self.tree.delete(*self.tree.get_children())
+            self.tree["columns"] = columns
+            for col in columns:
+                self.tree.heading(col, text=col)
+                self.tree.column(col, width=80, anchor="center")
+        self.df = df
+        if len(df) > self.page_size:
+            self.pager.grid(row=2, column=0, columnspan=2, pady=2)
+        else:
+            self.pager.grid_remove()
+        self.show_page(0)
+
+    def page_count(self):
+        return max(1, -(-len(self.df) // self.page_size))
+
+    def rows(self, start=0, stop=None):
+        return frame_rows(self.df, start, stop)
+
+    def update_cells(self, df, changes):
+        """Swap in a new frame with the same rows, setting only changed cells.
+
+        ``changes`` maps PLAYER to the changed column names; players not on
+        the visible page are picked up when their page is shown.
+        """
+        self.df = df
+        positions = {player: i for i, player in enumerate(df["PLAYER"])}
+        columns = [str(col) for col in df.columns]
+        for player, cells in changes.items():
+            item = self.items.get(player)
+            if item is None:
+                continue
+            row = positions[player]
+            values = next(frame_rows(df, row, row + 1))
+            for col in cells:
+                self.tree.set(item, str(col), values[columns.index(str(col))])
+
+    def show_page(self, page):
+        if self.df is None:
+            return
+        self.page = min(max(page, 0), self.page_count() - 1)
+        start = self.page * self.page_size
+        self.tree.delete(*self.tree.get_children())
+        stop = start + self.page_size
+        keys = self.df["PLAYER"].iloc[start:stop] if "PLAYER" in self.df.columns else range(start, stop)
+        self.items = {}
+        for key, values in zip(keys, self.rows(start, stop)):
+            self.items[key] = self.tree.insert("", "end", values=values)
+        self.page_label.config(
+            text=f"rows {start + 1}-{min(start + self.page_size, len(self.df))} of {len(self.df)}"
+        )
+
+def show_season_log():
+    # Browse every stored row for the team in Home Abbr (or all teams) in a
+    # paged panel.
+    team = entry_home.get().strip() or None
+    try:
+        df = store.read(team=team)
+    except Exception as e:
+        messagebox.showerror("Error", str(e))
+        return
+    window = tk.Toplevel(root)
+    window.title(f"Season Log - {team or 'All Teams'}")
+    panel = TablePanel(window, f"    {len(df)} rows", height=25)
+    panel.set_frame(df)
+
+def warm_browser():
+    try:
+        from wnba_driver_pool import get_default_pool
+        get_default_pool().warm()
+    except Exception:
+        pass  # the next fetch will report the launch error
+
+def on_close():
+    worker.stop()
+    if live_worker is not None:
+        live_worker.stop()
+    # Only shut the browser down if one was ever started.
+    if "wnba_driver_pool" in sys.modules:
+        sys.modules["wnba_driver_pool"].close_default_pool()
+    root.destroy()
+
+def main():
+    global root, entry_game_id, entry_home, entry_away, entry_date, entry_time, btn_cancel, btn_save, btn_live
+    global progress, label_status, label_score, home_panel, away_panel, summary_labels_home, summary_labels_away
+    global points_chart, team_chart, latest_df, store, worker, live_worker
+
+    # --- GUI Setup ---
+    root = tk.Tk()
+    root.title("WNBA Boxscore Viewer")
+    root.protocol("WM_DELETE_WINDOW", on_close)
+
+    frame_inputs = tk.Frame(root)
+    frame_inputs.pack(pady=10)
+
+    input_labels = ["Game ID", "Home Abbr", "Away Abbr", "Game Date", "Game Time"]
+    entry_vars = []
+
+    for i, label in enumerate(input_labels):
+        tk.Label(frame_inputs, text=label).grid(row=i, column=0, sticky="e", padx=5)
+        entry = tk.Entry(frame_inputs)
+        entry.grid(row=i, column=1, padx=5)
+        entry_vars.append(entry)
+
+    entry_game_id, entry_home, entry_away, entry_date, entry_time = entry_vars
+
+    btn_fetch = tk.Button(frame_inputs, text="Fetch Boxscore", command=show_data)
+    btn_fetch.grid(row=len(input_labels), column=0, pady=5)
+
+    btn_cancel = tk.Button(frame_inputs, text="Cancel", command=cancel_fetches, state="disabled")
+    btn_cancel.grid(row=len(input_labels), column=1, pady=5)
+
+    btn_save = tk.Button(frame_inputs, text="Save to CSV", command=save_csv, state="disabled")
+    btn_save.grid(row=len(input_labels)+1, column=0, pady=5)
+
+    btn_season = tk.Button(frame_inputs, text="Season Log", command=show_season_log)
+    btn_season.grid(row=len(input_labels)+1, column=1, pady=5)
+
+    btn_live = tk.Button(frame_inputs, text="Live", command=toggle_live)
+    btn_live.grid(row=len(input_labels)+2, column=0, columnspan=2, pady=5)
+
+    progress = ttk.Progressbar(frame_inputs, mode="indeterminate", length=160)
+    progress.grid(row=len(input_labels)+3, column=0, columnspan=2, pady=(5, 0))
+
+    label_status = tk.Label(frame_inputs, text="Ready", font=("Arial", 8))
+    label_status.grid(row=len(input_labels)+4, column=0, columnspan=2)
+
+    label_score = tk.Label(root, text="", font=("Arial", 16, "bold"), fg="blue")
+    label_score.pack(pady=5)
+
+    # Scrollable table section
+    container = tk.Frame(root)
+    container.pack(fill="both", expand=True)
+
+    canvas = tk.Canvas(container)
+    x_scrollbar = tk.Scrollbar(container, orient="horizontal", command=canvas.xview)
+    y_scrollbar = tk.Scrollbar(container, orient="vertical", command=canvas.yview)
+    canvas.configure(xscrollcommand=x_scrollbar.set, yscrollcommand=y_scrollbar.set)
+
+    x_scrollbar.pack(side="bottom", fill="x")
+    y_scrollbar.pack(side="right", fill="y")
+    canvas.pack(side="left", fill="both", expand=True)
+
+    scrollable_table_frame = tk.Frame(canvas)
+    canvas.create_window((0, 0), window=scrollable_table_frame, anchor="nw")
+    scrollable_table_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+
+    home_panel = TablePanel(scrollable_table_frame)
+    away_panel = TablePanel(scrollable_table_frame)
+
+    # Stat Leaders Summary
+    summary_title = tk.Label(root, text="Stat Leaders Summary", font=("Arial", 12, "bold"))
+    summary_title.pack(pady=3)
+
+    frame_summary = tk.Frame(root)
+    frame_summary.pack(pady=5, fill="x")
+
+    frame_summary_home = tk.LabelFrame(frame_summary, text="Home Leaders", padx=5, pady=3)
+    frame_summary_home.pack(side="left", expand=True, fill="x", padx=5)
+
+    frame_summary_away = tk.LabelFrame(frame_summary, text="Away Leaders", padx=5, pady=3)
+    frame_summary_away.pack(side="left", expand=True, fill="x", padx=5)
+
+    summary_stats = ["PTS", "REB", "AST", "STL", "BLK", "TO", "+/-"]
+    summary_labels_home = {stat: tk.Label(frame_summary_home, text="", font=("Arial", 8), anchor="center") for stat in summary_stats}
+    summary_labels_away = {stat: tk.Label(frame_summary_away, text="", font=("Arial", 8), anchor="center") for stat in summary_stats}
+
+    for i, stat in enumerate(summary_stats):
+        summary_labels_home[stat].grid(row=i, column=0, sticky="nsew", pady=1)
+        summary_labels_away[stat].grid(row=i, column=0, sticky="nsew", pady=1)
+
+    frame_summary_home.grid_columnconfigure(0, weight=1)
+    frame_summary_away.grid_columnconfigure(0, weight=1)
+
+    # Graph Frame
+    graph_frame = tk.Frame(root)
+    graph_frame.pack(pady=10, fill="x")
+
+    points_chart = PointsChart(graph_frame)
+    team_chart = TeamStatChart(graph_frame)
+
+    latest_df = None
+    store = SeasonStore()
+    worker = FetchWorker(store)
+    live_worker = None
+    root.after(100, poll_fetch_results)
+    # Start the shared browser in the background so the first fetch finds it warm.
+    threading.Thread(target=warm_browser, daemon=True).start()
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
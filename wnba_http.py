@@ -0,0 +1,105 @@
+import asyncio
+import atexit
+import threading
+
+import aiohttp
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/json;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+class HttpFetchError(Exception):
+    pass
+
+
+class HttpFetcher:
+    """Browser-free page fetcher backed by one pooled keep-alive aiohttp session.
+
+    The session lives on a private event loop thread so synchronous callers
+    (the GUI, get_cleaned_boxscores) share its connections with the async
+    fan-out in fetch_many.
+    """
+
+    def __init__(self, concurrency=8, timeout=20, headers=None):
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+        self._loop = None
+        self._thread = None
+        self._session = None
+        self._semaphore = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+                self._thread.start()
+            return self._loop
+
+    async def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+        return self._session
+
+    async def fetch_async(self, url):
+        session = await self._get_session()
+        async with self._semaphore:
+            try:
+                async with session.get(url) as response:
+                    if response.status != 200:
+                        raise HttpFetchError(f"{url} returned HTTP {response.status}")
+                    return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                raise HttpFetchError(f"{url}: {e or type(e).__name__}") from e
+
+    async def fetch_many_async(self, urls):
+        return await asyncio.gather(*(self.fetch_async(url) for url in urls), return_exceptions=True)
+
+    def _run(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result()
+
+    def fetch(self, url):
+        return self._run(self.fetch_async(url))
+
+    def fetch_many(self, urls):
+        # Results line up with urls; failed fetches come back as exceptions.
+        return self._run(self.fetch_many_async(list(urls)))
+
+    def close(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None:
+            return
+        if self._session is not None:
+            asyncio.run_coroutine_threadsafe(self._session.close(), loop).result()
+            self._session = None
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5)
+        loop.close()
+
+
+_default_fetcher = None
+_default_fetcher_lock = threading.Lock()
+
+
+def get_default_fetcher():
+    global _default_fetcher
+    with _default_fetcher_lock:
+        if _default_fetcher is None:
+            _default_fetcher = HttpFetcher()
+            atexit.register(_default_fetcher.close)
+        return _default_fetcher
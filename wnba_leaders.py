@@ -0,0 +1,176 @@
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+LEADER_STATS = ["PTS", "REB", "AST", "STL", "BLK", "TO", "+/-"]
+BOARD_STATS = ["PTS", "REB", "AST", "STL", "BLK", "TO", "+/-", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA", "MIN"]
+
+
+def game_leaders(df, stats=LEADER_STATS, keys=("Game ID", "Team")):
+    """Leader of every stat for every group in ``keys``, in one pass.
+
+    Returns one row per (keys..., stat) with the leading PLAYER and value.
+    Ties go to the player listed first, as idxmax did.
+    """
+    keys = list(keys)
+    present = [stat for stat in stats if stat in df.columns]
+    if df.empty or not present:
+        return pd.DataFrame(columns=keys + ["stat", "PLAYER", "value"])
+    long = df[keys + ["PLAYER"] + present].melt(id_vars=keys + ["PLAYER"], var_name="stat", value_name="value")
+    long = long.dropna(subset=["value"]).sort_values("value", ascending=False, kind="stable")
+    leaders = long.drop_duplicates(subset=keys + ["stat"], keep="first")
+    order = {stat: i for i, stat in enumerate(present)}
+    return leaders.sort_values(keys + ["stat"], key=lambda col: col.map(order) if col.name == "stat" else col,
+                               kind="stable").reset_index(drop=True)
+
+
+def _game_days(df):
+    if "Date" in df.columns:
+        return pd.to_datetime(df["Date"])
+    return pd.to_datetime(df["Game Date"], errors="coerce")
+
+
+class Leaderboard:
+    """Top-k leaderboards over per-player cumulative daily totals.
+
+    The frame is reduced once to a (stat, player, day) array of running
+    totals, so any date range is a subtraction of two columns and a top-k is
+    an argpartition over players.
+    """
+
+    def __init__(self, df, stats=BOARD_STATS):
+        self.stats = [stat for stat in stats if stat in df.columns]
+        days = _game_days(df)
+        played = ~df["DNP"].astype(bool) if "DNP" in df.columns else df[self.stats].notna().any(axis=1)
+        frame = df[["PLAYER"] + self.stats].astype({stat: "float64" for stat in self.stats}).fillna(0)
+        frame["GP"] = played.astype("int32").to_numpy()
+        frame["Day"] = days.to_numpy()
+        frame = frame.dropna(subset=["Day"])
+
+        daily = frame.groupby(["PLAYER", "Day"], sort=True)[self.stats + ["GP"]].sum()
+        self.players = daily.index.levels[0].to_numpy()
+        self.days = np.sort(frame["Day"].unique()).astype("datetime64[ns]")
+        player_codes = daily.index.codes[0]
+        day_codes = np.searchsorted(self.days, daily.index.get_level_values("Day").to_numpy())
+
+        values = np.zeros((len(self.stats) + 1, len(self.players), len(self.days) + 1))
+        values[:, player_codes, day_codes + 1] = daily.to_numpy().T
+        self.cumulative = values.cumsum(axis=2)
+        self._stat_index = {stat: i for i, stat in enumerate(self.stats + ["GP"])}
+
+        last = frame.sort_values("Day", kind="stable").drop_duplicates("PLAYER", keep="last")
+        team = df.loc[last.index, "Team"].astype(str) if "Team" in df.columns else pd.Series("", index=last.index)
+        self.teams = pd.Series(team.to_numpy(), index=last["PLAYER"].to_numpy()).reindex(self.players).to_numpy()
+
+    def _range(self, start, end):
+        i = 0 if start is None else np.searchsorted(self.days, np.datetime64(pd.Timestamp(start), "ns"), "left")
+        j = len(self.days) if end is None else np.searchsorted(self.days, np.datetime64(pd.Timestamp(end), "ns"), "right")
+        return i, j
+
+    def totals(self, stat, start=None, end=None):
+        i, j = self._range(start, end)
+        row = self.cumulative[self._stat_index[stat]]
+        return row[:, j] - row[:, i]
+
+    def top(self, stat, k=10, start=None, end=None, per_game=False, min_games=1, ascending=False):
+        if stat not in self._stat_index:
+            raise KeyError(f"{stat} is not tracked; choose from {', '.join(self.stats)}.")
+        totals = self.totals(stat, start, end)
+        games = self.totals("GP", start, end)
+        values = np.divide(totals, games, out=np.zeros_like(totals), where=games > 0) if per_game else totals
+        eligible = np.flatnonzero(games >= min_games)
+        if not len(eligible):
+            return pd.DataFrame(columns=["Rank", "PLAYER", "Team", "GP", stat])
+        keys = values[eligible] if ascending else -values[eligible]
+        k = min(k, len(eligible))
+        best = np.argpartition(keys, k - 1)[:k]
+        best = eligible[best[np.argsort(keys[best], kind="stable")]]
+        return pd.DataFrame({
+            "Rank": np.arange(1, k + 1),
+            "PLAYER": self.players[best],
+            "Team": self.teams[best],
+            "GP": games[best].astype(int),
+            stat: np.round(values[best], 1) if per_game else values[best].astype(int),
+        })
+
+
+class Leaderboards:
+    """Season and date-range leaderboards over the whole Parquet store.
+
+    Boards are built from the per-season game logs the season aggregates
+    keep next to the store, so only games added or rewritten since the last
+    run are read from Parquet. A board is kept until the store's files for
+    its season change; ranges that span seasons use a board over every
+    season.
+    """
+
+    def __init__(self, store, stats=BOARD_STATS):
+        self.store = store
+        self.stats = stats
+        self._boards = {}
+
+    def _log(self, season):
+        from wnba_aggregates import aggregates_path, update_from_store
+
+        aggregates, read = update_from_store(self.store, season)
+        if read:
+            aggregates.save(aggregates_path(self.store, season))
+        log = aggregates.log()
+        return log.assign(DNP=log["GP"] == 0)
+
+    def board(self, season=None):
+        seasons = [season] if season is not None else self.store.seasons()
+        versions = {s: self.store.game_versions(s) for s in seasons}
+        cached = self._boards.get(season)
+        if cached is None or cached[0] != versions:
+            logs = [self._log(s) for s in seasons]
+            df = pd.concat(logs, ignore_index=True) if logs else pd.DataFrame(columns=["PLAYER", "Date", "DNP"])
+            self._boards[season] = (versions, Leaderboard(df, self.stats))
+        return self._boards[season][1]
+
+    @staticmethod
+    def query_season(season=None, start=None, end=None):
+        # The season whose board answers a query: a date range inside one
+        # year only needs that season's; None means every season.
+        if season is None and start is not None and end is not None:
+            first, last = pd.Timestamp(start).year, pd.Timestamp(end).year
+            if first == last:
+                season = first
+        return season
+
+    def top(self, stat, k=10, season=None, start=None, end=None, per_game=False, min_games=1, ascending=False):
+        board = self.board(self.query_season(season, start, end))
+        return board.top(stat, k, start, end, per_game, min_games, ascending)
+
+
+def main(argv=None):
+    from wnba_store import SeasonStore
+
+    parser = argparse.ArgumentParser(description="Season or date-range top-k leaderboards from the season store.")
+    parser.add_argument("stat", help=f"one of {', '.join(BOARD_STATS)}")
+    parser.add_argument("--store", default=None)
+    parser.add_argument("--season", type=int)
+    parser.add_argument("--start")
+    parser.add_argument("--end")
+    parser.add_argument("-k", "--top", type=int, default=10)
+    parser.add_argument("--per-game", action="store_true")
+    parser.add_argument("--min-games", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    boards = Leaderboards(SeasonStore(args.store))
+    start = time.perf_counter()
+    board = boards.board(boards.query_season(args.season, args.start, args.end))
+    built = time.perf_counter()
+    top = board.top(args.stat, args.top, args.start, args.end, args.per_game, args.min_games)
+    done = time.perf_counter()
+    print(top.to_string(index=False))
+    print(f"built in {(built - start) * 1000:.0f} ms ({len(board.players)} players, {len(board.days)} days), "
+          f"query {(done - built) * 1000:.2f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
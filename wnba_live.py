@@ -0,0 +1,293 @@
+import re
+import threading
+import time
+
+import wnba_boxscore as core
+import wnba_metrics as metrics
+from wnba_parsers import get_parser
+
+# Seconds between polls in each phase of the game; final stops polling.
+LIVE_INTERVALS = {"live": 10.0, "break": 60.0, "scheduled": 120.0, "unknown": 30.0}
+# While live, each poll that changes nothing stretches the interval by this
+# factor, up to the break interval (timeouts, reviews, free-throw lulls).
+IDLE_BACKOFF = 1.5
+
+# Where the page shows this game's own clock or result. Other text on the
+# page (a scores ticker, related games) can say "Final" for another game.
+GAME_HEADER_SELECTOR = ", ".join(
+    f'[class*="{name}" i]' for name in ["game-clock", "gameclock", "game-status", "gamestatus", "game-header",
+                                        "gameheader"])
+GAME_HEADER_RE = re.compile(r'<[a-z][^>]*\bclass="[^"]*(?:game-?clock|game-?status|game-?header)[^"]*"[^>]*>',
+                            re.I)
+TAG_RE = re.compile(r"<[^>]*>")
+
+# Reads just the two boxscore tables, the game header's clock and the
+# status of this game's embedded JSON from the open tab, instead of
+# serializing the whole page.
+LIVE_READ_JS = r"""
+function findGame(node) {
+    if (Array.isArray(node)) {
+        for (const child of node) { const found = findGame(child); if (found) return found; }
+    } else if (node && typeof node === "object") {
+        const home = node.homeTeam, away = node.awayTeam;
+        if (home && away && typeof home === "object" && typeof away === "object" && "players" in home && "players" in away) {
+            return node;
+        }
+        for (const child of Object.values(node)) { const found = findGame(child); if (found) return found; }
+    }
+    return null;
+}
+const tables = Array.from(document.querySelectorAll("table")).slice(0, 2).map(t => t.outerHTML);
+let status = null, statusText = null;
+for (const script of document.querySelectorAll('script[type="application/json"]')) {
+    let game = null;
+    try { game = findGame(JSON.parse(script.textContent)); } catch (e) {}
+    if (game) { status = game.gameStatus ?? null; statusText = game.gameStatusText ?? null; break; }
+    // No full game object: the first status code will have to do.
+    const match = status === null ? script.textContent.match(/"gameStatus"\s*:\s*(\d)/) : null;
+    if (match) status = parseInt(match[1]);
+}
+const header = document.querySelector(HEADER_SELECTOR);
+const clock = header ? header.innerText.match(PHASE_PATTERN) : null;
+return [tables, status, clock ? clock[0] : statusText];
+"""
+PHASE_TEXT_RE = re.compile(
+    r"\b(Final(?:/\d?OT)?|Half(?:time)?|End of (?:\d\w*|1st|2nd|3rd|4th) (?:Q(?:tr|uarter)?)|"
+    r"(?:Q[1-4]|OT\d?)\s+\d{1,2}:\d{2})\b", re.I)
+
+
+def header_clock(page_source):
+    # The phase text inside the game's header or clock element, if any.
+    for match in GAME_HEADER_RE.finditer(page_source):
+        clock = PHASE_TEXT_RE.search(TAG_RE.sub(" ", page_source[match.end():match.end() + 600]))
+        if clock:
+            return clock.group(0)
+    return None
+
+
+def game_phase(status=None, clock_text=None):
+    """scheduled, live, break (halftime or between quarters), final or unknown.
+
+    ``status`` is the game's gameStatus code (or text holding one). The clock
+    text on the page wins over it, as an open tab only gets the embedded
+    JSON once, at load.
+    """
+    clock = clock_text or ""
+    if re.match(r"final", clock, re.I):
+        return "final"
+    if re.match(r"(half|end of)", clock, re.I):
+        return "break"
+    if re.match(r"(q[1-4]|ot)", clock, re.I):
+        return "live"
+    if isinstance(status, int):
+        return core.GAME_STATUS_CODES.get(status, "unknown")
+    return core.game_status(status or "") or "unknown"
+
+
+class BrowserTab:
+    """One browser tab held open on the game page for the whole poll.
+
+    Without a ``pool`` the tab gets a browser of its own, so a game followed
+    for hours never holds the browser that ordinary fetches share.
+    """
+
+    def __init__(self, url, pool=None, wait_timeout=15):
+        self._own_pool = pool is None
+        if pool is None:
+            from wnba_driver_pool import DriverPool
+            pool = DriverPool(size=1)
+        self.pool = pool
+        self._script = (LIVE_READ_JS.replace("PHASE_PATTERN", "/" + PHASE_TEXT_RE.pattern.replace("/", r"\/") + "/i")
+                        .replace("HEADER_SELECTOR", repr(GAME_HEADER_SELECTOR)))
+        try:
+            self.driver = pool.acquire()
+        except Exception:
+            self._close_pool()
+            raise
+        try:
+            with metrics.stage("page_get"):
+                self.driver.get(url)
+            core.wait_for_boxscore_tables(self.driver, wait_timeout)
+        except BaseException:
+            self.close()
+            raise
+
+    def read(self):
+        tables, status, clock = self.driver.execute_script(self._script)
+        frames = get_parser().parse_tables("".join(tables))
+        return frames, game_phase(status, clock), sum(len(table) for table in tables)
+
+    def close(self):
+        broken = not _tab_alive(self.driver)
+        self.pool.release(self.driver, broken=broken)
+        self._close_pool()
+
+    def _close_pool(self):
+        if self._own_pool:
+            self.pool.close()
+
+
+def _tab_alive(driver):
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+
+class HttpSource:
+    """Re-fetches a server-rendered page each poll (no browser)."""
+
+    def __init__(self, url, fetcher=None):
+        from wnba_http import get_default_fetcher
+
+        self.url = url
+        self.fetcher = fetcher or get_default_fetcher()
+
+    def read(self):
+        page_source = self.fetcher.fetch(self.url)
+        home, away = core.parse_boxscore_html(page_source, allow_empty=True)
+        game = core.embedded_game(page_source)
+        if game is not None:
+            status, clock = game.get("gameStatus"), game.get("gameStatusText")
+        else:
+            # No full game object: the first status code will have to do.
+            match = core.GAME_STATUS_RE.search(page_source)
+            status, clock = int(match.group(1)) if match else None, None
+        return [home, away], game_phase(status, header_clock(page_source) or clock), len(page_source)
+
+    def close(self):
+        pass
+
+
+def diff_boxscores(old, new, key=("Team", "PLAYER")):
+    """Changed cells between two polls, by player.
+
+    Returns {"changed": {(team, player): {column: value}}, "added": [...],
+    "removed": [...]}; with no previous poll everyone is added.
+    """
+    key = list(key)
+    new_rows = new.set_index(key)
+    if old is None:
+        return {"changed": {}, "added": list(new_rows.index), "removed": []}
+    old_rows = old.set_index(key)
+    columns = [col for col in new_rows.columns if col in old_rows.columns]
+    common = new_rows.index.intersection(old_rows.index)
+    # Compared as text so NA, categories and mixed dtypes all line up.
+    before = old_rows.loc[common, columns].astype("string")
+    after = new_rows.loc[common, columns].astype("string")
+    differs = before.ne(after).fillna(True) & ~(before.isna() & after.isna())
+    hits = differs.stack()
+    changed = {}
+    for *row_key, col in hits.index[hits.to_numpy(dtype=bool)]:
+        row_key = tuple(row_key)
+        changed.setdefault(row_key, {})[col] = new_rows.at[row_key, col]
+    return {
+        "changed": changed,
+        "added": list(new_rows.index.difference(old_rows.index)),
+        "removed": list(old_rows.index.difference(new_rows.index)),
+    }
+
+
+class LiveUpdate:
+    def __init__(self, home_df, away_df, diff, phase, interval, seconds, size):
+        self.home_df = home_df
+        self.away_df = away_df
+        self.diff = diff
+        self.phase = phase
+        self.interval = interval
+        self.seconds = seconds
+        self.size = size
+
+    @property
+    def changed(self):
+        return bool(self.diff["changed"] or self.diff["added"] or self.diff["removed"])
+
+
+class LivePoller:
+    """Polls one game until it is final, diffing each poll by player.
+
+    ``source`` is a BrowserTab or HttpSource; each poll is cleaned like a
+    normal fetch and compared with the previous one. run() calls
+    ``on_update`` with a LiveUpdate after every poll and returns when the
+    game is final or ``stop`` is set.
+    """
+
+    def __init__(self, game, source, intervals=None, idle_backoff=IDLE_BACKOFF, max_failures=5):
+        self.game = tuple(game)
+        self.max_failures = max_failures
+        self.source = source
+        self.intervals = dict(LIVE_INTERVALS, **(intervals or {}))
+        self.idle_backoff = idle_backoff
+        self.previous = None
+        self.interval = self.intervals["live"]
+        self.polls = 0
+
+    def poll(self):
+        start = time.perf_counter()
+        frames, phase, size = self.source.read()
+        with metrics.stage("clean"):
+            home_df, away_df = core.clean_boxscores(frames[0], frames[1], *self.game)
+        current = core.concat_boxscores([home_df, away_df])
+        diff = diff_boxscores(self.previous, current)
+        self.previous = current
+        self.polls += 1
+        update = LiveUpdate(home_df, away_df, diff, phase, 0.0, time.perf_counter() - start, size)
+        update.interval = self.interval = self.next_interval(phase, update.changed)
+        return update
+
+    def next_interval(self, phase, changed):
+        if phase == "final":
+            return 0.0
+        if phase != "live":
+            return self.intervals.get(phase, self.intervals["unknown"])
+        if changed:
+            return self.intervals["live"]
+        return min(max(self.interval, self.intervals["live"]) * self.idle_backoff, self.intervals["break"])
+
+    def run(self, on_update, stop=None):
+        stop = stop or threading.Event()
+        failures = 0
+        try:
+            while not stop.is_set():
+                try:
+                    update = self.poll()
+                except Exception:
+                    # A page caught mid-render or a dropped connection; try
+                    # again after the usual wait, but not forever.
+                    failures += 1
+                    if failures >= self.max_failures:
+                        raise
+                    stop.wait(self.interval)
+                    continue
+                failures = 0
+                on_update(update)
+                if update.phase == "final":
+                    return update
+                stop.wait(update.interval)
+        finally:
+            self.source.close()
+        return None
+
+
+def open_source(game, backend="selenium", pool=None, fetcher=None, base_url=None):
+    url = core.boxscore_url(*game[:3], base_url)
+    if backend == "http":
+        return HttpSource(url, fetcher)
+    return BrowserTab(url, pool)
+
+
+def format_update(update):
+    parts = [f"{update.phase:9} poll {update.seconds * 1000:5.0f} ms, next in {update.interval:4.0f}s"]
+    for (team, player), cells in update.diff["changed"].items():
+        parts.append(f"  {team} {player}: " + ", ".join(f"{col} {value}" for col, value in cells.items()))
+    if update.diff["added"]:
+        parts.append(f"  +{len(update.diff['added'])} players")
+    if update.diff["removed"]:
+        parts.append(f"  -{len(update.diff['removed'])} players")
+    return "\n".join(parts)
+
+
+def score_line(update):
+    home, away = update.home_df, update.away_df
+    return f"{home['Team'].iloc[0]} {int(home['PTS'].sum())} - {int(away['PTS'].sum())} {away['Team'].iloc[0]}"
@@ -0,0 +1,419 @@
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from datetime import date, datetime
+
+import wnba_boxscore as core
+from wnba_store import season_of
+
+DEFAULT_MANIFEST_PATH = os.environ.get("WNBA_MANIFEST", os.path.join(
+    os.path.expanduser("~"), ".cache", "wnba_boxscore", "manifest.sqlite"))
+SCHEDULE_URL = "{base_url}/schedule?season={season}&month=all"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    season INTEGER NOT NULL,
+    home_abbr TEXT NOT NULL,
+    away_abbr TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    game_date TEXT,
+    game_time TEXT,
+    status TEXT NOT NULL DEFAULT 'scheduled',
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS games_date ON games (game_date);
+CREATE INDEX IF NOT EXISTS games_home ON games (home_abbr, game_date);
+CREATE INDEX IF NOT EXISTS games_away ON games (away_abbr, game_date);
+CREATE INDEX IF NOT EXISTS games_season ON games (season, status);
+CREATE TABLE IF NOT EXISTS crawls (
+    season INTEGER PRIMARY KEY,
+    url TEXT NOT NULL,
+    games INTEGER NOT NULL,
+    crawled_at REAL NOT NULL
+);
+"""
+FIELDS = ["game_id", "season", "home_abbr", "away_abbr", "slug", "game_date", "game_time", "status"]
+# The columns batch and sync take, in games CSV order.
+GAME_FIELDS = ["game_id", "home_abbr", "away_abbr", "game_date", "game_time"]
+
+
+def _team_code(team):
+    if not isinstance(team, dict):
+        return None
+    for key in ("teamTricode", "teamAbbreviation", "triCode", "abbreviation"):
+        if team.get(key):
+            return str(team[key]).upper()
+    return None
+
+
+def _game_datetime(node):
+    # The schedule feed spells the tip-off several ways; the Eastern time
+    # fields match what wnba.com shows on its game pages.
+    for key in ("gameDateTimeEst", "gameDateTimeET", "gameDateTime", "gameDateTimeUTC"):
+        value = node.get(key)
+        if value:
+            try:
+                return datetime.fromisoformat(str(value).replace("Z", "+00:00")), True
+            except ValueError:
+                pass
+    day = node.get("gameDateEst") or node.get("gameDate")
+    if day:
+        try:
+            return datetime.fromisoformat(str(day).replace("Z", "+00:00")[:10]), False
+        except ValueError:
+            pass
+    return None, False
+
+
+def schedule_game(node):
+    """One manifest row from a schedule feed game object, or None if it isn't one."""
+    game_id = node.get("gameId")
+    home, away = _team_code(node.get("homeTeam")), _team_code(node.get("awayTeam"))
+    if not game_id or not home or not away:
+        return None
+    tip, has_time = _game_datetime(node)
+    slug = node.get("gameSlug") or node.get("seoSlug") or node.get("slug") or f"{home}-vs-{away}"
+    game_date = tip.date().isoformat() if tip else None
+    try:
+        season = season_of(game_id, game_date)
+    except ValueError:
+        return None
+    return {
+        "game_id": str(game_id),
+        "season": season,
+        "home_abbr": home,
+        "away_abbr": away,
+        "slug": str(slug).strip("/").split("/")[-1],
+        "game_date": game_date,
+        "game_time": tip.strftime("%I:%M %p").lstrip("0") if has_time else None,
+        "status": core.GAME_STATUS_CODES.get(node.get("gameStatus"), "scheduled"),
+    }
+
+
+def _schedule_nodes(node):
+    if isinstance(node, dict):
+        if "gameId" in node and "homeTeam" in node:
+            yield node
+            return
+        children = node.values()
+    elif isinstance(node, list):
+        children = node
+    else:
+        return
+    for child in children:
+        yield from _schedule_nodes(child)
+
+
+def parse_schedule(page_source):
+    """Every game in a schedule page (embedded JSON) or a bare schedule JSON feed."""
+    text = page_source.lstrip()
+    payloads = [text] if text[:1] in "{[" else core.EMBEDDED_JSON_RE.findall(page_source)
+    games = {}
+    for payload in payloads:
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            continue
+        for node in _schedule_nodes(data):
+            game = schedule_game(node)
+            if game is not None:
+                games[game["game_id"]] = game
+    return list(games.values())
+
+
+def crawl_schedule(season, fetcher=None, url=None, base_url=None):
+    url = url or SCHEDULE_URL.format(base_url=base_url or core.BASE_URL, season=season)
+    if fetcher is None:
+        from wnba_http import get_default_fetcher
+        fetcher = get_default_fetcher()
+    games = [game for game in parse_schedule(fetcher.fetch(url)) if game["season"] == int(season)]
+    if not games:
+        raise ValueError(f"No {season} games found in the schedule at {url}.")
+    return url, games
+
+
+class GameManifest:
+    """Every scheduled game of a season, crawled once from the schedule.
+
+    Rows are keyed by game ID and indexed by team and date in SQLite;
+    lookups by ID are served from an in-memory dict loaded on first use.
+    refresh() re-reads the schedule and only rewrites games that changed.
+    """
+
+    def __init__(self, path=None):
+        self.path = path or DEFAULT_MANIFEST_PATH
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        self._by_id = None
+
+    def needs_refresh(self, season, today=None, max_age=6 * 3600):
+        # A season whose games are all final never changes again.
+        today = (today or date.today()).isoformat()
+        with self._lock:
+            crawled = self._db.execute("SELECT crawled_at FROM crawls WHERE season = ?", (int(season),)).fetchone()
+            pending = self._db.execute(
+                "SELECT COUNT(*) FROM games WHERE season = ? AND status != 'final' AND game_date <= ?",
+                (int(season), today),
+            ).fetchone()[0]
+        if crawled is None:
+            return True
+        return pending > 0 and time.time() - crawled[0] > max_age
+
+    def refresh(self, season, fetcher=None, url=None, base_url=None, force=False, today=None):
+        """Re-crawl ``season`` if due; returns counts of added, updated and unchanged games."""
+        if not force and not self.needs_refresh(season, today):
+            return {"added": 0, "updated": 0, "unchanged": len(self.games(season=season)), "crawled": False}
+        url, games = crawl_schedule(season, fetcher, url, base_url)
+        return dict(self.upsert(games, url, season), crawled=True)
+
+    def upsert(self, games, url=None, season=None):
+        report = {"added": 0, "updated": 0, "unchanged": 0}
+        now = time.time()
+        with self._lock:
+            known = {row[0]: row[1:] for row in self._db.execute(f"SELECT {', '.join(FIELDS)} FROM games")}
+            rows = []
+            for game in games:
+                values = tuple(game[field] for field in FIELDS)
+                old = known.get(values[0])
+                if old == values[1:]:
+                    report["unchanged"] += 1
+                    continue
+                report["added" if old is None else "updated"] += 1
+                rows.append(values + (now,))
+            self._db.executemany(
+                f"INSERT OR REPLACE INTO games ({', '.join(FIELDS)}, updated_at) "
+                f"VALUES ({', '.join('?' * (len(FIELDS) + 1))})",
+                rows,
+            )
+            if url is not None and season is not None:
+                self._db.execute("INSERT OR REPLACE INTO crawls VALUES (?, ?, ?, ?)",
+                                 (int(season), url, len(games), now))
+            self._db.commit()
+            if rows:
+                self._by_id = None
+        return report
+
+    def _index(self):
+        with self._lock:
+            if self._by_id is None:
+                query = f"SELECT {', '.join(FIELDS)} FROM games"
+                self._by_id = {row[0]: dict(zip(FIELDS, row)) for row in self._db.execute(query)}
+            return self._by_id
+
+    def get(self, game_id):
+        return self._index().get(str(game_id))
+
+    def __contains__(self, game_id):
+        return str(game_id) in self._index()
+
+    def __len__(self):
+        return len(self._index())
+
+    def games(self, team=None, start=None, end=None, season=None, status=None):
+        """Games in date order; ``team`` matches either side, dates are inclusive."""
+        clauses, params = [], []
+        if team:
+            clauses.append("(home_abbr = ? OR away_abbr = ?)")
+            params += [team.upper(), team.upper()]
+        if start:
+            clauses.append("game_date >= ?")
+            params.append(str(start))
+        if end:
+            clauses.append("game_date <= ?")
+            params.append(str(end))
+        if season:
+            clauses.append("season = ?")
+            params.append(int(season))
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        query = f"SELECT {', '.join(FIELDS)} FROM games"
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY game_date, game_time, game_id", params).fetchall()
+        return [dict(zip(FIELDS, row)) for row in rows]
+
+    def url(self, game_id, base_url=None):
+        game = self.get(game_id)
+        if game is None:
+            raise KeyError(f"Game {game_id} is not in the manifest.")
+        return core.boxscore_url(game["game_id"], game["home_abbr"], game["away_abbr"], base_url, game["slug"])
+
+    def resolve(self, games):
+        """Check typed-in game tuples against the manifest before anything is fetched.
+
+        Returns (games, slugs, corrections, unknown): known games come back
+        with the manifest's teams, date and time, and ``corrections`` says
+        what changed; game IDs the manifest doesn't have are left out.
+        """
+        resolved, slugs, corrections, unknown = [], {}, {}, []
+        for game in games:
+            row = self.get(game[0])
+            if row is None:
+                unknown.append(str(game[0]))
+                continue
+            canonical = game_tuple(row)
+            fixed = [f"{field} {given!r} -> {value!r}" for field, given, value in zip(GAME_FIELDS, game, canonical)
+                     if value and str(given) != str(value)]
+            if fixed:
+                corrections[row["game_id"]] = ", ".join(fixed)
+            resolved.append(canonical)
+            slugs[row["game_id"]] = row["slug"]
+        return resolved, slugs, corrections, unknown
+
+    def close(self):
+        self._db.close()
+
+
+def game_tuple(row):
+    return tuple(row[field] or "" for field in GAME_FIELDS)
+
+
+def add_selection_args(parser):
+    # Without a games CSV the games come from the manifest; with one, the
+    # CSV is checked against it when --manifest is given.
+    parser.add_argument("--manifest", default=None, help=f"game manifest (default {DEFAULT_MANIFEST_PATH})")
+    parser.add_argument("--season", type=int, help="manifest games of this season")
+    parser.add_argument("--team", help="manifest games this team plays in")
+    parser.add_argument("--start", help="first manifest game date, inclusive")
+    parser.add_argument("--end", help="last manifest game date, inclusive (never later than today)")
+
+
+def check_selection(parser, args):
+    # Picking games from the manifest needs a season or a date range, so a
+    # bare command can't set off a scrape of every game ever indexed.
+    if not args.games_csv and not (args.season or args.start or args.end):
+        parser.error("give a games CSV, or pick manifest games with --season, --start or --end")
+
+
+def _selection_seasons(args, games, today):
+    # The seasons a run touches: the given games', or the ones its
+    # --season / --start..--end pick spans.
+    if games is not None:
+        seasons = set()
+        for game in games:
+            try:
+                seasons.add(season_of(game[0], game[3]))
+            except ValueError:
+                pass
+        return seasons
+    if args.season:
+        return {int(args.season)}
+    end = min(str(args.end), today) if args.end else today
+    return set(range(int(str(args.start or end)[:4]), int(end[:4]) + 1))
+
+
+def refresh_due(manifest, seasons, base_url=None, today=None):
+    """Crawl any of ``seasons`` the manifest has never seen or that has games pending.
+
+    A schedule that can't be fetched is reported and the manifest used as it is.
+    """
+    for season in sorted(seasons):
+        if not manifest.needs_refresh(season, today):
+            continue
+        try:
+            report = manifest.refresh(season, base_url=base_url, today=today)
+        except Exception as e:
+            print(f"  manifest: could not refresh {season}: {e}", file=sys.stderr)
+            continue
+        print(f"  manifest: {season} refreshed, {report['added']} added, {report['updated']} updated",
+              file=sys.stderr)
+
+
+def select_games(args, games=None, today=None, parser=None):
+    """Resolve the games a batch or sync run was given, or pick them from the manifest.
+
+    Seasons the manifest is missing or hasn't caught up on are refreshed
+    first (not with --offline). Manifest picks stop at today: games not
+    played yet have no boxscore. A pick that finds nothing is a usage error
+    through ``parser``. Returns (game tuples, slugs by game ID, corrections,
+    unknown game IDs) and prints the corrections and unknown games.
+    """
+    today = today or date.today()
+    manifest = GameManifest(args.manifest)
+    try:
+        if not getattr(args, "offline", False):
+            refresh_due(manifest, _selection_seasons(args, games, today.isoformat()),
+                        getattr(args, "base_url", None), today)
+        if games is not None:
+            games, slugs, corrections, unknown = manifest.resolve(games)
+        else:
+            end = min(str(args.end), today.isoformat()) if args.end else today.isoformat()
+            rows = manifest.games(team=args.team, start=args.start, end=end, season=args.season)
+            games, corrections, unknown = [game_tuple(row) for row in rows], {}, []
+            slugs = {row["game_id"]: row["slug"] for row in rows}
+            if not games and parser is not None:
+                parser.error(f"no games in the manifest {manifest.path} match that selection")
+    finally:
+        manifest.close()
+    for game_id, fixed in corrections.items():
+        print(f"  {game_id}: corrected {fixed}", file=sys.stderr)
+    for game_id in unknown:
+        print(f"  {game_id}: not in the manifest, skipped", file=sys.stderr)
+    return games, slugs, corrections, unknown
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Crawl the season schedule into a local game manifest.")
+    parser.add_argument("--manifest", default=None, help=f"manifest database (default {DEFAULT_MANIFEST_PATH})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    refresh = sub.add_parser("refresh", help="crawl a season's schedule, rewriting only games that changed")
+    refresh.add_argument("seasons", nargs="+", type=int)
+    refresh.add_argument("--schedule-url", default=None, help="schedule page or JSON feed to read instead")
+    refresh.add_argument("--base-url", default=None)
+    refresh.add_argument("--force", action="store_true", help="crawl even if the manifest looks current")
+    games = sub.add_parser("games", help="list games, or write them as a games CSV for batch and sync")
+    games.add_argument("--season", type=int)
+    games.add_argument("--team")
+    games.add_argument("--start", help="first game date, inclusive")
+    games.add_argument("--end", help="last game date, inclusive")
+    games.add_argument("--status", choices=["scheduled", "live", "final"])
+    games.add_argument("--csv", action="store_true", help="print game_id,home_abbr,away_abbr,game_date,game_time")
+    show = sub.add_parser("show", help="print one game and its boxscore URL")
+    show.add_argument("game_id")
+    args = parser.parse_args(argv)
+
+    manifest = GameManifest(args.manifest)
+    if args.command == "refresh":
+        for season in args.seasons:
+            start = time.perf_counter()
+            report = manifest.refresh(season, url=args.schedule_url, base_url=args.base_url, force=args.force)
+            action = "crawled" if report["crawled"] else "up to date,"
+            print(f"{season}: {action} {report['added']} added, {report['updated']} updated, "
+                  f"{report['unchanged']} unchanged in {time.perf_counter() - start:.2f}s", file=sys.stderr)
+    elif args.command == "games":
+        rows = manifest.games(team=args.team, start=args.start, end=args.end, season=args.season,
+                              status=args.status)
+        if args.csv:
+            writer = csv.writer(sys.stdout)
+            writer.writerow(GAME_FIELDS)
+            writer.writerows(game_tuple(row) for row in rows)
+        else:
+            for row in rows:
+                print(f"{row['game_id']}  {row['game_date'] or '':10} {row['game_time'] or '':8} "
+                      f"{row['away_abbr']} @ {row['home_abbr']}  {row['status']}")
+    else:
+        game = manifest.get(args.game_id)
+        if game is None:
+            print(f"{args.game_id} is not in the manifest", file=sys.stderr)
+            return 1
+        for field in FIELDS:
+            print(f"{field}: {game[field]}")
+        print(f"url: {manifest.url(args.game_id)}")
+    manifest.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
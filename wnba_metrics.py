@@ -0,0 +1,181 @@
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+# Stage names, in the order a scrape goes through them.
+STAGES = [
+    "cache_read", "http_fetch", "driver_install", "browser_launch", "page_get", "wait", "parse", "clean", "enrich",
+    "gui_tables", "gui_leaders", "gui_graphs",
+]
+COUNTERS = ["pages_fetched", "bytes_fetched", "resources_loaded", "resource_bytes", "cache_hits", "parse_failures",
+            "retries"]
+BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+_local = threading.local()
+
+
+@contextmanager
+def tracking(record):
+    """Attribute stages and counters from this thread to ``record``.
+
+    Lets code that knows nothing about the game being scraped (the driver
+    pool, the fetchers) still have its time show up in that game's record.
+    """
+    record.setdefault("stages", {})
+    record.setdefault("counters", {})
+    previous = getattr(_local, "record", None)
+    _local.record = record
+    try:
+        yield record
+    finally:
+        _local.record = previous
+
+
+def current():
+    return getattr(_local, "record", None)
+
+
+def add_stage(name, seconds, record=None):
+    record = record if record is not None else current()
+    if record is not None:
+        stages = record.setdefault("stages", {})
+        stages[name] = round(stages.get(name, 0.0) + seconds, 6)
+
+
+@contextmanager
+def stage(name, record=None):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_stage(name, time.perf_counter() - start, record)
+
+
+def count(name, value=1, record=None):
+    record = record if record is not None else current()
+    if record is not None:
+        counters = record.setdefault("counters", {})
+        counters[name] = counters.get(name, 0) + value
+
+
+def merge_counters(into, counters):
+    for name, value in (counters or {}).items():
+        into[name] = into.get(name, 0) + value
+    return into
+
+
+class MetricsRegistry:
+    """Process-wide totals of every emitted game record, for Prometheus."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stage_buckets = {}
+        self.stage_sums = {}
+        self.stage_counts = {}
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.games = {}
+
+    def observe(self, record):
+        with self._lock:
+            for name, seconds in record.get("stages", {}).items():
+                buckets = self.stage_buckets.setdefault(name, [0] * len(BUCKETS))
+                for i, bound in enumerate(BUCKETS):
+                    if seconds <= bound:
+                        buckets[i] += 1
+                self.stage_sums[name] = self.stage_sums.get(name, 0.0) + seconds
+                self.stage_counts[name] = self.stage_counts.get(name, 0) + 1
+            merge_counters(self.counters, record.get("counters"))
+            outcome = record.get("outcome", "ok")
+            self.games[outcome] = self.games.get(outcome, 0) + 1
+
+    def to_prometheus(self):
+        with self._lock:
+            lines = [
+                "# HELP wnba_stage_seconds Time spent in each scrape or render stage.",
+                "# TYPE wnba_stage_seconds histogram",
+            ]
+            for name in sorted(self.stage_counts, key=lambda s: (STAGES.index(s) if s in STAGES else 99, s)):
+                for bound, value in zip(BUCKETS, self.stage_buckets[name]):
+                    lines.append(f'wnba_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {value}')
+                lines.append(f'wnba_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {self.stage_counts[name]}')
+                lines.append(f'wnba_stage_seconds_sum{{stage="{name}"}} {self.stage_sums[name]:.6f}')
+                lines.append(f'wnba_stage_seconds_count{{stage="{name}"}} {self.stage_counts[name]}')
+            for name, value in self.counters.items():
+                lines.append(f"# TYPE wnba_{name}_total counter")
+                lines.append(f"wnba_{name}_total {value}")
+            lines.append("# TYPE wnba_games_total counter")
+            for outcome, value in sorted(self.games.items()):
+                lines.append(f'wnba_games_total{{outcome="{outcome}"}} {value}')
+            return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        # Written whole and renamed, so a scraper (e.g. node_exporter's
+        # textfile collector) never reads half a file.
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp, path)
+
+
+class MetricsSink:
+    """Writes one JSON line per game and keeps the Prometheus file current.
+
+    Either path may be None. The Prometheus file is rewritten at most every
+    ``prom_interval`` seconds, and on close.
+    """
+
+    def __init__(self, log_path=None, prom_path=None, prom_interval=5.0):
+        self.log_path = log_path
+        self.prom_path = prom_path
+        self.prom_interval = prom_interval
+        self.registry = MetricsRegistry()
+        self._lock = threading.Lock()
+        self._last_prom = 0.0
+
+    def emit(self, record):
+        record = dict(record, ts=round(time.time(), 3))
+        self.registry.observe(record)
+        with self._lock:
+            if self.log_path:
+                with open(self.log_path, "a") as f:
+                    f.write(json.dumps(record, default=str) + "\n")
+            if self.prom_path and time.monotonic() - self._last_prom >= self.prom_interval:
+                self.registry.write_prometheus(self.prom_path)
+                self._last_prom = time.monotonic()
+        return record
+
+    def close(self):
+        with self._lock:
+            if self.prom_path:
+                self.registry.write_prometheus(self.prom_path)
+
+
+_default_sink = None
+
+
+def _close_default_sink():
+    if _default_sink is not None:
+        _default_sink.close()
+
+
+def configure(log_path=None, prom_path=None):
+    """Set where emit() writes; defaults to $WNBA_METRICS_LOG and $WNBA_METRICS_PROM."""
+    global _default_sink
+    if _default_sink is None:
+        atexit.register(_close_default_sink)
+    else:
+        _default_sink.close()
+    _default_sink = MetricsSink(log_path or os.environ.get("WNBA_METRICS_LOG"),
+                                prom_path or os.environ.get("WNBA_METRICS_PROM"))
+    return _default_sink
+
+
+def get_default_sink():
+    return _default_sink or configure()
+
+
+def emit(record):
+    return get_default_sink().emit(record)
@@ -0,0 +1,137 @@
+import os
+import re
+
+import pandas as pd
+
+# The boxscore tables are plain (non-nested) <table> elements, so the fast
+# parsers cut them out of the page first and never build a tree for the
+# rest of the document (scripts, styles, nav, ads).
+TABLE_RE = re.compile(r"<table\b.*?</table\s*>", re.S | re.I)
+
+
+def table_fragments(page_source, limit=2):
+    fragments = []
+    for match in TABLE_RE.finditer(page_source):
+        fragments.append(match.group(0))
+        if len(fragments) == limit:
+            break
+    return fragments
+
+
+def frame_from_columns(headers, columns):
+    # Columns come straight from the cell scan; headers may repeat, so build
+    # positionally and label afterwards.
+    df = pd.DataFrame(dict(enumerate(columns)), columns=range(len(columns)))
+    df.columns = headers
+    return df
+
+
+def append_cells(columns, cells):
+    # Each cell goes straight into its column as the row is scanned. A row
+    # with no cells (a spacer) adds nothing; a short one (a DNP note spanning
+    # the stat columns) is padded with None, as pd.DataFrame(rows) would.
+    count = 0
+    for count, value in enumerate(cells, 1):
+        if count > len(columns):
+            raise ValueError(f"{len(columns)} columns passed, passed data had more columns")
+        columns[count - 1].append(value)
+    if count:
+        for column in columns[count:]:
+            column.append(None)
+
+
+# Original implementation, kept as the reference backend
+def parse_table(table):
+    headers = [th.get_text(strip=True) for th in table.find_all("th")]
+    rows = []
+    for row in table.find("tbody").find_all("tr"):
+        cells = [td.get_text(strip=True) for td in row.find_all("td")]
+        if cells:
+            rows.append(cells)
+    return pd.DataFrame(rows, columns=headers)
+
+
+class BeautifulSoupParser:
+    name = "bs4"
+
+    def __init__(self, features="html.parser"):
+        from bs4 import BeautifulSoup
+
+        self._soup = BeautifulSoup
+        self.features = features
+
+    def parse_tables(self, page_source):
+        soup = self._soup(page_source, self.features)
+        return [parse_table(table) for table in soup.find_all("table")[:2]]
+
+
+class LxmlParser:
+    name = "lxml"
+
+    def __init__(self):
+        import lxml.html
+
+        self._fromstring = lxml.html.fragment_fromstring
+
+    @staticmethod
+    def _text(element):
+        return "".join(part.strip() for part in element.itertext())
+
+    def parse_tables(self, page_source):
+        frames = []
+        for fragment in table_fragments(page_source):
+            table = self._fromstring(fragment)
+            headers = [self._text(th) for th in table.iter("th")]
+            body = table.find("tbody")
+            columns = [[] for _ in headers]
+            for tr in body.iter("tr") if body is not None else ():
+                append_cells(columns, (self._text(td) for td in tr.iter("td")))
+            frames.append(frame_from_columns(headers, columns))
+        return frames
+
+
+class SelectolaxParser:
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser = LexborHTMLParser
+
+    def parse_tables(self, page_source):
+        frames = []
+        for fragment in table_fragments(page_source):
+            table = self._parser(fragment).css_first("table")
+            headers = [th.text(deep=True, separator="", strip=True) for th in table.css("th")]
+            columns = [[] for _ in headers]
+            for tr in table.css("tbody tr"):
+                append_cells(columns, (td.text(deep=True, separator="", strip=True) for td in tr.css("td")))
+            frames.append(frame_from_columns(headers, columns))
+        return frames
+
+
+PARSERS = {
+    "selectolax": SelectolaxParser,
+    "lxml": LxmlParser,
+    "bs4": BeautifulSoupParser,
+}
+
+_instances = {}
+
+
+def get_parser(name=None):
+    # "auto" picks the fastest backend that is installed.
+    name = name or os.environ.get("WNBA_PARSER", "auto")
+    if name not in _instances:
+        if name == "auto":
+            for candidate in PARSERS:
+                try:
+                    _instances[name] = get_parser(candidate)
+                    break
+                except ImportError:
+                    continue
+        elif name in PARSERS:
+            _instances[name] = PARSERS[name]()
+        else:
+            raise ValueError(f"Unknown parser {name!r}; choose from auto, {', '.join(PARSERS)}.")
+    return _instances[name]
@@ -0,0 +1,448 @@
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import wnba_boxscore as core
+import wnba_metrics as metrics
+from wnba_aggregates import shooting
+from wnba_cache import PageCache
+from wnba_store import season_of
+
+_DONE = object()
+
+
+class _Failed:
+    def __init__(self, error):
+        self.error = error
+
+
+def _put(box, item, stop):
+    # Blocks while the next stage is behind; gives up once the pipeline is torn down.
+    while not stop.is_set():
+        try:
+            box.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+
+def threaded_map(func, items, workers=1, maxsize=4):
+    """Yield func(item) for every item, computed by ``workers`` background threads.
+
+    Both the input and the output of the stage are bounded queues of
+    ``maxsize``, so a slow consumer stalls the workers, which stall the
+    upstream generator, instead of results piling up in memory. Results
+    come out in completion order.
+    """
+    inbox, outbox = queue.Queue(maxsize), queue.Queue(maxsize)
+    stop = threading.Event()
+
+    def feed():
+        try:
+            for item in items:
+                if not _put(inbox, item, stop):
+                    return
+        except BaseException as e:
+            _put(outbox, _Failed(e), stop)
+        for _ in range(workers):
+            _put(inbox, _DONE, stop)
+
+    def work():
+        while not stop.is_set():
+            try:
+                item = inbox.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is _DONE:
+                _put(outbox, _DONE, stop)
+                return
+            _put(outbox, func(item), stop)
+
+    threads = [threading.Thread(target=feed, daemon=True)]
+    threads += [threading.Thread(target=work, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    try:
+        finished = 0
+        while finished < workers:
+            item = outbox.get()
+            if item is _DONE:
+                finished += 1
+            elif isinstance(item, _Failed):
+                raise item.error
+            else:
+                yield item
+    finally:
+        stop.set()
+
+
+class GameItem:
+    """One game on its way through the pipeline."""
+
+    def __init__(self, game, slug=None):
+        self.game = tuple(game)
+        self.slug = slug
+        self.page = None
+        self.frames = None
+        self.df = None
+        self.error = None
+        self.record = {"game_id": self.game[0]}
+
+    @property
+    def game_id(self):
+        return self.game[0]
+
+
+def _stage(name=None):
+    # A failed game keeps moving so the sink can report it, but later stages
+    # leave it alone. Stage time lands in the game's metrics record.
+    def decorate(func):
+        def run(*args):
+            item = args[-1]
+            if item.error is None:
+                try:
+                    with metrics.tracking(item.record):
+                        if name is None:
+                            func(*args)
+                        else:
+                            with metrics.stage(name):
+                                func(*args)
+                except Exception as e:
+                    item.error = f"{type(e).__name__}: {e}"
+            return item
+        run.__name__ = func.__name__
+        return run
+    return decorate
+
+
+class PageSource:
+    """Fetch stage: the page cache first, then HTTP, then optionally a browser."""
+
+    def __init__(self, cache=None, fetcher=None, backend="http", base_url=None, offline=False):
+        self.cache = cache
+        self.fetcher = fetcher
+        self.backend = backend
+        self.base_url = base_url
+        self.offline = offline
+
+    @_stage()
+    def __call__(self, item):
+        url = item.record["url"] = core.boxscore_url(*item.game[:3], self.base_url, item.slug)
+        page = None
+        if self.cache is not None:
+            with metrics.stage("cache_read"):
+                page = self.cache.get(url, allow_stale=self.offline)
+        if page is not None:
+            metrics.count("cache_hits")
+            item.page = page
+            return
+        if self.offline:
+            raise LookupError(f"{url} is not in the page cache.")
+        if self.backend == "selenium":
+            page, _ = core.fetch_with_browser(url)
+        else:
+            if self.fetcher is None:
+                from wnba_http import get_default_fetcher
+                self.fetcher = get_default_fetcher()
+            with metrics.stage("http_fetch"):
+                page = self.fetcher.fetch(url)
+        metrics.count("pages_fetched")
+        metrics.count("bytes_fetched", len(page.encode("utf-8")))
+        if self.cache is not None:
+            self.cache.put(url, page, core.game_status(page), item.game)
+        item.page = page
+
+
+@_stage("parse")
+def parse_page(item):
+    item.frames = core.parse_boxscore_html(item.page)
+    item.page = None
+
+
+@_stage("clean")
+def clean_frames(item):
+    home_df, away_df = core.clean_boxscores(*item.frames, *item.game)
+    item.df = core.concat_boxscores([home_df, away_df])
+    item.frames = None
+
+
+@_stage("enrich")
+def enrich_frame(item):
+    df = item.df
+    df["Season"] = season_of(item.game_id, item.game[3])
+    df["Date"] = pd.to_datetime(df["Game Date"], errors="coerce").astype("datetime64[ms]")
+    rates = shooting(df.astype({col: "float64" for col in ["FGM", "FGA", "3PM", "FTA", "PTS"]}))
+    df["eFG%"] = rates["eFG%"].round(1).astype("float32")
+    df["TS%"] = rates["TS%"].round(1).astype("float32")
+
+
+class CsvSink:
+    """Appends each game to a CSV file; the file offset is the resume point."""
+
+    def __init__(self, path):
+        self.path = path
+        self.columns = None
+        self._f = None
+
+    def open(self, position=None):
+        if position is None:
+            self._f = open(self.path, "w", newline="")
+            return
+        # Drop whatever was written after the last checkpoint.
+        self._f = open(self.path, "r+", newline="")
+        self._f.truncate(position["offset"])
+        self._f.seek(position["offset"])
+        self.columns = position.get("columns")
+
+    def _write(self, df):
+        header = self.columns is None
+        if header:
+            self.columns = list(df.columns)
+        df.reindex(columns=self.columns).to_csv(self._f, header=header, index=False)
+
+    def write(self, game_id, df):
+        self._write(df)
+        self._f.flush()
+        return [game_id], {"offset": self._f.tell(), "columns": self.columns}
+
+    def close(self):
+        self._f.close()
+        return [], None
+
+
+class JsonLinesSink(CsvSink):
+    """One JSON object per player row."""
+
+    def _write(self, df):
+        if self.columns is None:
+            self.columns = list(df.columns)
+        text = df.reindex(columns=self.columns).to_json(orient="records", lines=True, date_format="iso")
+        self._f.write(text if text.endswith("\n") else text + "\n")
+
+
+class ParquetSink:
+    """Parquet part files in a directory, written a row group at a time.
+
+    Rows are buffered up to ``row_group_rows``; a part file is closed, and
+    its games checkpointed, every ``games_per_part`` games. After a crash,
+    part files the checkpoint doesn't list are deleted and their games
+    done again.
+    """
+
+    def __init__(self, path, row_group_rows=8192, games_per_part=500):
+        self.path = path
+        self.row_group_rows = row_group_rows
+        self.games_per_part = games_per_part
+        self.schema = None
+        self.parts = []
+        self._writer = None
+        self._writer_name = None
+        self._buffer = []
+        self._buffered_rows = 0
+        self._games = []
+
+    def open(self, position=None):
+        os.makedirs(self.path, exist_ok=True)
+        self.parts = list((position or {}).get("parts", []))
+        for name in os.listdir(self.path):
+            if name.endswith(".parquet") and name not in self.parts:
+                os.remove(os.path.join(self.path, name))
+        if self.parts:
+            self.schema = pq.read_schema(os.path.join(self.path, self.parts[0]))
+
+    def _table(self, df):
+        table = pa.Table.from_pandas(df.reset_index(drop=True), preserve_index=False)
+        if self.schema is None:
+            # A column that is all null in the first game gets a real type
+            # later, and a stat that fit int8 there may need int16 in another.
+            self.schema = pa.schema([
+                field.with_type(pa.float64()) if pa.types.is_null(field.type)
+                else field.with_type(pa.int16()) if pa.types.is_int8(field.type) else field
+                for field in table.schema
+            ]).remove_metadata()
+        return pa.Table.from_pandas(df.reindex(columns=self.schema.names).reset_index(drop=True),
+                                    schema=self.schema, preserve_index=False)
+
+    def _flush_row_group(self):
+        if not self._buffer:
+            return
+        if self._writer is None:
+            name = f"part-{len(self.parts):05d}.parquet"
+            self._writer = pq.ParquetWriter(os.path.join(self.path, name), self.schema)
+            self._writer_name = name
+        self._writer.write_table(pa.concat_tables(self._buffer))
+        self._buffer, self._buffered_rows = [], 0
+
+    def _close_part(self):
+        self._flush_row_group()
+        committed = self._games
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self.parts.append(self._writer_name)
+        self._games = []
+        return committed, {"parts": list(self.parts)}
+
+    def write(self, game_id, df):
+        table = self._table(df)
+        self._buffer.append(table)
+        self._buffered_rows += table.num_rows
+        self._games.append(game_id)
+        if self._buffered_rows >= self.row_group_rows:
+            self._flush_row_group()
+        if len(self._games) >= self.games_per_part:
+            return self._close_part()
+        return [], None
+
+    def close(self):
+        return self._close_part()
+
+
+SINKS = {"csv": CsvSink, "jsonl": JsonLinesSink, "parquet": ParquetSink}
+
+
+class Checkpoint:
+    """Append-only log of games the sink has made durable, and where it got to."""
+
+    def __init__(self, path):
+        self.path = path
+        self.done = set()
+        self.position = None
+
+    def load(self):
+        if os.path.exists(self.path):
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # The line being written when the process died.
+                        break
+                    self.done.update(entry["games"])
+                    self.position = entry["position"]
+        return self
+
+    def reset(self):
+        open(self.path, "w").close()
+
+    def record(self, game_ids, position):
+        if position is None:
+            return
+        self.done.update(game_ids)
+        self.position = position
+        with open(self.path, "a") as f:
+            f.write(json.dumps({"games": list(game_ids), "position": position}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def run_pipeline(games, sink, checkpoint, source, slugs=None, fetch_workers=4, in_flight=8, progress=None):
+    """Stream ``games`` through fetch, parse, clean and enrich into ``sink``.
+
+    Only games the checkpoint doesn't have are fetched. Returns a report
+    with written and failed counts; failed games stay out of the checkpoint
+    so the next resume retries them.
+    """
+    slugs = slugs or {}
+    todo = (GameItem(game, slugs.get(game[0])) for game in games if str(game[0]) not in checkpoint.done)
+    items = threaded_map(source, todo, fetch_workers, in_flight)
+    items = threaded_map(parse_page, items, 1, in_flight)
+    items = threaded_map(clean_frames, items, 1, in_flight)
+    items = threaded_map(enrich_frame, items, 1, in_flight)
+
+    report = {"written": 0, "failed": {}, "skipped": len(checkpoint.done)}
+    start = time.perf_counter()
+    sink.open(checkpoint.position)
+    try:
+        for done, item in enumerate(items, 1):
+            if item.error is None:
+                checkpoint.record(*sink.write(item.game_id, item.df))
+                report["written"] += 1
+                metrics.emit(dict(item.record, outcome="ok"))
+            else:
+                report["failed"][item.game_id] = item.error
+                metrics.emit(dict(item.record, outcome="error", error=item.error))
+            item.df = None
+            if progress:
+                progress(done, item.game_id, item.error, time.perf_counter() - start)
+    finally:
+        checkpoint.record(*sink.close())
+    report["seconds"] = round(time.perf_counter() - start, 2)
+    return report
+
+
+def cached_games(cache):
+    return [tuple(entry[field] for field in ["game_id", "home_abbr", "away_abbr", "game_date", "game_time"])
+            for entry in cache.entries() if entry["game_id"]]
+
+
+def main(argv=None):
+    from wnba_batch import read_games_csv
+    from wnba_manifest import add_selection_args, check_selection, select_games
+
+    parser = argparse.ArgumentParser(description="Stream many games to CSV, JSON lines or Parquet with bounded memory.")
+    parser.add_argument("out", help="output file (csv, jsonl) or directory (parquet)")
+    parser.add_argument("--games", dest="games_csv", help="CSV of game_id,home_abbr,away_abbr,game_date,game_time "
+                        "(default: the manifest, or every cached game with --offline)")
+    parser.add_argument("-f", "--format", choices=sorted(SINKS), default=None,
+                        help="default: from the output's extension, else parquet")
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint of an earlier run")
+    parser.add_argument("--checkpoint", default=None, help="checkpoint file (default: <out>.checkpoint.jsonl)")
+    parser.add_argument("--in-flight", type=int, default=8, help="games queued between stages")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="concurrent page fetches")
+    parser.add_argument("--backend", choices=["http", "selenium"], default="http")
+    parser.add_argument("--base-url", default=None)
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--offline", action="store_true", help="read pages only from the cache")
+    parser.add_argument("--row-group-rows", type=int, default=8192)
+    parser.add_argument("--games-per-part", type=int, default=500, help="games per Parquet part file")
+    parser.add_argument("--metrics-log", default=None, help="append one JSON line of stage timings per game")
+    add_selection_args(parser)
+    args = parser.parse_args(argv)
+    if not (args.offline and not args.manifest):
+        check_selection(parser, args)
+    metrics.configure(args.metrics_log, None)
+
+    fmt = args.format or os.path.splitext(args.out)[1].lstrip(".").lower()
+    fmt = fmt if fmt in SINKS else "parquet"
+    if fmt == "parquet":
+        sink = ParquetSink(args.out, args.row_group_rows, args.games_per_part)
+    else:
+        sink = SINKS[fmt](args.out)
+    checkpoint = Checkpoint(args.checkpoint or args.out.rstrip("/\\") + ".checkpoint.jsonl")
+    if args.resume:
+        checkpoint.load()
+    else:
+        checkpoint.reset()
+
+    cache = PageCache(args.cache_dir) if args.cache_dir or args.offline else None
+    slugs = {}
+    if args.games_csv:
+        games = read_games_csv(args.games_csv)
+        if args.manifest:
+            games, slugs, _, _ = select_games(args, games, parser=parser)
+    elif args.offline and not args.manifest:
+        games = cached_games(cache)
+    else:
+        games, slugs, _, _ = select_games(args, parser=parser)
+
+    source = PageSource(cache, backend=args.backend, base_url=args.base_url, offline=args.offline)
+    report = run_pipeline(games, sink, checkpoint, source, slugs, args.workers, args.in_flight)
+    print(f"wrote {report['written']} games to {args.out} in {report['seconds']}s, "
+          f"{report['skipped']} already done, {len(report['failed'])} failed", file=sys.stderr)
+    for game_id, error in report["failed"].items():
+        print(f"  {game_id}: {error}", file=sys.stderr)
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
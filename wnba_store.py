@@ -0,0 +1,202 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+DEFAULT_STORE_DIR = os.environ.get("WNBA_STORE_DIR", "wnba_store")
+
+# WNBA game IDs are 10 + season type + two-digit season year + game number,
+# e.g. 1022500001 is regular-season game 1 of 2025.
+GAME_ID_RE = re.compile(r"^10\d(\d{2})\d{5}$")
+
+
+def season_of(game_id, game_date=None):
+    match = GAME_ID_RE.match(str(game_id))
+    if match:
+        return 2000 + int(match.group(1))
+    date = pd.to_datetime(game_date, errors="coerce")
+    if pd.isna(date):
+        raise ValueError(f"Can't tell the season of game {game_id} (date {game_date!r}).")
+    return date.year
+
+
+class SeasonStore:
+    """Parquet dataset of boxscore rows, partitioned by season and team.
+
+    Each game is written as one file per team, so re-scraping a game just
+    replaces its files and never duplicates rows.
+    """
+
+    partitioning = ds.partitioning(pa.schema([("season", pa.int16()), ("team", pa.string())]), flavor="hive")
+
+    def __init__(self, root=None):
+        self.root = root or DEFAULT_STORE_DIR
+        os.makedirs(self.root, exist_ok=True)
+
+    def _game_path(self, season, team, game_id):
+        return os.path.join(self.root, f"season={season}", f"team={team}", f"game-{game_id}.parquet")
+
+    def _game_files(self, game_id):
+        return glob.glob(os.path.join(self.root, "season=*", "team=*", f"game-{game_id}.parquet"))
+
+    def write_game(self, df):
+        df = df.copy()
+        if "Game Date" in df.columns:
+            df["Date"] = pd.to_datetime(df["Game Date"], errors="coerce").astype("datetime64[ms]")
+        written = []
+        for game_id, game_df in df.groupby("Game ID", observed=True, sort=False):
+            season = season_of(game_id, game_df["Game Date"].iloc[0] if "Game Date" in game_df else None)
+            stale = set(self._game_files(game_id))
+            for team, team_df in game_df.groupby("Team", observed=True, sort=False):
+                path = self._game_path(season, team, game_id)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = path + ".tmp"
+                pq.write_table(pa.Table.from_pandas(team_df.reset_index(drop=True), preserve_index=False), tmp)
+                os.replace(tmp, path)
+                stale.discard(path)
+                written.append(path)
+            # A re-scrape under different team abbreviations leaves old files behind.
+            for path in stale:
+                os.remove(path)
+        return written
+
+    def delete_game(self, game_id):
+        for path in self._game_files(game_id):
+            os.remove(path)
+
+    def game_ids(self, season=None):
+        pattern = os.path.join(self.root, f"season={season or '*'}", "team=*", "game-*.parquet")
+        return sorted({os.path.basename(path)[5:-8] for path in glob.glob(pattern)})
+
+    def seasons(self):
+        return sorted(int(os.path.basename(path)[7:]) for path in glob.glob(os.path.join(self.root, "season=*")))
+
+    def game_versions(self, season=None):
+        """{game_id: signature} of the files holding each game; it changes whenever the game is rewritten."""
+        pattern = os.path.join(self.root, f"season={season or '*'}", "team=*", "game-*.parquet")
+        parts = {}
+        for path in glob.glob(pattern):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            parts.setdefault(os.path.basename(path)[5:-8], []).append(f"{stat.st_mtime_ns}:{stat.st_size}")
+        return {game_id: "|".join(sorted(signatures)) for game_id, signatures in sorted(parts.items())}
+
+    def dataset(self):
+        dataset = ds.dataset(self.root, format="parquet", partitioning=self.partitioning,
+                             exclude_invalid_files=True)
+        schema = _widened(dataset.schema)
+        if schema is None:
+            return dataset
+        return ds.dataset(self.root, format="parquet", partitioning=self.partitioning, schema=schema,
+                          exclude_invalid_files=True)
+
+    @staticmethod
+    def build_filter(season=None, team=None, game_ids=None, player=None, start=None, end=None):
+        conditions = []
+        if season is not None:
+            conditions.append(ds.field("season") == int(season))
+        if team is not None:
+            conditions.append(ds.field("team") == team)
+        if game_ids is not None:
+            conditions.append(ds.field("Game ID").cast(pa.string()).isin([str(g) for g in game_ids]))
+        if player is not None:
+            conditions.append(ds.field("PLAYER") == player)
+        if start is not None:
+            conditions.append(ds.field("Date") >= pd.Timestamp(start).to_pydatetime())
+        if end is not None:
+            conditions.append(ds.field("Date") <= pd.Timestamp(end).to_pydatetime())
+        expression = None
+        for condition in conditions:
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def read(self, columns=None, **filters):
+        # Partition filters prune whole directories; the rest are pushed down
+        # to the Parquet row-group statistics by the scanner.
+        if not self.game_ids():
+            return pd.DataFrame(columns=columns or [])
+        table = self.dataset().to_table(columns=columns, filter=self.build_filter(**filters))
+        return table.to_pandas()
+
+    def export_csv(self, path_or_file, columns=None, batch_size=8192, **filters):
+        if not self.game_ids():
+            raise LookupError(f"No games stored in {self.root}.")
+        scanner = self.dataset().scanner(columns=columns, filter=self.build_filter(**filters), batch_size=batch_size)
+        rows = 0
+        close = isinstance(path_or_file, str)
+        f = open(path_or_file, "w", newline="") if close else path_or_file
+        try:
+            header = True
+            for batch in scanner.to_batches():
+                if batch.num_rows:
+                    batch.to_pandas().to_csv(f, header=header, index=False)
+                    header = False
+                    rows += batch.num_rows
+        finally:
+            if close:
+                f.close()
+        return rows
+
+
+def _widened(schema):
+    # The schema is taken from one file, but a stat stored as int8 there may
+    # be int16 in another game (a value past 127), so read every int8 column
+    # as int16, pandas metadata included. None if nothing needs widening.
+    narrow = [field.name for field in schema if pa.types.is_int8(field.type)]
+    if not narrow:
+        return None
+    metadata = dict(schema.metadata or {})
+    if b"pandas" in metadata:
+        pandas_meta = json.loads(metadata[b"pandas"])
+        for column in pandas_meta.get("columns", []):
+            if column.get("name") in narrow:
+                column["numpy_type"] = {"Int8": "Int16", "int8": "int16"}.get(column["numpy_type"],
+                                                                             column["numpy_type"])
+        metadata[b"pandas"] = json.dumps(pandas_meta).encode()
+    fields = [field.with_type(pa.int16()) if field.name in narrow else field for field in schema]
+    return pa.schema(fields, metadata=metadata)
+
+
+def _filter_args(parser):
+    parser.add_argument("--season", type=int)
+    parser.add_argument("--team")
+    parser.add_argument("--game", dest="game_ids", action="append", help="game ID (repeatable)")
+    parser.add_argument("--player")
+    parser.add_argument("--start", help="first game date, inclusive")
+    parser.add_argument("--end", help="last game date, inclusive")
+    parser.add_argument("--columns", nargs="+")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query or export the Parquet season store.")
+    parser.add_argument("--store", default=None, help=f"store directory (default {DEFAULT_STORE_DIR})")
+    sub = parser.add_subparsers(dest="command", required=True)
+    export = sub.add_parser("export", help="stream matching rows to a CSV file")
+    export.add_argument("out")
+    _filter_args(export)
+    query = sub.add_parser("query", help="print matching rows")
+    _filter_args(query)
+    args = vars(parser.parse_args(argv))
+
+    store = SeasonStore(args.pop("store"))
+    command = args.pop("command")
+    if command == "export":
+        out = args.pop("out")
+        rows = store.export_csv(out, **args)
+        print(f"wrote {rows} rows to {out}", file=sys.stderr)
+    else:
+        print(store.read(**args).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+import argparse
+import os
+import sqlite3
+import sys
+import time
+from datetime import date
+
+import pandas as pd
+
+import wnba_boxscore as core
+import wnba_metrics as metrics
+from wnba_aggregates import aggregates_path, update_from_store
+from wnba_batch import print_progress, read_games_csv, scrape_games
+from wnba_cache import PageCache
+from wnba_manifest import add_selection_args, check_selection, select_games
+from wnba_store import SeasonStore, season_of
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    home_abbr TEXT NOT NULL,
+    away_abbr TEXT NOT NULL,
+    game_date TEXT,
+    game_time TEXT,
+    state TEXT NOT NULL DEFAULT 'scheduled',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS games_state ON games (state);
+"""
+
+
+class SyncIndex:
+    """Which games have been scraped, kept next to the store.
+
+    Each game is scheduled, live, final or failed; attempts counts
+    consecutive failures, and fetches of a past game whose page still says
+    scheduled (postponed, say). A new date from the schedule starts the
+    count again.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.executescript(SCHEMA)
+
+    def register(self, games):
+        # New games start as scheduled; known games keep their state but pick
+        # up corrected teams, date or time.
+        self._db.executemany(
+            "INSERT INTO games (game_id, home_abbr, away_abbr, game_date, game_time) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(game_id) DO UPDATE SET home_abbr = excluded.home_abbr, away_abbr = excluded.away_abbr, "
+            "attempts = CASE WHEN games.game_date IS excluded.game_date THEN games.attempts ELSE 0 END, "
+            "game_date = excluded.game_date, game_time = excluded.game_time",
+            [tuple(str(value) for value in game) for game in games],
+        )
+        self._db.commit()
+
+    def set_state(self, game_id, state, error=None, attempt=None):
+        # attempt: whether this counts towards giving up; failures always do.
+        attempt = state == "failed" if attempt is None else attempt
+        self._db.execute(
+            "UPDATE games SET state = ?, attempts = CASE WHEN ? THEN attempts + 1 ELSE 0 END, "
+            "last_error = ?, updated_at = ? WHERE game_id = ?",
+            (state, bool(attempt), error, time.time(), str(game_id)),
+        )
+        self._db.commit()
+
+    def games(self, state=None):
+        query = "SELECT game_id, home_abbr, away_abbr, game_date, game_time, state, attempts FROM games"
+        rows = self._db.execute(query + (" WHERE state = ?" if state else ""), (state,) if state else ()).fetchall()
+        keys = ["game_id", "home_abbr", "away_abbr", "game_date", "game_time", "state", "attempts"]
+        return [dict(zip(keys, row)) for row in rows]
+
+    def counts(self):
+        return dict(self._db.execute("SELECT state, COUNT(*) FROM games GROUP BY state").fetchall())
+
+    def close(self):
+        self._db.close()
+
+
+def _game_day(game_date):
+    day = pd.to_datetime(game_date, errors="coerce")
+    return None if pd.isna(day) else day.date()
+
+
+def plan_sync(index, stored_ids, today=None, max_attempts=5, game_ids=None):
+    # Split the indexed games (those in ``game_ids``, when given) into games
+    # to fetch now and the reasons others are skipped.
+    today = today or date.today()
+    todo, skipped = [], {"already_final": 0, "not_started": 0, "gave_up": 0}
+    for game in index.games():
+        if game_ids is not None and game["game_id"] not in game_ids:
+            continue
+        day = _game_day(game["game_date"])
+        if game["state"] == "final" and game["game_id"] in stored_ids:
+            skipped["already_final"] += 1
+        elif game["state"] == "scheduled" and day is not None and day > today:
+            skipped["not_started"] += 1
+        elif game["state"] in ("failed", "scheduled") and game["attempts"] >= max_attempts:
+            skipped["gave_up"] += 1
+        else:
+            todo.append(game)
+    return todo, skipped
+
+
+def _resolved_state(status, game_date, today):
+    if status in ("final", "live", "scheduled"):
+        return status
+    # The page didn't say; a game from an earlier day is over.
+    day = _game_day(game_date)
+    return "final" if day is not None and day < today else "live"
+
+
+def sync(games, store, index=None, workers=1, backend="auto", cache_dir=None, max_attempts=5, today=None,
+         slugs=None, progress=None):
+    today = today or date.today()
+    index = index or SyncIndex(os.path.join(store.root, "sync_index.sqlite"))
+    index.register(games)
+    # Only this run's games: the index also holds every game earlier runs saw.
+    game_ids = {str(game[0]) for game in games}
+    todo, skipped = plan_sync(index, set(store.game_ids()), today, max_attempts, game_ids)
+    start = time.perf_counter()
+    fields = ["game_id", "home_abbr", "away_abbr", "game_date", "game_time"]
+    tuples = [tuple(game[field] for field in fields) for game in todo]
+
+    results = {}
+    if workers > 1 and len(tuples) > 1:
+        batch = scrape_games(tuples, workers=workers, backend=backend, cache_dir=cache_dir,
+                             slugs=slugs, progress=progress)
+        for game_id, frames in batch.frames.items():
+            results[game_id] = (frames, batch.records.get(game_id, {}).get("status"), None)
+        for game_id, error in batch.failures.items():
+            results[game_id] = (None, None, error)
+    else:
+        cache = PageCache(cache_dir) if cache_dir else None
+        for game in tuples:
+            try:
+                frames = core.get_cleaned_boxscores(*game, backend=backend, cache=cache,
+                                                    slug=(slugs or {}).get(game[0]))
+                results[game[0]] = (frames, core.fetch_log.get(game[0], {}).get("status"), None)
+                metrics.emit(dict(core.fetch_log.get(game[0], {}), outcome="ok"))
+            except Exception as e:
+                results[game[0]] = (None, None, f"{type(e).__name__}: {e}")
+                metrics.emit(dict(core.fetch_log.get(game[0], {"game_id": game[0]}), outcome="error",
+                                  error=results[game[0]][2]))
+
+    report = dict(total=len(game_ids), fetched=0, final=0, live=0, scheduled=0, failed=0, **skipped)
+    written = {}
+    for game in todo:
+        frames, status, error = results[game["game_id"]]
+        if error is not None:
+            index.set_state(game["game_id"], "failed", error)
+            report["failed"] += 1
+            continue
+        store.write_game(core.concat_boxscores(list(frames)))
+        written.setdefault(season_of(game["game_id"], game["game_date"]), []).append(game["game_id"])
+        state = _resolved_state(status, game["game_date"], today)
+        day = _game_day(game["game_date"])
+        # A past game still showing as scheduled is retried, but not forever.
+        index.set_state(game["game_id"], state, attempt=state == "scheduled" and day is not None and day < today)
+        report["fetched"] += 1
+        report[state] += 1
+    # Fold the new and re-fetched games into the season aggregates.
+    for season, game_ids in written.items():
+        aggregates, _ = update_from_store(store, season, refresh=game_ids)
+        aggregates.save(aggregates_path(store, season))
+    report["seconds"] = round(time.perf_counter() - start, 2)
+    return report
+
+
+def format_report(report):
+    skipped = report["already_final"] + report["not_started"] + report["gave_up"]
+    return (
+        f"{report['total']} games: fetched {report['fetched']} "
+        f"({report['final']} now final, {report['live']} live), {report['failed']} failed; "
+        f"skipped {skipped} ({report['already_final']} already final, {report['not_started']} not started, "
+        f"{report['gave_up']} gave up) in {report['seconds']}s"
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch only new, live or previously failed games into the store.")
+    parser.add_argument("games_csv", nargs="?", help="CSV of game_id,home_abbr,away_abbr,game_date,game_time "
+                        "(default: games picked from the manifest)")
+    parser.add_argument("--store", default=None)
+    parser.add_argument("-w", "--workers", type=int, default=1)
+    parser.add_argument("--backend", choices=["auto", "http", "selenium"], default="auto")
+    parser.add_argument("--cache-dir", default=None)
+    parser.add_argument("--max-attempts", type=int, default=5, help="stop retrying a failed game after this many tries")
+    parser.add_argument("--metrics-log", default=None, help="append one JSON line of stage timings per game")
+    parser.add_argument("--metrics-prom", default=None, help="keep a Prometheus text metrics file here")
+    add_selection_args(parser)
+    args = parser.parse_args(argv)
+    check_selection(parser, args)
+    metrics.configure(args.metrics_log, args.metrics_prom)
+
+    games = read_games_csv(args.games_csv) if args.games_csv else None
+    slugs, unknown = {}, []
+    if games is None or args.manifest:
+        games, slugs, _, unknown = select_games(args, games, parser=parser)
+    store = SeasonStore(args.store)
+    report = sync(games, store, workers=args.workers, backend=args.backend, cache_dir=args.cache_dir,
+                  max_attempts=args.max_attempts, slugs=slugs, progress=print_progress)
+    print(format_report(report), file=sys.stderr)
+    return 1 if report["failed"] or unknown else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())